@@ -1,12 +1,93 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
-from datetime import datetime, timedelta
 import math
 import os
 import base64
+import time
+
+# pandas and Plotly are loaded by the pages that use them, through lazy_import
+import_started = time.perf_counter()
+from fincalc import (
+    COMPOUNDING_FREQUENCIES,
+    HALF_EVEN,
+    HALF_UP,
+    PAY_PERIODS_PER_YEAR,
+    BiweeklyInputs,
+    CompoundInputs,
+    Debt,
+    DebtInputs,
+    FeeInputs,
+    FeeProduct,
+    RateSchedule,
+    VariableDebtInputs,
+    accelerated_biweekly,
+    amortize_cents,
+    compare_fees,
+    compare_products,
+    compare_strategies,
+    compound_cents,
+    convert_bulk,
+    convert_to_biweekly,
+    extra_payment_sweep,
+    fee_breakeven,
+    goal_seek,
+    historical_compound,
+    historical_fees,
+    payoff_date,
+    project_compound,
+    project_debt,
+    project_variable_debt,
+    rate_range,
+    sensitivity_grid,
+    simulate_compound,
+    split_cents,
+    tiered_trajectories,
+)
+from fincalc.cache import cached
+from fincalc.compound import END, START
+from fincalc.downsample import downsample
+from fincalc.fees import DEFAULT_PRODUCT_MENU
+from fincalc.history import BOOTSTRAP, REPLAY
+from fincalc.tiers import ANNUAL, DEFAULT_TIERS, MONTHLY, FeeSchedule
+from fincalc.montecarlo import LOGNORMAL, NORMAL
+from fincalc.multidebt import AVALANCHE, CUSTOM, SNOWBALL
+from fincalc.paydates import (
+    BIWEEKLY,
+    FOLLOWING,
+    MONTHLY as MONTHLY_PAYDAYS,
+    NO_ROLL,
+    NOMINAL_PAYDAYS,
+    PRECEDING,
+    SEMIMONTHLY,
+    WEEKLY,
+    calendar_years,
+)
+from fincalc.solve import CONTRIBUTION, RATE, YEARS
+from fincalc.imports import REPORT_IMPORT_TIMES, import_times, lazy_import, record_import
+
+record_import("fincalc", time.perf_counter() - import_started)
+
+# Serve repeat calculations from the process-wide cache shared by all sessions
+project_compound = cached(project_compound)
+compare_fees = cached(compare_fees)
+compare_products = cached(compare_products)
+fee_breakeven = cached(fee_breakeven)
+tiered_trajectories = cached(tiered_trajectories)
+historical_compound = cached(historical_compound)
+historical_fees = cached(historical_fees)
+project_debt = cached(project_debt)
+convert_to_biweekly = cached(convert_to_biweekly)
+sensitivity_grid = cached(sensitivity_grid)
+simulate_compound = cached(simulate_compound)
+goal_seek = cached(goal_seek)
+compare_strategies = cached(compare_strategies)
+extra_payment_sweep = cached(extra_payment_sweep)
+project_variable_debt = cached(project_variable_debt)
+accelerated_biweekly = cached(accelerated_biweekly)
+amortize_cents = cached(amortize_cents)
+compound_cents = cached(compound_cents)
+
+# Larger converted rosters are left to the command line, which streams them to disk
+BULK_DOWNLOAD_MAX_CELLS = 5_000_000
 
 # Page Configuration
 st.set_page_config(
@@ -873,6 +954,39 @@ def format_percentage(rate):
     """Format rate as percentage"""
     return f"{rate:.2f}%"
 
+def add_percentile_bands(fig, months, result, label, rgb):
+    """Overlay P5–P95 and P25–P75 ranges plus the median of a scenario set on a chart"""
+    go = lazy_import("plotly.graph_objects")
+    band_style = dict(width=0)
+    
+    for low, high, opacity in [(5, 95, 0.12), (25, 75, 0.25)]:
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=result.band(high),
+            mode='lines',
+            line=band_style,
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+        
+        fig.add_trace(go.Scatter(
+            x=months,
+            y=result.band(low),
+            fill='tonexty',
+            mode='lines',
+            line=band_style,
+            name=f'P{low}–P{high} Range ({label})',
+            fillcolor=f'rgba({rgb}, {opacity})'
+        ))
+    
+    fig.add_trace(go.Scatter(
+        x=months,
+        y=result.band(50),
+        mode='lines',
+        name=f'Median ({label})',
+        line=dict(color=f'rgb({rgb})', width=3, dash='dash')
+    ))
+
 def get_logo_base64():
     """Convert logo to base64 for embedding in HTML"""
     try:
@@ -945,6 +1059,19 @@ def create_sidebar():
         
         return page
 
+def import_times_panel():
+    """List the first-import cost of each module in the sidebar"""
+    with st.sidebar:
+        st.markdown("""
+        <div class="sidebar-section">
+            <h3>Import Times</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        for name, seconds in import_times.items():
+            st.markdown(f"`{name}`: {seconds * 1000:,.0f} ms")
+        st.caption(f"Total: {sum(import_times.values()) * 1000:,.0f} ms. Modules load on the first page that needs them.")
+
 def home_page():
     """Home page with calculator cards"""
     # Header
@@ -1018,6 +1145,9 @@ def home_page():
 
 def compound_interest_page():
     """Compound Interest Calculator"""
+    pd = lazy_import("pandas")
+    go = lazy_import("plotly.graph_objects")
+    
     st.markdown("""
     <div class="main-content">
         <div class="page-header">
@@ -1044,9 +1174,100 @@ def compound_interest_page():
             years = st.number_input("Number of Years", min_value=1, max_value=50, value=20, step=1)
         
         with col3:
-            st.markdown("**Compounding:**")
-            st.info("Interest compounds annually")
-            n = 1  # Annual compounding
+            compounding_label = st.selectbox(
+                "Compounding Frequency",
+                list(COMPOUNDING_FREQUENCIES),
+                index=list(COMPOUNDING_FREQUENCIES).index("Annually")
+            )
+            timing_label = st.radio(
+                "Contributions Made At",
+                ["Start of Month", "End of Month"],
+                horizontal=True
+            )
+        
+        with st.expander("Goal Seek"):
+            col_a, col_b = st.columns(2)
+            with col_a:
+                target_balance = st.number_input("Target Final Balance ($)", min_value=0.0, value=1000000.0, step=10000.0)
+            with col_b:
+                solve_for_label = st.radio(
+                    "Solve For",
+                    ["Monthly Contribution", "Annual Interest Rate", "Number of Years"],
+                    horizontal=True
+                )
+            goal_clicked = st.button("Solve for Target", key="compound_goal_button")
+            
+            if goal_clicked:
+                solve_for = {
+                    "Monthly Contribution": CONTRIBUTION,
+                    "Annual Interest Rate": RATE,
+                    "Number of Years": YEARS
+                }[solve_for_label]
+                goal_inputs = CompoundInputs(
+                    initial_amount,
+                    annual_rate,
+                    monthly_contribution,
+                    years,
+                    compounding=COMPOUNDING_FREQUENCIES[compounding_label],
+                    contribution_timing=START if timing_label == "Start of Month" else END
+                )
+                try:
+                    goal = goal_seek(goal_inputs, target_balance, solve_for)
+                except ValueError as error:
+                    st.warning(f"Target can't be reached: {error}")
+                else:
+                    if solve_for == CONTRIBUTION:
+                        answer = f"{format_currency(goal.value)} per month"
+                    elif solve_for == RATE:
+                        answer = f"{format_percentage(goal.value)} per year"
+                    else:
+                        whole_years, extra_months = divmod(round(goal.value * 12), 12)
+                        answer = f"{whole_years} years, {extra_months} months"
+                    st.success(f"**{solve_for_label} needed:** {answer} (projected balance {format_currency(goal.final_balance)})")
+        
+        with st.expander("Monte Carlo Simulation"):
+            show_simulation = st.checkbox("Simulate random yearly returns", value=False)
+            col_a, col_b = st.columns(2)
+            with col_a:
+                volatility = st.number_input("Return Volatility (%)", min_value=0.0, max_value=50.0, value=15.0, step=0.5)
+                distribution_label = st.radio("Return Distribution", ["Normal", "Lognormal"], horizontal=True)
+            with col_b:
+                simulation_paths = st.selectbox("Simulated Paths", [10000, 25000, 50000, 100000], index=0)
+                simulation_seed = st.number_input("Random Seed", min_value=0, value=42, step=1)
+        
+        with st.expander("Historical Returns"):
+            show_history = st.checkbox("Replay S&P 500 history (1928 onward) instead of a fixed rate", value=False)
+            history_method = st.radio(
+                "Scenarios",
+                ["Every Historical Start Year", "Block Bootstrap"],
+                horizontal=True
+            )
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                history_block = st.number_input("Block Length (Years)", min_value=1, max_value=20, value=5, step=1)
+            with col_b:
+                history_samples = st.selectbox("Bootstrap Paths", [10000, 25000, 50000], index=0)
+            with col_c:
+                history_seed = st.number_input("Bootstrap Seed", min_value=0, value=42, step=1)
+        
+        with st.expander("Sensitivity Analysis"):
+            show_sensitivity = st.checkbox("Show final balance across rates and horizons", value=False)
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                max_sensitivity_rate = st.number_input("Highest Rate (%)", min_value=0.5, max_value=30.0, value=15.0, step=0.5)
+            with col_b:
+                sensitivity_rate_step = st.number_input("Rate Step (%)", min_value=0.05, max_value=5.0, value=0.1, step=0.05)
+            with col_c:
+                max_sensitivity_years = st.number_input("Longest Horizon (Years)", min_value=1, max_value=50, value=50, step=1)
+        
+        with st.expander("Exact Cents"):
+            show_compound_cents = st.checkbox("Post interest monthly in whole cents, like a bank ledger", value=False)
+            compound_rounding_label = st.radio(
+                "Rounding",
+                ["Banker's (Half-Even)", "Half-Up"],
+                horizontal=True,
+                key="compound_rounding_radio"
+            )
         
         # Form-style button positioning
         st.markdown("<br>", unsafe_allow_html=True)
@@ -1056,27 +1277,19 @@ def compound_interest_page():
     
     # Results section
     if calculate_clicked:
-        # Calculate compound interest with regular contributions (annual compounding)
-        r = annual_rate / 100
-        
-        # Future value of initial investment
-        future_value_initial = initial_amount * (1 + r)**years
-        
-        # Future value of monthly contributions with annual compounding
-        if monthly_contribution > 0:
-            # Calculate each monthly contribution's future value individually
-            future_value_contributions = 0
-            for month in range(1, int(12*years) + 1):
-                # Years remaining for this contribution to compound
-                years_remaining = years - (month - 1) / 12
-                # Add the future value of this monthly contribution
-                future_value_contributions += monthly_contribution * (1 + r)**years_remaining
-        else:
-            future_value_contributions = 0
-        
-        total_future_value = future_value_initial + future_value_contributions
-        total_contributions = initial_amount + (monthly_contribution * 12 * years)
-        total_interest = total_future_value - total_contributions
+        # Project the full monthly series once; result cards and chart share it
+        inputs = CompoundInputs(
+            initial_amount,
+            annual_rate,
+            monthly_contribution,
+            years,
+            compounding=COMPOUNDING_FREQUENCIES[compounding_label],
+            contribution_timing=START if timing_label == "Start of Month" else END
+        )
+        result = project_compound(inputs)
+        total_future_value = result.final_balance
+        total_contributions = result.total_contributions
+        total_interest = result.total_interest
         
         # Display results
         st.markdown(f"""
@@ -1094,46 +1307,46 @@ def compound_interest_page():
                 <div class="result-label">Interest Earned</div>
             </div>
             <div class="result-card">
-                <div class="result-value neutral">{format_percentage((total_interest/total_contributions)*100 if total_contributions > 0 else 0)}</div>
+                <div class="result-value neutral">{format_percentage(result.roi)}</div>
                 <div class="result-label">Return on Investment</div>
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        # Create growth chart
-        months = years * 12
-        balance_data = []
-        contribution_data = []
-        
-        for month in range(months + 1):
-            # Calculate balance at this month
-            years_elapsed = month / 12
-            
-            # Future value of initial investment at this point
-            fv_initial = initial_amount * (1 + r)**years_elapsed
-            
-            # Future value of contributions made so far with annual compounding
-            if month > 0 and monthly_contribution > 0:
-                fv_contributions = 0
-                for contrib_month in range(1, month + 1):
-                    # Years this contribution has been compounding
-                    years_compounding = years_elapsed - (contrib_month - 1) / 12
-                    fv_contributions += monthly_contribution * (1 + r)**years_compounding
+        # Same projection posted month by month in int64 cents
+        if show_compound_cents:
+            try:
+                ledger = compound_cents(
+                    initial_amount,
+                    annual_rate,
+                    monthly_contribution,
+                    years,
+                    inputs.compounding,
+                    inputs.contribution_timing,
+                    HALF_EVEN if compound_rounding_label.startswith("Banker") else HALF_UP
+                )
+            except ValueError as error:
+                st.warning(f"Exact-cents projection isn't available: {error}.")
             else:
-                fv_contributions = 0
-            
-            total_balance = fv_initial + fv_contributions
-            total_contributed = initial_amount + (monthly_contribution * month)
-            
-            balance_data.append(total_balance)
-            contribution_data.append(total_contributed)
+                ledger_balance = ledger.final_balance_cents[0] / 100
+                st.markdown(f"""
+                <div class="content-section">
+                    <div class="section-title">Exact-Cents Ledger</div>
+                    <p><strong>Final Balance:</strong> {format_currency(ledger_balance)}</p>
+                    <p><strong>Interest Earned:</strong> {format_currency(ledger.total_interest_cents[0] / 100)}</p>
+                    <p><strong>Difference from Unrounded Projection:</strong> {format_currency(ledger_balance - total_future_value)}</p>
+                </div>
+                """, unsafe_allow_html=True)
         
-        # Create DataFrame for plotting
+        # Create DataFrame for plotting, capped at the chart point budget
+        chart_months, chart_balance, chart_contributions = downsample(
+            result.months, result.balance, result.contributions
+        )
         chart_data = pd.DataFrame({
-            'Month': range(months + 1),
-            'Balance': balance_data,
-            'Contributions': contribution_data,
-            'Interest': [b - c for b, c in zip(balance_data, contribution_data)]
+            'Month': chart_months,
+            'Balance': chart_balance,
+            'Contributions': chart_contributions,
+            'Interest': chart_balance - chart_contributions
         })
         
         # Create stacked area chart
@@ -1157,6 +1370,27 @@ def compound_interest_page():
             fillcolor='rgba(56, 161, 105, 0.6)'
         ))
         
+        # Overlay percentile bands of the simulated and historical balances
+        if show_simulation:
+            simulation = simulate_compound(
+                inputs,
+                volatility,
+                paths=simulation_paths,
+                distribution=NORMAL if distribution_label == "Normal" else LOGNORMAL,
+                seed=simulation_seed
+            )
+            add_percentile_bands(fig, simulation.months, simulation, "Simulated", "255, 102, 0")
+        
+        if show_history:
+            history = historical_compound(
+                inputs,
+                REPLAY if history_method == "Every Historical Start Year" else BOOTSTRAP,
+                samples=history_samples,
+                block_length=history_block,
+                seed=history_seed
+            )
+            add_percentile_bands(fig, history.months, history, "Historical", "128, 90, 213")
+        
         fig.update_layout(
             title="Investment Growth Over Time",
             xaxis_title="Months",
@@ -1172,9 +1406,80 @@ def compound_interest_page():
         fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
         
         st.plotly_chart(fig, use_container_width=True)
+        
+        if show_simulation:
+            st.markdown(f"""
+            <div class="content-section">
+                <div class="section-title">Simulated Outcomes ({simulation.paths:,} paths)</div>
+                <p><strong>Median Final Balance:</strong> {format_currency(simulation.band(50)[-1])}</p>
+                <p><strong>Pessimistic (5th Percentile):</strong> {format_currency(simulation.band(5)[-1])}</p>
+                <p><strong>Optimistic (95th Percentile):</strong> {format_currency(simulation.band(95)[-1])}</p>
+                <p><strong>Chance of Ending Below Contributions:</strong> {format_percentage(simulation.probability_of_loss * 100)}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        if show_history:
+            if history.start_years is not None:
+                scenario_text = f"{len(history.start_years)} historical start years"
+                extremes = f"""
+                <p><strong>Worst Start Year:</strong> {history.worst_start()} ({format_currency(history.final_balances.min())})</p>
+                <p><strong>Best Start Year:</strong> {history.best_start()} ({format_currency(history.final_balances.max())})</p>
+                """
+            else:
+                scenario_text = f"{len(history.final_balances):,} bootstrapped paths"
+                extremes = ""
+            
+            st.markdown(f"""
+            <div class="content-section">
+                <div class="section-title">Historical Outcomes ({scenario_text})</div>
+                <p><strong>Median Final Balance:</strong> {format_currency(history.band(50)[-1])}</p>
+                <p><strong>5th to 95th Percentile:</strong> {format_currency(history.band(5)[-1])} – {format_currency(history.band(95)[-1])}</p>
+                {extremes}
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Final balance over the whole rate × horizon grid in one evaluation
+        if show_sensitivity:
+            grid = sensitivity_grid(
+                inputs,
+                rate_range(0.0, max_sensitivity_rate, sensitivity_rate_step),
+                list(range(1, max_sensitivity_years + 1))
+            )
+            
+            heatmap = go.Figure(go.Heatmap(
+                x=grid.years,
+                y=grid.rates,
+                z=grid.final_balance,
+                colorscale='Greens',
+                colorbar=dict(title="Final Balance ($)"),
+                hovertemplate="Rate: %{y:.2f}%<br>Years: %{x}<br>Final Balance: $%{z:,.2f}<extra></extra>"
+            ))
+            
+            heatmap.add_trace(go.Scatter(
+                x=[years],
+                y=[annual_rate],
+                mode='markers',
+                name='Your Inputs',
+                marker=dict(color='#FF6600', size=12, symbol='x')
+            ))
+            
+            heatmap.update_layout(
+                title="Final Balance by Rate and Horizon",
+                xaxis_title="Years",
+                yaxis_title="Annual Interest Rate (%)",
+                font=dict(family="Inter, sans-serif"),
+                paper_bgcolor='white',
+                plot_bgcolor='white',
+                showlegend=False
+            )
+            
+            st.plotly_chart(heatmap, use_container_width=True)
 
 def investment_fee_page():
     """Investment Fee Comparison Calculator"""
+    pd = lazy_import("pandas")
+    go = lazy_import("plotly.graph_objects")
+    
     st.markdown("""
     <div class="main-content">
         <div class="page-header">
@@ -1202,6 +1507,56 @@ def investment_fee_page():
             years = st.number_input("Investment Duration (Years)", min_value=1, max_value=50, value=25, step=1)
             advisor_fee = st.number_input("Advisor-Managed Fee (%)", min_value=0.0, max_value=5.0, value=1.25, step=0.01)
         
+        with st.expander("Is the Advisor Worth It?"):
+            show_breakeven = st.checkbox("Show break-even analysis", value=False)
+            gap_threshold = st.number_input("Gap Threshold ($)", min_value=0.0, value=10000.0, step=1000.0,
+                                            help="Find the fee at which you fall this far behind self-managed")
+        
+        with st.expander("Historical Returns"):
+            show_fee_history = st.checkbox("Compare both portfolios over S&P 500 history (1928 onward)", value=False)
+            fee_history_method = st.radio(
+                "Scenarios",
+                ["Every Historical Start Year", "Block Bootstrap"],
+                horizontal=True,
+                key="fee_history_method"
+            )
+        
+        with st.expander("Tiered Advisor Fee"):
+            show_tiers = st.checkbox("Model the advisor fee as a tiered schedule", value=False)
+            st.caption("Each rate applies to the assets within its tier. Leave the last Up To blank for no limit.")
+            tier_table = st.data_editor(
+                pd.DataFrame({
+                    "Up To ($)": [None if math.isinf(up_to) else up_to for up_to, _ in DEFAULT_TIERS],
+                    "Rate (%)": [rate for _, rate in DEFAULT_TIERS]
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "Up To ($)": st.column_config.NumberColumn(min_value=0.0, step=100000.0, format="$%.0f"),
+                    "Rate (%)": st.column_config.NumberColumn(min_value=0.0, max_value=5.0, step=0.05)
+                },
+                key="fee_tier_editor"
+            )
+            deduction_label = st.radio("Fee Deducted", ["Annually", "Monthly"], horizontal=True)
+        
+        with st.expander("Compare a Product Menu"):
+            show_products = st.checkbox("Compare several products at once", value=False)
+            st.caption("Leave Expected Return blank to use the common expected return above.")
+            product_menu = st.data_editor(
+                pd.DataFrame({
+                    "Product": [product.name for product in DEFAULT_PRODUCT_MENU],
+                    "Fee (%)": [product.fee for product in DEFAULT_PRODUCT_MENU],
+                    "Expected Return (%)": [None] * len(DEFAULT_PRODUCT_MENU)
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "Fee (%)": st.column_config.NumberColumn(min_value=0.0, max_value=5.0, step=0.01),
+                    "Expected Return (%)": st.column_config.NumberColumn(min_value=0.0, max_value=20.0, step=0.1)
+                },
+                key="product_menu_editor"
+            )
+        
         # Form-style button positioning
         st.markdown("<br>", unsafe_allow_html=True)
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
@@ -1210,67 +1565,27 @@ def investment_fee_page():
     
     # Results section
     if calculate_clicked:
-        # Convert percentages to decimals
-        annual_return = expected_return / 100
-        fee_self = self_managed_fee / 100
-        fee_advisor = advisor_fee / 100
-        
-        # Calculate balance for self-managed scenario using year-by-year simulation
-        def calculate_balance(starting_amount, monthly_contribution, annual_return, annual_fee, years):
-            balance = starting_amount
-            
-            for year in range(1, years + 1):
-                # Add monthly contributions for the year (all at once at start of year)
-                balance += monthly_contribution * 12
-                
-                # Apply annual return
-                balance *= (1 + annual_return)
-                
-                # Deduct annual fee (as % of assets under management)
-                balance *= (1 - annual_fee)
-            
-            return balance
-        
-        # Calculate both scenarios
-        total_self = calculate_balance(starting_amount, monthly_contribution, annual_return, fee_self, years)
-        total_advisor = calculate_balance(starting_amount, monthly_contribution, annual_return, fee_advisor, years)
-        
-        # Calculate total invested
-        total_invested = starting_amount + (monthly_contribution * 12 * years)
-        
-        # Calculate fee difference
-        fee_difference = total_self - total_advisor
-        
-        # Calculate percentage difference
-        percentage_difference = (fee_difference / total_self * 100) if total_self > 0 else 0
-        
-        # For display: calculate what the balances would be without any fees for reference
-        total_no_fees = calculate_balance(starting_amount, monthly_contribution, annual_return, 0, years)
-        
-        # Calculate actual fees paid
-        fees_self_paid = total_no_fees - total_self
-        fees_advisor_paid = total_no_fees - total_advisor
-        
-        # Difference
-        difference = total_self - total_advisor
+        result = compare_fees(FeeInputs(
+            starting_amount, monthly_contribution, expected_return, self_managed_fee, advisor_fee, years
+        ))
         
         # Display results
         st.markdown(f"""
         <div class="results-grid">
             <div class="result-card">
-                <div class="result-value positive">{format_currency(total_self)}</div>
+                <div class="result-value positive">{format_currency(result.total_self)}</div>
                 <div class="result-label">Self-Managed Value</div>
             </div>
             <div class="result-card">
-                <div class="result-value neutral">{format_currency(total_advisor)}</div>
+                <div class="result-value neutral">{format_currency(result.total_advisor)}</div>
                 <div class="result-label">Advisor-Managed Value</div>
             </div>
             <div class="result-card">
-                <div class="result-value positive">{format_currency(fee_difference)}</div>
+                <div class="result-value positive">{format_currency(result.fee_difference)}</div>
                 <div class="result-label">Fee Difference</div>
             </div>
             <div class="result-card">
-                <div class="result-value negative">{format_currency(fees_advisor_paid - fees_self_paid)}</div>
+                <div class="result-value negative">{format_currency(result.fees_advisor_paid - result.fees_self_paid)}</div>
                 <div class="result-label">Extra Fees Paid</div>
             </div>
         </div>
@@ -1282,63 +1597,129 @@ def investment_fee_page():
             <div class="section-title">Fee Impact Analysis</div>
             <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
                 <div>
-                    <p><strong>Total Invested:</strong> {format_currency(total_invested)}</p>
-                    <p><strong>Without Fees:</strong> {format_currency(total_no_fees)}</p>
-                    <p><strong>Percentage Difference:</strong> {format_percentage(percentage_difference)}</p>
+                    <p><strong>Total Invested:</strong> {format_currency(result.total_invested)}</p>
+                    <p><strong>Without Fees:</strong> {format_currency(result.total_no_fees)}</p>
+                    <p><strong>Percentage Difference:</strong> {format_percentage(result.percentage_difference)}</p>
                 </div>
                 <div>
-                    <p><strong>Self-Managed Fees:</strong> {format_currency(fees_self_paid)}</p>
-                    <p><strong>Advisor Fees:</strong> {format_currency(fees_advisor_paid)}</p>
-                    <p><strong>Fee Rate Difference:</strong> {format_percentage((fee_advisor - fee_self) * 100)}</p>
+                    <p><strong>Self-Managed Fees:</strong> {format_currency(result.fees_self_paid)}</p>
+                    <p><strong>Advisor Fees:</strong> {format_currency(result.fees_advisor_paid)}</p>
+                    <p><strong>Fee Rate Difference:</strong> {format_percentage(advisor_fee - self_managed_fee)}</p>
                 </div>
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        # Create comparison chart using same simulation logic
-        years_array = np.arange(0, years + 1)
-        self_values = []
-        advisor_values = []
-        no_fees_values = []
-        
-        for year in years_array:
-            if year == 0:
-                # Starting values
-                self_values.append(starting_amount)
-                advisor_values.append(starting_amount)
-                no_fees_values.append(starting_amount)
+        if show_breakeven:
+            breakeven = fee_breakeven(
+                FeeInputs(starting_amount, monthly_contribution, expected_return, self_managed_fee, advisor_fee, years),
+                gap_threshold
+            )
+            if breakeven.gap_fee is None:
+                gap_text = f"No fee opens a {format_currency(gap_threshold)} gap over this horizon"
             else:
-                # Use simulation for each year
-                self_balance = calculate_balance(starting_amount, monthly_contribution, annual_return, fee_self, year)
-                advisor_balance = calculate_balance(starting_amount, monthly_contribution, annual_return, fee_advisor, year)
-                no_fees_balance = calculate_balance(starting_amount, monthly_contribution, annual_return, 0, year)
+                gap_text = f"{format_percentage(breakeven.gap_fee)} per year"
+            
+            st.markdown(f"""
+            <div class="content-section">
+                <div class="section-title">Break-Even Analysis</div>
+                <p><strong>Extra Return Needed From Advisor:</strong> {format_percentage(breakeven.extra_return)} per year</p>
+                <p><strong>Advisor Return to Break Even:</strong> {format_percentage(breakeven.required_return)} per year</p>
+                <p><strong>Fee That Costs You {format_currency(gap_threshold)}:</strong> {gap_text}</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Same historical return paths under both fees
+        if show_fee_history:
+            history_self, history_advisor = historical_fees(
+                FeeInputs(starting_amount, monthly_contribution, expected_return, self_managed_fee, advisor_fee, years),
+                REPLAY if fee_history_method == "Every Historical Start Year" else BOOTSTRAP,
+                seed=42
+            )
+            fee_cost = history_self.final_balances - history_advisor.final_balances
+            
+            st.markdown(f"""
+            <div class="content-section">
+                <div class="section-title">Historical Outcomes ({len(fee_cost):,} scenarios)</div>
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem;">
+                    <div>
+                        <p><strong>Self-Managed Median:</strong> {format_currency(history_self.band(50)[-1])}</p>
+                        <p><strong>Self-Managed Range:</strong> {format_currency(history_self.final_balances.min())} – {format_currency(history_self.final_balances.max())}</p>
+                    </div>
+                    <div>
+                        <p><strong>Advisor-Managed Median:</strong> {format_currency(history_advisor.band(50)[-1])}</p>
+                        <p><strong>Advisor-Managed Range:</strong> {format_currency(history_advisor.final_balances.min())} – {format_currency(history_advisor.final_balances.max())}</p>
+                    </div>
+                    <div>
+                        <p><strong>Median Fee Cost:</strong> {format_currency(float(pd.Series(fee_cost).median()))}</p>
+                        <p><strong>Fee Cost Range:</strong> {format_currency(fee_cost.min())} – {format_currency(fee_cost.max())}</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            if history_self.start_years is not None:
+                history_fig = go.Figure()
+                
+                history_fig.add_trace(go.Scatter(
+                    x=history_self.start_years,
+                    y=history_self.final_balances,
+                    mode='lines+markers',
+                    name=f'Self-Managed ({self_managed_fee}% fee)',
+                    line=dict(color='#38a169', width=2)
+                ))
+                
+                history_fig.add_trace(go.Scatter(
+                    x=history_advisor.start_years,
+                    y=history_advisor.final_balances,
+                    mode='lines+markers',
+                    name=f'Advisor-Managed ({advisor_fee}% fee)',
+                    line=dict(color='#e53e3e', width=2)
+                ))
+                
+                history_fig.update_layout(
+                    title=f"Ending Value After {years} Years by Start Year",
+                    xaxis_title="Start Year",
+                    yaxis_title="Ending Value ($)",
+                    font=dict(family="Inter, sans-serif"),
+                    paper_bgcolor='white',
+                    plot_bgcolor='white',
+                    showlegend=True,
+                    hovermode='x unified'
+                )
                 
-                self_values.append(self_balance)
-                advisor_values.append(advisor_balance)
-                no_fees_values.append(no_fees_balance)
+                history_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                history_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                
+                st.plotly_chart(history_fig, use_container_width=True)
+        
+        # Cap the points sent to the browser
+        chart_years, chart_no_fees, chart_self, chart_advisor = downsample(
+            result.years, result.no_fee_values, result.self_values, result.advisor_values
+        )
         
         # Create comparison chart
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
-            x=years_array,
-            y=no_fees_values,
+            x=chart_years,
+            y=chart_no_fees,
             mode='lines',
             name='No Fees (Reference)',
             line=dict(color='#3182ce', width=2, dash='dot')
         ))
         
         fig.add_trace(go.Scatter(
-            x=years_array,
-            y=self_values,
+            x=chart_years,
+            y=chart_self,
             mode='lines',
             name=f'Self-Managed ({self_managed_fee}% fee)',
             line=dict(color='#38a169', width=3)
         ))
         
         fig.add_trace(go.Scatter(
-            x=years_array,
-            y=advisor_values,
+            x=chart_years,
+            y=chart_advisor,
             mode='lines',
             name=f'Advisor-Managed ({advisor_fee}% fee)',
             line=dict(color='#e53e3e', width=3)
@@ -1359,9 +1740,269 @@ def investment_fee_page():
         fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
         
         st.plotly_chart(fig, use_container_width=True)
+        
+        # Advisor fee charged on a tiered schedule instead of a flat rate
+        if show_tiers:
+            tiers = tier_table.dropna(subset=["Rate (%)"])
+            try:
+                schedule = FeeSchedule.from_tiers([
+                    (float("inf") if pd.isna(up_to) else float(up_to), float(rate))
+                    for up_to, rate in zip(tiers["Up To ($)"], tiers["Rate (%)"])
+                ])
+            except ValueError as error:
+                st.warning(f"Check the fee tiers: {error}.")
+            else:
+                tiered = tiered_trajectories(
+                    starting_amount,
+                    monthly_contribution,
+                    expected_return,
+                    schedule,
+                    years,
+                    ANNUAL if deduction_label == "Annually" else MONTHLY
+                )
+                tiered_values = tiered.values[0]
+                
+                st.markdown("### Tiered Advisor Schedule")
+                st.markdown(f"""
+                <div class="results-grid">
+                    <div class="result-card">
+                        <div class="result-value neutral">{format_currency(tiered_values[-1])}</div>
+                        <div class="result-label">Tiered Advisor Value</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value negative">{format_currency(tiered.total_fees[0])}</div>
+                        <div class="result-label">Fees Deducted</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value neutral">{format_percentage(float(schedule.effective_rate(tiered_values[-1])))}</div>
+                        <div class="result-label">Effective Fee at End</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value positive">{format_currency(result.total_self - tiered_values[-1])}</div>
+                        <div class="result-label">Behind Self-Managed</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                chart_years, chart_self, chart_tiered = downsample(result.years, result.self_values, tiered_values)
+                tiered_fig = go.Figure()
+                
+                tiered_fig.add_trace(go.Scatter(
+                    x=chart_years,
+                    y=chart_self,
+                    mode='lines',
+                    name=f'Self-Managed ({self_managed_fee}% fee)',
+                    line=dict(color='#38a169', width=3)
+                ))
+                
+                tiered_fig.add_trace(go.Scatter(
+                    x=chart_years,
+                    y=chart_tiered,
+                    mode='lines',
+                    name='Advisor-Managed (tiered fee)',
+                    line=dict(color='#e53e3e', width=3)
+                ))
+                
+                tiered_fig.update_layout(
+                    title="Tiered Advisor Fee Over Time",
+                    xaxis_title="Years",
+                    yaxis_title="Portfolio Value ($)",
+                    font=dict(family="Inter, sans-serif"),
+                    paper_bgcolor='white',
+                    plot_bgcolor='white',
+                    showlegend=True,
+                    hovermode='x unified'
+                )
+                
+                tiered_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                tiered_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                
+                st.plotly_chart(tiered_fig, use_container_width=True)
+        
+        # Every product on the menu from one (products × years) evaluation
+        if show_products:
+            menu = product_menu.dropna(subset=["Product", "Fee (%)"])
+            products = tuple(
+                FeeProduct(
+                    str(row["Product"]),
+                    float(row["Fee (%)"]),
+                    None if pd.isna(row["Expected Return (%)"]) else float(row["Expected Return (%)"])
+                )
+                for _, row in menu.iterrows()
+            )
+            
+            if products:
+                comparison = compare_products(starting_amount, monthly_contribution, expected_return, years, products)
+                
+                st.markdown("### Product Comparison")
+                
+                chart_years, *chart_values = downsample(comparison.years, *comparison.values)
+                products_fig = go.Figure()
+                
+                for product, values in zip(comparison.products, chart_values):
+                    products_fig.add_trace(go.Scatter(
+                        x=chart_years,
+                        y=values,
+                        mode='lines',
+                        name=f'{product.name} ({product.fee}% fee)',
+                        line=dict(width=2)
+                    ))
+                
+                products_fig.update_layout(
+                    title="Product Value Comparison Over Time",
+                    xaxis_title="Years",
+                    yaxis_title="Portfolio Value ($)",
+                    font=dict(family="Inter, sans-serif"),
+                    paper_bgcolor='white',
+                    plot_bgcolor='white',
+                    showlegend=True,
+                    hovermode='x unified'
+                )
+                
+                products_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                products_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                
+                st.plotly_chart(products_fig, use_container_width=True)
+                
+                ranked = pd.DataFrame(comparison.ranked_table())
+                for column in ["Ending Value", "Fees Paid", "Behind Best"]:
+                    ranked[column] = ranked[column].map(format_currency)
+                for column in ["Fee (%)", "Return (%)"]:
+                    ranked[column] = ranked[column].map(format_percentage)
+                st.dataframe(ranked, hide_index=True, use_container_width=True)
+            else:
+                st.warning("Add at least one product with a fee to compare.")
+
+def debt_results_section(result, show_debt_cents, debt_rounding_label):
+    """Payoff summary, exact-cents statement and chart of one debt"""
+    go = lazy_import("plotly.graph_objects")
+    inputs = result.inputs
+    total_debt = inputs.total_debt
+    annual_rate = inputs.annual_rate
+    monthly_payment = inputs.monthly_payment
+    extra_payment = inputs.extra_payment
+    
+    months_standard = result.months_standard
+    months_extra = result.months_extra
+    total_interest_standard = result.total_interest_standard
+    total_interest_extra = result.total_interest_extra
+    
+    # Calculate dates
+    payoff_date_standard = payoff_date(months_standard)
+    payoff_date_extra = payoff_date(months_extra)
+    
+    # Display results
+    st.markdown(f"""
+    <div class="results-grid">
+        <div class="result-card">
+            <div class="result-value neutral">{math.ceil(months_standard)} months</div>
+            <div class="result-label">Standard Payoff Time</div>
+        </div>
+        <div class="result-card">
+            <div class="result-value positive">{math.ceil(months_extra)} months</div>
+            <div class="result-label">With Extra Payments</div>
+        </div>
+        <div class="result-card">
+            <div class="result-value positive">{math.ceil(result.months_saved)} months</div>
+            <div class="result-label">Time Saved</div>
+        </div>
+        <div class="result-card">
+            <div class="result-value positive">{format_currency(result.interest_saved)}</div>
+            <div class="result-label">Interest Saved</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Display payoff dates
+    col_a, col_b = st.columns(2)
+    with col_a:
+        st.markdown(f"""
+        <div class="content-section">
+            <div class="section-title">Standard Scenario</div>
+            <p><strong>Debt-Free Date:</strong> {payoff_date_standard.strftime('%B %d, %Y')}</p>
+            <p><strong>Total Interest:</strong> {format_currency(total_interest_standard)}</p>
+            <p><strong>Total Paid:</strong> {format_currency(total_debt + total_interest_standard)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col_b:
+        st.markdown(f"""
+        <div class="content-section">
+            <div class="section-title">With Extra Payments</div>
+            <p><strong>Debt-Free Date:</strong> {payoff_date_extra.strftime('%B %d, %Y')}</p>
+            <p><strong>Total Interest:</strong> {format_currency(total_interest_extra)}</p>
+            <p><strong>Total Paid:</strong> {format_currency(total_debt + total_interest_extra)}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Both scenarios amortized payment by payment in int64 cents
+    if show_debt_cents:
+        try:
+            ledger = amortize_cents(
+                [total_debt, total_debt],
+                annual_rate,
+                [monthly_payment, monthly_payment + extra_payment],
+                HALF_EVEN if debt_rounding_label.startswith("Banker") else HALF_UP
+            )
+        except ValueError as error:
+            st.warning(f"Exact-cents amortization isn't available: {error}.")
+        else:
+            interest_standard_cents, interest_extra_cents = ledger.total_interest_cents
+            st.markdown(f"""
+            <div class="content-section">
+                <div class="section-title">Exact-Cents Statement</div>
+                <p><strong>Payments:</strong> {ledger.months[0]} standard, {ledger.months[1]} with extra payments</p>
+                <p><strong>Final Payment:</strong> {format_currency(ledger.final_payment_cents[0] / 100)} standard, {format_currency(ledger.final_payment_cents[1] / 100)} with extra payments</p>
+                <p><strong>Total Interest:</strong> {format_currency(interest_standard_cents / 100)} standard, {format_currency(interest_extra_cents / 100)} with extra payments</p>
+                <p><strong>Interest Saved:</strong> {format_currency((interest_standard_cents - interest_extra_cents) / 100)}</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Cap the points sent to the browser
+    chart_months, chart_standard, chart_extra = downsample(
+        result.month_numbers, result.balance_standard, result.balance_extra
+    )
+    
+    # Create chart
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=chart_months,
+        y=chart_standard,
+        mode='lines',
+        name='Standard Payments',
+        line=dict(color='#e53e3e', width=3)
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=chart_months,
+        y=chart_extra,
+        mode='lines',
+        name='With Extra Payments',
+        line=dict(color='#38a169', width=3)
+    ))
+    
+    fig.update_layout(
+        title="Debt Payoff Progress",
+        xaxis_title="Months",
+        yaxis_title="Remaining Debt ($)",
+        font=dict(family="Inter, sans-serif"),
+        paper_bgcolor='white',
+        plot_bgcolor='white',
+        showlegend=True,
+        hovermode='x unified'
+    )
+    
+    fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+    fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+    
+    st.plotly_chart(fig, use_container_width=True)
 
 def debt_free_page():
     """Debt-Free Date Calculator"""
+    pd = lazy_import("pandas")
+    go = lazy_import("plotly.graph_objects")
+    
     st.markdown("""
     <div class="main-content">
         <div class="page-header">
@@ -1387,6 +2028,66 @@ def debt_free_page():
             monthly_payment = st.number_input("Miminum Monthly Payment ($)", min_value=0.0, value=500.0, step=25.0)
             extra_payment = st.number_input("Extra Monthly Payment ($)", min_value=0.0, value=100.0, step=25.0)
         
+        with st.expander("Exact Cents"):
+            show_debt_cents = st.checkbox("Post interest monthly in whole cents, like a loan statement", value=False)
+            debt_rounding_label = st.radio(
+                "Rounding",
+                ["Banker's (Half-Even)", "Half-Up"],
+                horizontal=True,
+                key="debt_rounding_radio"
+            )
+        
+        with st.expander("Variable Rate / Promotional APR"):
+            show_variable = st.checkbox("Apply a changing interest rate", value=False)
+            st.caption("Each rate applies from the month after From Month. The first row must start at month 0.")
+            rate_table = st.data_editor(
+                pd.DataFrame({
+                    "From Month": [0, 12],
+                    "Rate (%)": [0.0, 24.99]
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "From Month": st.column_config.NumberColumn(min_value=0, step=1),
+                    "Rate (%)": st.column_config.NumberColumn(min_value=0.0, max_value=40.0, step=0.1)
+                },
+                key="rate_schedule_editor"
+            )
+        
+        with st.expander("Extra Payment Sweep"):
+            show_sweep = st.checkbox("Compare a whole range of extra payments", value=False)
+            sweep_col1, sweep_col2 = st.columns(2)
+            with sweep_col1:
+                max_sweep_extra = st.number_input("Largest Extra Payment ($)", min_value=25.0, max_value=100_000.0, value=2000.0, step=100.0)
+            with sweep_col2:
+                sweep_step = st.number_input("Step ($)", min_value=1.0, value=25.0, step=5.0)
+        
+        with st.expander("Multiple Debts"):
+            show_multidebt = st.checkbox("Plan the payoff of several debts together", value=False)
+            st.caption("Every debt gets its minimum; the rest of the budget goes to one debt at a time.")
+            debt_table = st.data_editor(
+                pd.DataFrame({
+                    "Debt": ["Credit Card", "Car Loan", "Student Loan", "Personal Loan"],
+                    "Balance ($)": [5000.0, 12000.0, 18000.0, 3000.0],
+                    "Rate (%)": [22.9, 6.5, 5.0, 11.0],
+                    "Minimum ($)": [150.0, 300.0, 200.0, 90.0]
+                }),
+                num_rows="dynamic",
+                use_container_width=True,
+                column_config={
+                    "Balance ($)": st.column_config.NumberColumn(min_value=0.0, step=500.0, format="$%.2f"),
+                    "Rate (%)": st.column_config.NumberColumn(min_value=0.0, max_value=40.0, step=0.1),
+                    "Minimum ($)": st.column_config.NumberColumn(min_value=0.0, step=25.0, format="$%.2f")
+                },
+                key="multidebt_editor"
+            )
+            debt_budget = st.number_input("Total Monthly Budget ($)", min_value=0.0, value=1000.0, step=50.0)
+            strategy_label = st.radio(
+                "Strategy",
+                ["Avalanche (Highest Rate First)", "Snowball (Smallest Balance First)", "Custom (Table Order)"],
+                horizontal=True
+            )
+        
         # Form-style button positioning
         st.markdown("<br>", unsafe_allow_html=True)
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
@@ -1395,130 +2096,347 @@ def debt_free_page():
     
     # Results section
     if calculate_clicked:
-        monthly_rate = annual_rate / 100 / 12
-        
-        # Standard payoff calculation
-        if monthly_rate > 0:
-            months_standard = -np.log(1 - (total_debt * monthly_rate) / monthly_payment) / np.log(1 + monthly_rate)
-            total_interest_standard = (monthly_payment * months_standard) - total_debt
-        else:
-            months_standard = total_debt / monthly_payment
-            total_interest_standard = 0
-        
-        # With extra payments
-        total_monthly_payment = monthly_payment + extra_payment
-        if monthly_rate > 0 and total_monthly_payment > total_debt * monthly_rate:
-            months_extra = -np.log(1 - (total_debt * monthly_rate) / total_monthly_payment) / np.log(1 + monthly_rate)
-            total_interest_extra = (total_monthly_payment * months_extra) - total_debt
+        try:
+            result = project_debt(DebtInputs(total_debt, annual_rate, monthly_payment, extra_payment))
+        except ValueError as error:
+            st.error(f"This debt can't be paid off: {error}. Increase the monthly payment.")
+            result = None
         else:
-            months_extra = total_debt / total_monthly_payment
-            total_interest_extra = 0
+            debt_results_section(result, show_debt_cents, debt_rounding_label)
+        
+        # The same debt under a changing rate, chained segment by segment
+        if show_variable:
+            changes = rate_table.dropna().sort_values("From Month")
+            try:
+                schedule = RateSchedule(
+                    tuple(int(month) for month in changes["From Month"]),
+                    tuple(float(rate) for rate in changes["Rate (%)"])
+                )
+                variable = project_variable_debt(
+                    VariableDebtInputs(total_debt, schedule, monthly_payment, extra_payment)
+                )
+            except ValueError as error:
+                st.error(f"This rate schedule can't be used: {error}.")
+            else:
+                st.markdown("### With a Changing Rate")
+                st.markdown(f"""
+                <div class="results-grid">
+                    <div class="result-card">
+                        <div class="result-value neutral">{math.ceil(variable.months_standard)} months</div>
+                        <div class="result-label">Standard Payoff Time</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value positive">{math.ceil(variable.months_extra)} months</div>
+                        <div class="result-label">With Extra Payments</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value negative">{format_currency(variable.total_interest_standard)}</div>
+                        <div class="result-label">Total Interest</div>
+                    </div>
+                    <div class="result-card">
+                        <div class="result-value positive">{format_currency(variable.interest_saved)}</div>
+                        <div class="result-label">Interest Saved</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                chart_months, chart_standard, chart_extra = downsample(
+                    variable.month_numbers, variable.balance_standard, variable.balance_extra
+                )
+                variable_fig = go.Figure()
+                
+                variable_fig.add_trace(go.Scatter(
+                    x=chart_months,
+                    y=chart_standard,
+                    mode='lines',
+                    name='Standard Payments',
+                    line=dict(color='#e53e3e', width=3)
+                ))
+                
+                variable_fig.add_trace(go.Scatter(
+                    x=chart_months,
+                    y=chart_extra,
+                    mode='lines',
+                    name='With Extra Payments',
+                    line=dict(color='#38a169', width=3)
+                ))
+                
+                for change in schedule.starts[1:]:
+                    variable_fig.add_vline(x=change, line=dict(color='rgba(0,0,0,0.3)', dash='dash'))
+                
+                variable_fig.update_layout(
+                    title="Debt Payoff Progress with Rate Changes",
+                    xaxis_title="Months",
+                    yaxis_title="Remaining Debt ($)",
+                    font=dict(family="Inter, sans-serif"),
+                    paper_bgcolor='white',
+                    plot_bgcolor='white',
+                    showlegend=True,
+                    hovermode='x unified'
+                )
+                
+                variable_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                variable_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                
+                st.plotly_chart(variable_fig, use_container_width=True)
         
-        # Calculate dates
-        today = datetime.now()
-        payoff_date_standard = today + timedelta(days=months_standard * 30.44)
-        payoff_date_extra = today + timedelta(days=months_extra * 30.44)
+        # Every extra payment in the range from one vectorized evaluation
+        if show_sweep:
+            if result is None:
+                st.warning("The extra payment sweep needs a monthly payment that covers the monthly interest.")
+            else:
+                sweep = extra_payment_sweep(
+                    DebtInputs(total_debt, annual_rate, monthly_payment), max_sweep_extra, sweep_step
+                )
+                
+                st.markdown("### Extra Payment Sweep")
+                
+                chart_extra_payments, chart_payoff_months, chart_interest = downsample(
+                    sweep.extra_payments, sweep.months, sweep.total_interest
+                )
+                sweep_fig = go.Figure()
+                
+                sweep_fig.add_trace(go.Scatter(
+                    x=chart_extra_payments,
+                    y=chart_payoff_months,
+                    mode='lines',
+                    name='Months to Payoff',
+                    line=dict(color='#4285f4', width=3)
+                ))
+                
+                sweep_fig.add_trace(go.Scatter(
+                    x=chart_extra_payments,
+                    y=chart_interest,
+                    mode='lines',
+                    name='Total Interest',
+                    yaxis='y2',
+                    line=dict(color='#e53e3e', width=3)
+                ))
+                
+                sweep_fig.add_trace(go.Scatter(
+                    x=[extra_payment],
+                    y=[result.months_extra],
+                    mode='markers',
+                    name='Your Extra Payment',
+                    marker=dict(color='#FF6600', size=12, symbol='x')
+                ))
+                
+                sweep_fig.update_layout(
+                    title="Diminishing Returns of Extra Payments",
+                    xaxis_title="Extra Monthly Payment ($)",
+                    yaxis_title="Months to Payoff",
+                    yaxis2=dict(title="Total Interest ($)", overlaying='y', side='right'),
+                    font=dict(family="Inter, sans-serif"),
+                    paper_bgcolor='white',
+                    plot_bgcolor='white',
+                    showlegend=True,
+                    hovermode='x unified'
+                )
+                
+                sweep_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                sweep_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+                # One set of gridlines; the interest axis only labels the right side
+                sweep_fig.update_layout(yaxis2=dict(showgrid=False))
+                
+                st.plotly_chart(sweep_fig, use_container_width=True)
+                
+                nearest = int(abs(sweep.extra_payments - extra_payment).argmin())
+                st.caption(
+                    f"Around {format_currency(sweep.extra_payments[nearest])} extra per month, each additional dollar "
+                    f"saves about {format_currency(sweep.marginal_interest_saved[nearest])} of interest."
+                )
         
-        # Time and interest saved
-        months_saved = months_standard - months_extra
-        interest_saved = total_interest_standard - total_interest_extra
+        # All debts paid down together under one budget
+        if show_multidebt:
+            rows = debt_table.dropna(subset=["Balance ($)", "Rate (%)", "Minimum ($)"])
+            debts = tuple(
+                Debt(
+                    str(row["Debt"]) if not pd.isna(row["Debt"]) else f"Debt {position}",
+                    float(row["Balance ($)"]),
+                    float(row["Rate (%)"]),
+                    float(row["Minimum ($)"])
+                )
+                for position, (_, row) in enumerate(rows.iterrows(), start=1)
+            )
+            strategy = {
+                "Avalanche (Highest Rate First)": AVALANCHE,
+                "Snowball (Smallest Balance First)": SNOWBALL,
+                "Custom (Table Order)": CUSTOM
+            }[strategy_label]
+            
+            if not debts:
+                st.warning("Add at least one debt to plan a payoff.")
+                return
+            
+            try:
+                plans = compare_strategies(debts, debt_budget, order=tuple(range(len(debts))))
+            except ValueError as error:
+                st.error(f"This plan can't be completed: {error}.")
+                return
+            
+            plan = plans[strategy]
+            other = plans[SNOWBALL if strategy == AVALANCHE else AVALANCHE]
+            
+            st.markdown("### Multi-Debt Payoff Plan")
+            st.markdown(f"""
+            <div class="results-grid">
+                <div class="result-card">
+                    <div class="result-value neutral">{plan.debt_free_month} months</div>
+                    <div class="result-label">Debt-Free In</div>
+                </div>
+                <div class="result-card">
+                    <div class="result-value positive">{payoff_date(plan.debt_free_month).strftime('%B %Y')}</div>
+                    <div class="result-label">Debt-Free Date</div>
+                </div>
+                <div class="result-card">
+                    <div class="result-value negative">{format_currency(plan.total_interest)}</div>
+                    <div class="result-label">Total Interest</div>
+                </div>
+                <div class="result-card">
+                    <div class="result-value positive">{format_currency(other.total_interest - plan.total_interest)}</div>
+                    <div class="result-label">Interest Saved vs {other.strategy.title()}</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            chart_months, *chart_balances = downsample(plan.month_numbers, *plan.balances)
+            multidebt_fig = go.Figure()
+            
+            for debt, balances in zip(plan.debts, chart_balances):
+                multidebt_fig.add_trace(go.Scatter(
+                    x=chart_months,
+                    y=balances,
+                    mode='lines',
+                    name=debt.name,
+                    stackgroup='debts',
+                    line=dict(width=1)
+                ))
+            
+            multidebt_fig.update_layout(
+                title=f"Balances Under the {plan.strategy.title()} Strategy",
+                xaxis_title="Months",
+                yaxis_title="Remaining Debt ($)",
+                font=dict(family="Inter, sans-serif"),
+                paper_bgcolor='white',
+                plot_bgcolor='white',
+                showlegend=True,
+                hovermode='x unified'
+            )
+            
+            multidebt_fig.update_xaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+            multidebt_fig.update_yaxes(showgrid=True, gridcolor='rgba(0,0,0,0.1)')
+            
+            st.plotly_chart(multidebt_fig, use_container_width=True)
+            
+            timeline = pd.DataFrame(plan.payoff_table())
+            timeline["Paid Off"] = timeline["Paid Off (Month)"].map(lambda month: payoff_date(month).strftime('%B %Y'))
+            for column in ["Balance", "Minimum", "Interest"]:
+                timeline[column] = timeline[column].map(format_currency)
+            timeline["Rate (%)"] = timeline["Rate (%)"].map(format_percentage)
+            st.dataframe(timeline, hide_index=True, use_container_width=True)
+
+def accelerated_payoff_section():
+    """Biweekly vs monthly mortgage payoff"""
+    go = lazy_import("plotly.graph_objects")
+    
+    with st.container():
+        st.markdown("### Accelerated Mortgage Payoff")
+        st.markdown("---")
+        
+        st.info("""
+        **How it works:** Paying half your monthly mortgage payment every two weeks makes 26 half payments, 
+        or 13 full payments, a year. Interest accrues daily between payments, so the extra payment and the 
+        more frequent principal reductions shorten the loan.
+        """)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            loan_balance = st.number_input("Loan Balance ($)", min_value=0.0, value=300000.0, step=5000.0)
+            annual_rate = st.number_input("Annual Interest Rate (%)", min_value=0.0, max_value=20.0, value=6.5, step=0.05,
+                                          key="mortgage_rate_input")
+        
+        with col2:
+            term_years = st.number_input("Loan Term (Years)", min_value=1, max_value=40, value=30, step=1)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+        with col4:
+            calculate_clicked = st.button("Compare Payoff", type="primary", use_container_width=True, key="mortgage_calc_button")
+    
+    if calculate_clicked:
+        if loan_balance <= 0:
+            st.warning("Please enter a loan balance to compare.")
+            return
+        
+        result = accelerated_biweekly(loan_balance, annual_rate, term_years)
         
-        # Display results
         st.markdown(f"""
         <div class="results-grid">
             <div class="result-card">
-                <div class="result-value neutral">{math.ceil(months_standard)} months</div>
-                <div class="result-label">Standard Payoff Time</div>
+                <div class="result-value neutral">{format_currency(result.monthly_payment[0])}</div>
+                <div class="result-label">Monthly Payment</div>
             </div>
             <div class="result-card">
-                <div class="result-value positive">{math.ceil(months_extra)} months</div>
-                <div class="result-label">With Extra Payments</div>
+                <div class="result-value positive">{format_currency(result.biweekly_payment[0])}</div>
+                <div class="result-label">Biweekly Payment</div>
             </div>
             <div class="result-card">
-                <div class="result-value positive">{math.ceil(months_saved)} months</div>
+                <div class="result-value positive">{result.years_saved[0]:.1f} years</div>
                 <div class="result-label">Time Saved</div>
             </div>
             <div class="result-card">
-                <div class="result-value positive">{format_currency(interest_saved)}</div>
+                <div class="result-value positive">{format_currency(result.interest_saved[0])}</div>
                 <div class="result-label">Interest Saved</div>
             </div>
         </div>
         """, unsafe_allow_html=True)
         
-        # Display payoff dates
         col_a, col_b = st.columns(2)
         with col_a:
             st.markdown(f"""
             <div class="content-section">
-                <div class="section-title">Standard Scenario</div>
-                <p><strong>Debt-Free Date:</strong> {payoff_date_standard.strftime('%B %d, %Y')}</p>
-                <p><strong>Total Interest:</strong> {format_currency(total_interest_standard)}</p>
-                <p><strong>Total Paid:</strong> {format_currency(total_debt + total_interest_standard)}</p>
+                <div class="section-title">Monthly Payments</div>
+                <p><strong>Paid Off In:</strong> {term_years} years</p>
+                <p><strong>Total Interest:</strong> {format_currency(result.monthly_interest[0])}</p>
+                <p><strong>Total Paid:</strong> {format_currency(loan_balance + result.monthly_interest[0])}</p>
             </div>
             """, unsafe_allow_html=True)
         
         with col_b:
             st.markdown(f"""
             <div class="content-section">
-                <div class="section-title">With Extra Payments</div>
-                <p><strong>Debt-Free Date:</strong> {payoff_date_extra.strftime('%B %d, %Y')}</p>
-                <p><strong>Total Interest:</strong> {format_currency(total_interest_extra)}</p>
-                <p><strong>Total Paid:</strong> {format_currency(total_debt + total_interest_extra)}</p>
+                <div class="section-title">Biweekly Payments</div>
+                <p><strong>Paid Off In:</strong> {result.biweekly_years[0]:.1f} years ({math.ceil(result.biweekly_payments[0])} payments)</p>
+                <p><strong>Total Interest:</strong> {format_currency(result.biweekly_interest[0])}</p>
+                <p><strong>Total Paid:</strong> {format_currency(loan_balance + result.biweekly_interest[0])}</p>
             </div>
             """, unsafe_allow_html=True)
         
-        # Create payoff progression chart
-        months_to_show = math.ceil(max(months_standard, months_extra))
-        month_numbers = list(range(1, months_to_show + 1))
-        
-        # Calculate remaining balance for each scenario
-        balance_standard = []
-        balance_extra = []
-        
-        remaining_debt_std = total_debt
-        remaining_debt_ext = total_debt
-        
-        for month in month_numbers:
-            # Standard payments
-            if remaining_debt_std > 0:
-                interest_payment_std = remaining_debt_std * monthly_rate
-                principal_payment_std = min(monthly_payment - interest_payment_std, remaining_debt_std)
-                remaining_debt_std -= principal_payment_std
-                remaining_debt_std = max(0, remaining_debt_std)
-            
-            # Extra payments
-            if remaining_debt_ext > 0:
-                interest_payment_ext = remaining_debt_ext * monthly_rate
-                principal_payment_ext = min(total_monthly_payment - interest_payment_ext, remaining_debt_ext)
-                remaining_debt_ext -= principal_payment_ext
-                remaining_debt_ext = max(0, remaining_debt_ext)
-            
-            balance_standard.append(remaining_debt_std)
-            balance_extra.append(remaining_debt_ext)
+        chart_years = [month / 12 for month in range(term_years * 12 + 1)]
         
-        # Create chart
         fig = go.Figure()
         
         fig.add_trace(go.Scatter(
-            x=month_numbers,
-            y=balance_standard,
+            x=chart_years,
+            y=result.monthly_balance(chart_years)[0],
             mode='lines',
-            name='Standard Payments',
+            name='Monthly Payments',
             line=dict(color='#e53e3e', width=3)
         ))
         
         fig.add_trace(go.Scatter(
-            x=month_numbers,
-            y=balance_extra,
+            x=chart_years,
+            y=result.biweekly_balance(chart_years)[0],
             mode='lines',
-            name='With Extra Payments',
+            name='Biweekly Payments',
             line=dict(color='#38a169', width=3)
         ))
         
         fig.update_layout(
-            title="Debt Payoff Progress",
-            xaxis_title="Months",
-            yaxis_title="Remaining Debt ($)",
+            title="Mortgage Balance Over Time",
+            xaxis_title="Years",
+            yaxis_title="Remaining Balance ($)",
             font=dict(family="Inter, sans-serif"),
             paper_bgcolor='white',
             plot_bgcolor='white',
@@ -1531,6 +2449,117 @@ def debt_free_page():
         
         st.plotly_chart(fig, use_container_width=True)
 
+def bulk_conversion_section():
+    """Roster-wide monthly/annual to biweekly conversion"""
+    pd = lazy_import("pandas")
+    
+    with st.container():
+        st.markdown("### Bulk Payroll Conversion")
+        st.markdown("---")
+        
+        st.info("""
+        **How it works:** Upload a CSV or Parquet file with one amount per row. Every row is converted at once 
+        in exact cents: the 26 biweekly payments of each row add up to its annual amount to the cent, with any 
+        leftover cents spread over the year.
+        """)
+        
+        uploaded = st.file_uploader("Roster File", type=["csv", "parquet"], key="bulk_roster_upload")
+        if uploaded is None:
+            return
+        
+        try:
+            roster = pd.read_parquet(uploaded) if uploaded.name.endswith(".parquet") else pd.read_csv(uploaded)
+        except ImportError:
+            st.error("Reading Parquet files needs the pyarrow package. Upload a CSV instead.")
+            return
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            amount_column = st.selectbox("Amount Column", list(roster.columns))
+        with col2:
+            type_column = st.selectbox("Input Type Column", ["(All Monthly)", "(All Annual)"] + list(roster.columns))
+        include_payments = st.checkbox("Include all 26 payments in the download", value=False)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+        with col4:
+            convert_clicked = st.button("Convert Roster", type="primary", use_container_width=True, key="bulk_convert_button")
+    
+    if convert_clicked:
+        if type_column == "(All Monthly)":
+            input_types = "Monthly"
+        elif type_column == "(All Annual)":
+            input_types = "Annual"
+        else:
+            input_types = roster[type_column].fillna("").to_numpy(dtype=str)
+        
+        try:
+            result = convert_bulk(pd.to_numeric(roster[amount_column]).to_numpy(dtype=float), input_types)
+        except ValueError as error:
+            st.error(f"This roster can't be converted: {error}.")
+            return
+        
+        st.markdown(f"""
+        <div class="results-grid">
+            <div class="result-card">
+                <div class="result-value neutral">{len(roster):,}</div>
+                <div class="result-label">Rows Converted</div>
+            </div>
+            <div class="result-card">
+                <div class="result-value neutral">{format_currency(result.annual_cents.sum() / 100)}</div>
+                <div class="result-label">Total Annual Amount</div>
+            </div>
+            <div class="result-card">
+                <div class="result-value positive">{format_currency(result.regular_cents.sum() / 100)}</div>
+                <div class="result-label">Total per Payday</div>
+            </div>
+            <div class="result-card">
+                <div class="result-value neutral">{int((result.extra_cent_payments > 0).sum()):,}</div>
+                <div class="result-label">Rows with Extra-Cent Payments</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        converted = roster.copy()
+        converted["annual_equivalent"] = result.annual_equivalent
+        converted["biweekly_payment"] = result.biweekly_amount
+        converted["payments_plus_one_cent"] = result.extra_cent_payments
+        download_cells = len(converted) * (len(converted.columns) + (PAY_PERIODS_PER_YEAR if include_payments else 0))
+        if include_payments:
+            # Payments of the preview rows only; the full matrix is built for the download
+            preview_payments = pd.DataFrame(
+                split_cents(result.annual_cents[:100]) / 100,
+                columns=[f"payment_{period}" for period in range(1, PAY_PERIODS_PER_YEAR + 1)],
+                index=converted.index[:100]
+            )
+            st.dataframe(pd.concat([converted.head(100), preview_payments], axis=1), hide_index=True, use_container_width=True)
+        else:
+            st.dataframe(converted.head(100), hide_index=True, use_container_width=True)
+        
+        if download_cells > BULK_DOWNLOAD_MAX_CELLS:
+            payments_flag = " --payments" if include_payments else ""
+            st.info(f"""
+            **This roster is too large to download from the browser** ({download_cells:,} cells). 
+            Convert it from the command line instead, which streams it to a file in chunks:
+            `python -m fincalc biweekly roster.csv -o biweekly_roster.csv{payments_flag}` 
+            (columns `amount` and, optionally, `input_type`).
+            """)
+            return
+        
+        if include_payments:
+            payments = pd.DataFrame(
+                result.payments() / 100,
+                columns=[f"payment_{period}" for period in range(1, PAY_PERIODS_PER_YEAR + 1)],
+                index=converted.index
+            )
+            converted = pd.concat([converted, payments], axis=1)
+        st.download_button(
+            "Download Converted Roster (CSV)",
+            converted.to_csv(index=False, float_format="%.2f"),
+            file_name="biweekly_roster.csv",
+            mime="text/csv"
+        )
+
 def biweekly_payment_page():
     """Biweekly Payment Calculator"""
     st.markdown("""
@@ -1542,6 +2571,19 @@ def biweekly_payment_page():
     </div>
     """, unsafe_allow_html=True)
     
+    mode = st.radio(
+        "Calculator Mode",
+        ["Convert a Payment", "Accelerated Mortgage Payoff", "Bulk Payroll Conversion"],
+        horizontal=True,
+        key="biweekly_mode_radio"
+    )
+    if mode == "Accelerated Mortgage Payoff":
+        accelerated_payoff_section()
+        return
+    if mode == "Bulk Payroll Conversion":
+        bulk_conversion_section()
+        return
+    
     # Input section in a clean container
     with st.container():
         st.markdown("### Payment Conversion")
@@ -1589,6 +2631,20 @@ def biweekly_payment_page():
                 )
                 monthly_amount = 0.0  # Reset monthly when using annual
         
+        with st.expander("Pay Calendar"):
+            show_calendar = st.checkbox("Show actual paydays, including 27-payday years", value=False)
+            cal_col1, cal_col2 = st.columns(2)
+            with cal_col1:
+                first_payday = st.date_input("First Payday", key="first_payday_input")
+                years_to_schedule = st.number_input("Years to Schedule", min_value=1, max_value=40, value=5, step=1)
+            with cal_col2:
+                frequency_label = st.selectbox("Pay Frequency", ["Biweekly", "Weekly", "Semimonthly", "Monthly"])
+                roll_label = st.radio(
+                    "Weekend or Holiday Payday",
+                    ["Previous Business Day", "Next Business Day", "Don't Move"],
+                    key="payday_roll_radio"
+                )
+        
         # Form-style button positioning
         st.markdown("<br>", unsafe_allow_html=True)
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
@@ -1600,19 +2656,15 @@ def biweekly_payment_page():
         if monthly_amount > 0 or annual_amount > 0:
             # Calculate biweekly amount
             if input_type == "Monthly Amount" and monthly_amount > 0:
-                # Convert monthly to biweekly: monthly * 12 / 26
-                biweekly_amount = (monthly_amount * 12) / 26
                 original_amount = monthly_amount
                 original_type = "Monthly"
-                # Also calculate the annual equivalent
-                annual_equivalent = monthly_amount * 12
             else:
-                # Convert annual to biweekly: annual / 26
-                biweekly_amount = annual_amount / 26
                 original_amount = annual_amount
                 original_type = "Annual"
-                # Also calculate the monthly equivalent
-                annual_equivalent = annual_amount
+            
+            result = convert_to_biweekly(BiweeklyInputs(original_amount, original_type))
+            biweekly_amount = result.biweekly_amount
+            annual_equivalent = result.annual_equivalent
             
             # Display results
             st.markdown(f"""
@@ -1630,7 +2682,7 @@ def biweekly_payment_page():
                     <div class="result-label">Annual Equivalent</div>
                 </div>
                 <div class="result-card">
-                    <div class="result-value neutral">26</div>
+                    <div class="result-value neutral">{result.pay_periods}</div>
                     <div class="result-label">Pay Periods/Year</div>
                 </div>
             </div>
@@ -1659,6 +2711,49 @@ def biweekly_payment_page():
                 </div>
                 """, unsafe_allow_html=True)
             
+            # Real paydays per calendar year from the pay calendar
+            if show_calendar:
+                frequency = {
+                    "Biweekly": BIWEEKLY,
+                    "Weekly": WEEKLY,
+                    "Semimonthly": SEMIMONTHLY,
+                    "Monthly": MONTHLY_PAYDAYS
+                }[frequency_label]
+                roll = {
+                    "Previous Business Day": PRECEDING,
+                    "Next Business Day": FOLLOWING,
+                    "Don't Move": NO_ROLL
+                }[roll_label]
+                pd = lazy_import("pandas")
+                calendar = calendar_years(first_payday, years_to_schedule, frequency, roll)
+                schedule_years, payday_counts = calendar.per_year()
+                
+                st.markdown("### Your Pay Calendar")
+                
+                by_year = pd.DataFrame({
+                    "Year": schedule_years,
+                    "Paydays": payday_counts[0],
+                    "Per Payday for the Same Annual Total": [format_currency(annual_equivalent / count) for count in payday_counts[0]]
+                })
+                st.dataframe(by_year, hide_index=True, use_container_width=True)
+                
+                extra_years = [str(year) for year, count in zip(schedule_years, payday_counts[0]) if count > NOMINAL_PAYDAYS[frequency]]
+                if extra_years:
+                    st.info(f"**Extra payday in {', '.join(extra_years)}:** these years have {NOMINAL_PAYDAYS[frequency] + 1} "
+                            f"{frequency_label.lower()} paydays, so transfers sized for {NOMINAL_PAYDAYS[frequency]} paydays "
+                            f"add up to more than {format_currency(annual_equivalent)} in those years.")
+                
+                paydays = pd.DataFrame({
+                    "Scheduled": calendar.scheduled[0][:calendar.counts[0]],
+                    "Payday": calendar.dates()
+                })
+                st.download_button(
+                    "Download Paydays (CSV)",
+                    paydays.to_csv(index=False),
+                    file_name="paydays.csv",
+                    mime="text/csv"
+                )
+            
             # Additional tips
             st.markdown("""
             <div class="content-section">
@@ -1776,6 +2871,10 @@ def main():
         debt_free_page()
     elif selected_page == "Biweekly Payment":
         biweekly_payment_page()
+    
+    # Startup measurement mode: FINCALC_IMPORT_TIMES=1
+    if REPORT_IMPORT_TIMES:
+        import_times_panel()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
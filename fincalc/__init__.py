@@ -0,0 +1,206 @@
+"""Headless core of the Financial Calculator Suite.
+
+Every calculator behind the Streamlit pages lives here as plain Python/NumPy
+so it can be imported from batch jobs and services without pulling in
+Streamlit, Plotly or pandas. Importing this package has no side effects.
+
+Rates and fees are given in percent, exactly as they are entered on the pages
+(``annual_rate=7.0`` means 7%).
+"""
+
+from fincalc.batch import BatchResult, project_compound_batch
+from fincalc.biweekly import (
+    PAY_PERIODS_PER_YEAR,
+    AcceleratedPayoff,
+    BiweeklyInputs,
+    BiweeklyResult,
+    BulkConversion,
+    accelerated_biweekly,
+    convert_bulk,
+    convert_to_biweekly,
+    split_cents,
+)
+from fincalc.cache import CacheStats, ResultCache, cached, result_cache
+from fincalc.compound import (
+    COMPOUNDING_FREQUENCIES,
+    CompoundInputs,
+    CompoundResult,
+    compound_balance,
+    compound_final_balance,
+    project_compound,
+)
+from fincalc.debt import (
+    AmortizationSchedule,
+    DebtInputs,
+    DebtResult,
+    ExtraPaymentSweep,
+    amortization_schedule,
+    extra_payment_sweep,
+    level_payment,
+    payoff_date,
+    payoff_interest,
+    payoff_months,
+    project_debt,
+    remaining_balance,
+)
+from fincalc.downsample import downsample, lttb_indices
+from fincalc.export import ExportStats, export_schedules, iter_schedules
+from fincalc.fees import (
+    FeeBreakEven,
+    FeeInputs,
+    FeeProduct,
+    FeeResult,
+    ProductComparison,
+    breakeven_extra_return,
+    calculate_balance,
+    compare_fees,
+    compare_products,
+    fee_breakeven,
+    fee_final_balance,
+    fee_for_gap,
+    fee_paths,
+    fee_trajectories,
+)
+from fincalc.history import (
+    HistoricalResult,
+    ReturnHistory,
+    block_bootstrap,
+    historical_compound,
+    historical_fees,
+    load_history,
+    rolling_windows,
+)
+from fincalc.money import (
+    HALF_EVEN,
+    HALF_UP,
+    CentsCompoundResult,
+    CentsDebtResult,
+    MoneyBenchmark,
+    amortize_cents,
+    benchmark,
+    compound_cents,
+    divide_round,
+    monthly_interest,
+    to_cents,
+)
+from fincalc.montecarlo import MonteCarloResult, simulate_compound
+from fincalc.multidebt import Debt, MultiDebtPlan, compare_strategies, plan_payoff
+from fincalc.paydates import (
+    PayCalendar,
+    add_months,
+    calendar_years,
+    load_holidays,
+    pay_calendar,
+    scheduled_paydays,
+)
+from fincalc.sensitivity import SensitivityGrid, rate_range, sensitivity_grid
+from fincalc.solve import GoalSeekResult, find_root, goal_seek
+from fincalc.tiers import FeeSchedule, TieredFeeResult, tiered_trajectories
+from fincalc.variable import (
+    RateSchedule,
+    VariableDebtInputs,
+    VariableDebtResult,
+    VariableRateResult,
+    project_variable_debt,
+    variable_rate_payoff,
+)
+
+__all__ = [
+    "COMPOUNDING_FREQUENCIES",
+    "HALF_EVEN",
+    "HALF_UP",
+    "PAY_PERIODS_PER_YEAR",
+    "AcceleratedPayoff",
+    "AmortizationSchedule",
+    "BatchResult",
+    "BiweeklyInputs",
+    "BiweeklyResult",
+    "BulkConversion",
+    "CacheStats",
+    "CentsCompoundResult",
+    "CentsDebtResult",
+    "CompoundInputs",
+    "CompoundResult",
+    "Debt",
+    "DebtInputs",
+    "DebtResult",
+    "ExportStats",
+    "ExtraPaymentSweep",
+    "FeeBreakEven",
+    "FeeInputs",
+    "FeeProduct",
+    "FeeResult",
+    "FeeSchedule",
+    "GoalSeekResult",
+    "HistoricalResult",
+    "MoneyBenchmark",
+    "MonteCarloResult",
+    "MultiDebtPlan",
+    "PayCalendar",
+    "ProductComparison",
+    "RateSchedule",
+    "ResultCache",
+    "ReturnHistory",
+    "SensitivityGrid",
+    "TieredFeeResult",
+    "VariableDebtInputs",
+    "VariableDebtResult",
+    "VariableRateResult",
+    "accelerated_biweekly",
+    "add_months",
+    "amortization_schedule",
+    "amortize_cents",
+    "benchmark",
+    "block_bootstrap",
+    "breakeven_extra_return",
+    "cached",
+    "calculate_balance",
+    "calendar_years",
+    "compare_fees",
+    "compare_products",
+    "compare_strategies",
+    "compound_balance",
+    "compound_cents",
+    "compound_final_balance",
+    "convert_bulk",
+    "convert_to_biweekly",
+    "divide_round",
+    "downsample",
+    "export_schedules",
+    "extra_payment_sweep",
+    "fee_breakeven",
+    "fee_final_balance",
+    "fee_for_gap",
+    "fee_paths",
+    "fee_trajectories",
+    "find_root",
+    "goal_seek",
+    "historical_compound",
+    "historical_fees",
+    "iter_schedules",
+    "level_payment",
+    "load_history",
+    "load_holidays",
+    "lttb_indices",
+    "monthly_interest",
+    "pay_calendar",
+    "payoff_date",
+    "payoff_interest",
+    "payoff_months",
+    "plan_payoff",
+    "project_compound",
+    "project_compound_batch",
+    "project_debt",
+    "project_variable_debt",
+    "rate_range",
+    "remaining_balance",
+    "result_cache",
+    "rolling_windows",
+    "scheduled_paydays",
+    "sensitivity_grid",
+    "simulate_compound",
+    "split_cents",
+    "tiered_trajectories",
+    "to_cents",
+    "variable_rate_payoff",
+]
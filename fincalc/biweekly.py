@@ -0,0 +1,212 @@
+"""Monthly/annual to biweekly payment conversion and accelerated biweekly payoff."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from fincalc.debt import level_payment, payoff_interest, payoff_months, remaining_balance
+from fincalc.money import to_cents
+
+PAY_PERIODS_PER_YEAR = 26
+
+# Interest accrues daily on the balance for the days between two payments
+DAYS_PER_YEAR = 365
+PAYMENT_INTERVAL_DAYS = 14
+# Interest periods a year for the amortization formulas, one per 14-day payment
+ACCRUAL_PERIODS_PER_YEAR = DAYS_PER_YEAR / PAYMENT_INTERVAL_DAYS
+
+MONTHLY = "Monthly"
+ANNUAL = "Annual"
+
+
+@dataclass(frozen=True)
+class BiweeklyInputs:
+    """Amount to convert and whether it is a ``"Monthly"`` or ``"Annual"`` figure."""
+
+    amount: float
+    input_type: str = MONTHLY
+
+
+@dataclass(frozen=True)
+class BiweeklyResult:
+    """Biweekly equivalent of a monthly or annual amount."""
+
+    inputs: BiweeklyInputs
+    biweekly_amount: float
+    annual_equivalent: float
+    pay_periods: int = PAY_PERIODS_PER_YEAR
+
+
+def convert_to_biweekly(inputs: BiweeklyInputs) -> BiweeklyResult:
+    """Spread a monthly (× 12 ÷ 26) or annual (÷ 26) amount over the pay periods."""
+    if inputs.input_type == MONTHLY:
+        annual_equivalent = inputs.amount * 12
+    elif inputs.input_type == ANNUAL:
+        annual_equivalent = inputs.amount
+    else:
+        raise ValueError(f"input_type must be {MONTHLY!r} or {ANNUAL!r}, got {inputs.input_type!r}")
+
+    return BiweeklyResult(
+        inputs=inputs,
+        biweekly_amount=annual_equivalent / PAY_PERIODS_PER_YEAR,
+        annual_equivalent=annual_equivalent,
+    )
+
+
+def split_cents(total_cents, parts: int = PAY_PERIODS_PER_YEAR) -> np.ndarray:
+    """Split each total into ``parts`` whole-cent payments that sum to it exactly.
+
+    The fractional cent is carried from payment to payment: payment ``k`` is
+    floor(k * A / n) - floor((k - 1) * A / n), so payments differ by at most a
+    cent and the extra cents are spread evenly over the year. Returns
+    (totals × parts) int64 cents.
+    """
+    total_cents = np.asarray(total_cents, dtype=np.int64)[..., np.newaxis]
+    cumulative = total_cents * np.arange(parts + 1) // parts
+    return np.diff(cumulative, axis=-1)
+
+
+@dataclass(frozen=True)
+class BulkConversion:
+    """Biweekly payments for many amounts at once, in exact cents.
+
+    ``annual_cents`` is each row's annual total; the 26 payments of a row are
+    ``regular_cents`` plus one cent on ``extra_cent_payments`` of them.
+    """
+
+    annual_cents: np.ndarray
+    regular_cents: np.ndarray
+    extra_cent_payments: np.ndarray
+
+    @property
+    def annual_equivalent(self) -> np.ndarray:
+        return self.annual_cents / 100
+
+    @property
+    def biweekly_amount(self) -> np.ndarray:
+        """The regular payment in dollars."""
+        return self.regular_cents / 100
+
+    def payments(self) -> np.ndarray:
+        """All (rows × 26) payments in cents, summing exactly to ``annual_cents``."""
+        return split_cents(self.annual_cents)
+
+
+def convert_bulk(amounts, input_types=MONTHLY) -> BulkConversion:
+    """Convert a whole roster of monthly or annual amounts in one vectorized pass.
+
+    ``input_types`` is one type for every row or an array of ``"Monthly"`` and
+    ``"Annual"`` (any case; ``"M"``/``"A"`` also accepted). Amounts are
+    rounded to cents first, monthly ones are multiplied by 12 exactly in
+    cents, and the annual total is split with :func:`split_cents`. Raises
+    ``ValueError`` naming the first row with a missing amount or an unknown
+    input type.
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    missing = ~np.isfinite(amounts)
+    if missing.any():
+        raise ValueError(f"row {int(np.flatnonzero(missing)[0]) + 1}: amount is missing or not a number")
+    cents = to_cents(amounts)
+    # A roster has only a handful of distinct labels; normalize those, not every row
+    labels, codes = np.unique(np.asarray(input_types, dtype=str), return_inverse=True)
+    kinds = np.char.lower(np.char.strip(labels))
+    monthly = np.isin(kinds, ("monthly", "m"))[codes].reshape(np.shape(input_types))
+    annual = np.isin(kinds, ("annual", "a"))[codes].reshape(np.shape(input_types))
+    monthly, annual = np.broadcast_to(monthly, cents.shape), np.broadcast_to(annual, cents.shape)
+    unknown = ~(monthly | annual)
+    if unknown.any():
+        row = int(np.flatnonzero(unknown)[0])
+        label = np.broadcast_to(np.asarray(input_types, dtype=str), cents.shape)[row]
+        raise ValueError(f"row {row + 1}: input type must be {MONTHLY!r} or {ANNUAL!r}, got {label!r}")
+
+    annual_cents = np.where(monthly, cents * 12, cents)
+    regular_cents, extra_cent_payments = np.divmod(annual_cents, PAY_PERIODS_PER_YEAR)
+    return BulkConversion(
+        annual_cents=annual_cents,
+        regular_cents=regular_cents,
+        extra_cent_payments=extra_cent_payments,
+    )
+
+
+@dataclass(frozen=True)
+class AcceleratedPayoff:
+    """Monthly amortization against half the payment every two weeks, per loan.
+
+    All fields are arrays with one entry per loan. Paying half the monthly
+    payment every 14 days makes 26 half payments, or 13 monthly payments, a
+    year; ``biweekly_payments`` is the fractional number of payments until the
+    loan is repaid.
+    """
+
+    loan_balance: np.ndarray
+    annual_rate: np.ndarray
+    term_years: np.ndarray
+    monthly_payment: np.ndarray
+    biweekly_payment: np.ndarray
+    monthly_interest: np.ndarray
+    biweekly_payments: np.ndarray
+    biweekly_interest: np.ndarray
+
+    @property
+    def biweekly_years(self) -> np.ndarray:
+        return self.biweekly_payments * PAYMENT_INTERVAL_DAYS / DAYS_PER_YEAR
+
+    @property
+    def years_saved(self) -> np.ndarray:
+        return self.term_years - self.biweekly_years
+
+    @property
+    def interest_saved(self) -> np.ndarray:
+        return self.monthly_interest - self.biweekly_interest
+
+    def monthly_balance(self, years) -> np.ndarray:
+        """Balance under monthly payments after each of ``years``: (loans × points)."""
+        months = np.minimum(np.floor(np.asarray(years, dtype=float) * 12 + 1e-9), self.term_years[:, np.newaxis] * 12)
+        balance = remaining_balance(
+            self.loan_balance[:, np.newaxis], self.annual_rate[:, np.newaxis], self.monthly_payment[:, np.newaxis], months
+        )
+        return np.maximum(balance, 0.0)
+
+    def biweekly_balance(self, years) -> np.ndarray:
+        """Balance under biweekly payments after each of ``years``: (loans × points)."""
+        payments = np.floor(np.asarray(years, dtype=float) * DAYS_PER_YEAR / PAYMENT_INTERVAL_DAYS + 1e-9)
+        balance = remaining_balance(
+            self.loan_balance[:, np.newaxis],
+            self.annual_rate[:, np.newaxis],
+            self.biweekly_payment[:, np.newaxis],
+            payments,
+            ACCRUAL_PERIODS_PER_YEAR,
+        )
+        paid_off = payments >= self.biweekly_payments[:, np.newaxis]
+        return np.where(paid_off, 0.0, np.maximum(balance, 0.0))
+
+
+def accelerated_biweekly(loan_balance, annual_rate, term_years) -> AcceleratedPayoff:
+    """Compare monthly amortization with paying half the payment every two weeks.
+
+    Vectorized over loans: every argument may be an array, and the result
+    holds one entry per loan. Between two biweekly payments interest accrues
+    daily at ``annual_rate / 365`` on the outstanding balance for 14 days.
+    Payoff time and interest come from the closed-form amortization formulas
+    applied per payment period, so thousands of loans cost one array pass.
+    """
+    loan_balance, annual_rate, term_years = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(loan_balance, dtype=float)),
+        np.asarray(annual_rate, dtype=float),
+        np.asarray(term_years, dtype=float),
+    )
+    months = term_years * 12
+    monthly_payment = level_payment(loan_balance, annual_rate, months)
+    biweekly_payment = monthly_payment / 2
+
+    biweekly_payments = payoff_months(loan_balance, annual_rate, biweekly_payment, ACCRUAL_PERIODS_PER_YEAR)
+    return AcceleratedPayoff(
+        loan_balance=loan_balance,
+        annual_rate=annual_rate,
+        term_years=term_years,
+        monthly_payment=monthly_payment,
+        biweekly_payment=biweekly_payment,
+        monthly_interest=monthly_payment * months - loan_balance,
+        biweekly_payments=biweekly_payments,
+        biweekly_interest=payoff_interest(loan_balance, biweekly_payment, biweekly_payments),
+    )
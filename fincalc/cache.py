@@ -0,0 +1,273 @@
+"""Shared, content-addressed cache for calculator results."""
+
+import copy
+import dataclasses
+import datetime
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+DEFAULT_MAXSIZE = int(os.environ.get("FINCALC_CACHE_SIZE", "512"))
+DEFAULT_TTL = float(os.environ.get("FINCALC_CACHE_TTL", "3600"))
+# Bound on the array memory held across all entries; Monte Carlo results run to many MB each
+DEFAULT_MAXBYTES = int(os.environ.get("FINCALC_CACHE_BYTES", str(256 * 2 ** 20)))
+
+# Marks an argument of ResultCache.configure() that was not passed
+_UNSET = object()
+
+# Inputs that agree to this many significant digits share a cache entry
+KEY_PRECISION = 12
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters of a :class:`ResultCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    ttl: Optional[float]
+    nbytes: int = 0
+    maxbytes: Optional[int] = None
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def normalize(value):
+    """Reduce ``value`` to a hashable, canonical form for use in a cache key."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__qualname__,) + tuple(
+            (field.name, normalize(getattr(value, field.name))) for field in dataclasses.fields(value)
+        )
+    if isinstance(value, (bool, str, type(None))):
+        return value
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, (datetime.date, datetime.time, datetime.timedelta, np.datetime64, np.timedelta64)):
+        # Tagged with the type so a date never matches the datetime at its midnight
+        return (type(value).__name__, str(value))
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        number = float(f"{float(value):.{KEY_PRECISION}g}")
+        # Collapse -0.0 onto 0.0
+        return number + 0.0
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, normalize(item)) for key, item in value.items()))
+    raise TypeError(f"cannot build a cache key from {type(value).__name__}")
+
+
+def _owner(array: np.ndarray) -> np.ndarray:
+    """The array whose buffer ``array`` views, or ``array`` itself."""
+    while isinstance(array.base, np.ndarray):
+        array = array.base
+    return array
+
+
+def _buffers(value, found=None) -> set:
+    """Ids of the buffers behind every array reachable from ``value``."""
+    if found is None:
+        found = set()
+    if isinstance(value, np.ndarray):
+        found.add(id(_owner(value)))
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        for field in dataclasses.fields(value):
+            _buffers(getattr(value, field.name), found)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _buffers(item, found)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _buffers(item, found)
+    return found
+
+
+def _freeze(value, seen=None, foreign=frozenset()):
+    """Make every array reachable from a cached result read-only, since every caller shares them.
+
+    Walks dataclass fields, lists, tuples and dict values to any depth.
+    Arrays on a buffer listed in ``foreign`` (the caller's own inputs) are
+    copied first, so the caller's arrays stay writable and later changes to
+    them cannot reach the cache; containers holding such a copy are rebuilt.
+    Returns ``(value, nbytes)``, the bytes the arrays keep alive, counting the
+    buffer a view was taken from once.
+    """
+    if seen is None:
+        seen = set()
+    if isinstance(value, np.ndarray):
+        if id(_owner(value)) in foreign:
+            value = value.copy()
+        value.setflags(write=False)
+        owner = _owner(value)
+        if id(owner) in seen:
+            return value, 0
+        seen.add(id(owner))
+        return value, owner.nbytes
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        nbytes = 0
+        changed = {}
+        for field in dataclasses.fields(value):
+            item = getattr(value, field.name)
+            frozen, size = _freeze(item, seen, foreign)
+            nbytes += size
+            if frozen is not item:
+                changed[field.name] = frozen
+        if changed:
+            value = copy.copy(value)
+            for name, item in changed.items():
+                # Frozen dataclasses refuse setattr; this is a private copy
+                object.__setattr__(value, name, item)
+        return value, nbytes
+    if isinstance(value, (list, tuple, dict)):
+        keys = list(value) if isinstance(value, dict) else range(len(value))
+        frozen = [_freeze(value[key], seen, foreign) for key in keys]
+        nbytes = sum(size for _, size in frozen)
+        if all(item is value[key] for key, (item, _) in zip(keys, frozen)):
+            return value, nbytes
+        items = [item for item, _ in frozen]
+        if isinstance(value, dict):
+            return type(value)(zip(keys, items)), nbytes
+        if hasattr(value, "_fields"):
+            return type(value)(*items), nbytes
+        return type(value)(items), nbytes
+    return value, 0
+
+
+class ResultCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry.
+
+    ``maxsize`` bounds the number of entries and ``maxbytes`` the array memory
+    they hold, least recently used going first; a result larger than
+    ``maxbytes`` on its own is returned without being cached. ``ttl`` is in
+    seconds, and ``None`` keeps entries until they are evicted; ``maxbytes=None``
+    lifts the memory bound.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, ttl: Optional[float] = DEFAULT_TTL,
+                 maxbytes: Optional[int] = DEFAULT_MAXBYTES):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxbytes = maxbytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get_or_compute(self, key, compute, inputs=None):
+        """Return the cached value for ``key``, calling ``compute()`` on a miss.
+
+        Arrays of the result that share memory with arrays in ``inputs`` are
+        cached as read-only copies, leaving the caller's own arrays alone.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > now):
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                self._nbytes -= self._entries.pop(key)[2]
+            self._misses += 1
+
+        # Compute outside the lock so slow calculations do not serialize sessions
+        value, nbytes = _freeze(compute(), foreign=_buffers(inputs))
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self._lock:
+            if self.maxbytes is not None and nbytes > self.maxbytes:
+                return value
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[2]
+            self._entries[key] = (expires, value, nbytes)
+            self._nbytes += nbytes
+            self._evict()
+        return value
+
+    def _evict(self):
+        """Drop least recently used entries until both bounds hold; call with the lock held."""
+        while len(self._entries) > self.maxsize or (self.maxbytes is not None and self._nbytes > self.maxbytes):
+            self._nbytes -= self._entries.popitem(last=False)[1][2]
+            self._evictions += 1
+
+    def configure(self, maxsize: Optional[int] = None, ttl=_UNSET, maxbytes=_UNSET):
+        """Change the size bounds and/or TTL, evicting entries that no longer fit."""
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 1:
+                    raise ValueError(f"maxsize must be positive, got {maxsize}")
+                self.maxsize = maxsize
+            if ttl is not _UNSET:
+                self.ttl = ttl
+            if maxbytes is not _UNSET:
+                self.maxbytes = maxbytes
+            self._evict()
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self._hits = self._misses = self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+                ttl=self.ttl,
+                nbytes=self._nbytes,
+                maxbytes=self.maxbytes,
+            )
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache shared by every session and every cached calculator
+result_cache = ResultCache()
+
+
+def cached(func=None, *, cache: Optional[ResultCache] = None):
+    """Decorator that serves repeat calls of ``func`` from a :class:`ResultCache`.
+
+    The key is the function itself plus the normalized arguments, so equal
+    inputs from different callers share one entry while two lambdas or local
+    functions with the same qualified name never do. The key holds on to the
+    function, so its identity cannot be reused while its entries live.
+    Defaults to :data:`result_cache`.
+    """
+    if func is None:
+        return functools.partial(cached, cache=cache)
+
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        store = result_cache if cache is None else cache
+        key = (name, func, normalize(args), normalize(kwargs))
+        return store.get_or_compute(key, lambda: func(*args, **kwargs), inputs=(args, kwargs))
+
+    wrapper.uncached = func
+    return wrapper
@@ -0,0 +1,379 @@
+"""Command-line batch runner: stream a CSV through a calculator.
+
+Usage::
+
+    python -m fincalc compound clients.csv -o results.csv
+    python -m fincalc fees portfolios.csv -o results.csv --workers 4
+    python -m fincalc debt loans.csv > results.csv
+    python -m fincalc biweekly roster.csv -o payroll.csv --payments
+    python -m fincalc schedule loans.csv -o schedules.parquet --progress
+
+The input is read and written one chunk of rows at a time, so memory use does
+not grow with the file. Each output row is the input row followed by the
+calculator's result columns, except for ``schedule``, which writes every
+loan's month-by-month amortization schedule as CSV or Parquet. Throughput is
+reported on stderr at the end.
+Records must not span lines (no newlines inside quoted fields), since chunks
+are cut on line boundaries before they are parsed.
+"""
+
+import argparse
+import csv
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+from fincalc.biweekly import MONTHLY, PAY_PERIODS_PER_YEAR, convert_bulk
+from fincalc.compound import ANNUALLY, END, START, compound_final_balance
+from fincalc.debt import payoff_interest, payoff_months
+from fincalc.export import export_schedules, iter_schedules
+from fincalc.fees import fee_final_balance
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+SCHEDULE = "schedule"
+
+# Input columns read as text rather than numbers
+TEXT_COLUMNS = ("input_type",)
+
+
+class InputError(ValueError):
+    """A malformed input row; reported as a one-line error rather than a traceback."""
+
+
+def _compound(columns, options):
+    months = np.round(columns["years"] * 12)
+    compounding = columns.get("compounding", ANNUALLY)
+    final_balance = compound_final_balance(
+        columns["initial_amount"],
+        columns["annual_rate"],
+        columns["monthly_contribution"],
+        months,
+        compounding,
+        options.timing,
+    )
+    total_contributions = columns["initial_amount"] + columns["monthly_contribution"] * months
+    total_interest = final_balance - total_contributions
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roi = np.where(total_contributions > 0, total_interest / total_contributions * 100, 0.0)
+    return {
+        "final_balance": final_balance,
+        "total_contributions": total_contributions,
+        "total_interest": total_interest,
+        "roi": roi,
+    }
+
+
+def _fees(columns, options):
+    args = (columns["starting_amount"], columns["monthly_contribution"], columns["expected_return"])
+    total_self = fee_final_balance(*args, columns["self_managed_fee"], columns["years"])
+    total_advisor = fee_final_balance(*args, columns["advisor_fee"], columns["years"])
+    total_no_fees = fee_final_balance(*args, 0.0, columns["years"])
+    return {
+        "total_self": total_self,
+        "total_advisor": total_advisor,
+        "total_no_fees": total_no_fees,
+        "fee_difference": total_self - total_advisor,
+        "fees_self_paid": total_no_fees - total_self,
+        "fees_advisor_paid": total_no_fees - total_advisor,
+    }
+
+
+def _debt(columns, options):
+    total_debt = columns["total_debt"]
+    payment = columns["monthly_payment"]
+    total_payment = payment + columns.get("extra_payment", 0.0)
+    months_standard = payoff_months(total_debt, columns["annual_rate"], payment)
+    months_extra = payoff_months(total_debt, columns["annual_rate"], total_payment)
+    interest_standard = payoff_interest(total_debt, payment, months_standard)
+    interest_extra = payoff_interest(total_debt, total_payment, months_extra)
+    # Debts never repaid either way have no meaningful savings (inf - inf = nan)
+    with np.errstate(invalid="ignore"):
+        return {
+            "months_standard": months_standard,
+            "months_extra": months_extra,
+            "total_interest_standard": interest_standard,
+            "total_interest_extra": interest_extra,
+            "months_saved": months_standard - months_extra,
+            "interest_saved": interest_standard - interest_extra,
+        }
+
+
+def _biweekly(columns, options):
+    amounts = columns["amount"]
+    input_types = columns.get("input_type", np.full(len(amounts), MONTHLY))
+    annual = np.full(len(amounts), np.nan)
+    regular = np.full(len(amounts), np.nan)
+    extra = np.full(len(amounts), np.nan)
+    payments = np.full((len(amounts), PAY_PERIODS_PER_YEAR), np.nan)
+    # Rows with a missing amount or an unknown type come out as nan, like unpayable debts
+    for label in np.unique(input_types):
+        rows = (input_types == label) & np.isfinite(amounts)
+        try:
+            result = convert_bulk(amounts[rows], label)
+        except ValueError:
+            continue
+        annual[rows] = result.annual_equivalent
+        regular[rows] = result.biweekly_amount
+        extra[rows] = result.extra_cent_payments
+        if options.payments:
+            payments[rows] = result.payments() / 100
+    results = {
+        "annual_equivalent": annual,
+        "biweekly_payment": regular,
+        "payments_plus_one_cent": extra,
+    }
+    if options.payments:
+        results.update((f"payment_{period}", payments[:, period - 1]) for period in range(1, PAY_PERIODS_PER_YEAR + 1))
+    return results
+
+
+# name -> (function, required columns, optional columns)
+CALCULATORS = {
+    "compound": (
+        _compound,
+        ("initial_amount", "annual_rate", "monthly_contribution", "years"),
+        ("compounding",),
+    ),
+    "fees": (
+        _fees,
+        ("starting_amount", "monthly_contribution", "expected_return", "self_managed_fee", "advisor_fee", "years"),
+        (),
+    ),
+    "debt": (
+        _debt,
+        ("total_debt", "annual_rate", "monthly_payment"),
+        ("extra_payment",),
+    ),
+    "biweekly": (
+        _biweekly,
+        ("amount",),
+        ("input_type",),
+    ),
+}
+
+
+def _parse(header, block, names, first_line=2):
+    """Raw CSV lines -> {column: float array} for the ``names`` present in ``header``.
+
+    ``first_line`` is the file line number of the block's first line; a short
+    row or a blank or non-numeric cell raises :class:`InputError` naming the
+    line and column.
+    """
+    numbered = [(number, line) for number, line in enumerate(block.splitlines(), start=first_line) if line.strip()]
+    rows = list(csv.reader(line for _, line in numbered))
+    for (number, _), row in zip(numbered, rows):
+        if len(row) < len(header):
+            raise InputError(f"line {number}: expected {len(header)} fields, got {len(row)}")
+
+    columns = {}
+    for name in names:
+        if name not in header:
+            continue
+        values = [row[header.index(name)] for row in rows]
+        if name in TEXT_COLUMNS:
+            columns[name] = np.array(values, dtype=str)
+            continue
+        try:
+            columns[name] = np.array(values, dtype=float)
+        except ValueError:
+            for (number, _), value in zip(numbered, values):
+                try:
+                    float(value)
+                except ValueError:
+                    raise InputError(f"line {number}, column {name!r}: {value!r} is not a number") from None
+    return columns, rows
+
+
+def process_chunk(calculator, header, block, options, first_line=2):
+    """Run a block of CSV text through ``calculator``; returns the output CSV text.
+
+    Chunks travel as raw text so that parsing and formatting, the bulk of the
+    work, happen in whichever process runs the chunk. ``first_line`` numbers
+    the block's lines in error messages.
+    """
+    func, required, optional = CALCULATORS[calculator]
+    lines = [line for line in block.splitlines() if line.strip()]
+    columns, rows = _parse(header, block, required + optional, first_line)
+
+    results = func(columns, options)
+    formatted = [[f"{value:.{options.precision}f}" for value in values] for values in results.values()]
+
+    # Input records are copied through verbatim; results are plain numbers
+    output = "".join(f"{line},{','.join(values)}\r\n" for line, values in zip(lines, zip(*formatted)))
+    return len(rows), output
+
+
+def _chunks(source, chunk_size):
+    """Blocks of ``chunk_size`` raw lines."""
+    lines = []
+    for line in source:
+        lines.append(line)
+        if len(lines) == chunk_size:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+
+
+def _open(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="")
+
+
+def run(options) -> int:
+    """Stream ``options.input`` to ``options.output``; returns the number of rows."""
+    func, required, optional = CALCULATORS[options.calculator]
+    source = _open(options.input, "r")
+    target = _open(options.output, "w")
+    try:
+        header = [name.strip() for name in next(csv.reader([source.readline()]), [])]
+        missing = [name for name in required if name not in header]
+        if missing:
+            raise SystemExit(f"{options.input}: missing column(s) {', '.join(missing)}")
+
+        result_columns = list(func({name: np.zeros(1) for name in required}, options))
+        csv.writer(target).writerow(header + result_columns)
+
+        chunks = _chunks(source, options.chunk_size)
+        if options.workers > 1:
+            return _run_parallel(chunks, header, target, options)
+
+        rows = 0
+        line = 2
+        for block in chunks:
+            count, text = process_chunk(options.calculator, header, block, options, line)
+            target.write(text)
+            rows += count
+            line += block.count("\n")
+        return rows
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+def run_schedule(options) -> int:
+    """Export the amortization schedule of every loan in ``options.input``.
+
+    Takes the ``debt`` columns plus an optional ``loan_id``; the extra payment,
+    if given, is added to the monthly payment. Loans that can't be amortized
+    are reported on stderr and left out; the export fails only if no loan is
+    left. Returns the number of rows.
+    """
+    required, optional = CALCULATORS["debt"][1:]
+    source = _open(options.input, "r")
+    try:
+        header = [name.strip() for name in next(csv.reader([source.readline()]), [])]
+        missing = [name for name in required if name not in header]
+        if missing:
+            raise SystemExit(f"{options.input}: missing column(s) {', '.join(missing)}")
+
+        skipped = []
+
+        def skip(loan_id, reason):
+            skipped.append(loan_id)
+            print(f"\rloan {loan_id} skipped: {reason}", file=sys.stderr, flush=True)
+
+        def chunks():
+            numbered = 0
+            line = 2
+            for block in _chunks(source, options.chunk_size):
+                columns, rows = _parse(header, block, required + optional, line)
+                line += block.count("\n")
+                if "loan_id" in header:
+                    loan_ids = np.array([row[header.index("loan_id")] for row in rows])
+                else:
+                    loan_ids = np.arange(numbered + 1, numbered + len(rows) + 1)
+                numbered += len(rows)
+                payment = columns["monthly_payment"] + columns.get("extra_payment", 0.0)
+                yield from iter_schedules(
+                    columns["total_debt"], columns["annual_rate"], payment, loan_ids, options.start, on_skip=skip
+                )
+
+        def report(rows, loans):
+            print(f"\r{rows:,} rows from {loans:,} loans", end="", file=sys.stderr, flush=True)
+
+        try:
+            stats = export_schedules(
+                chunks(), options.output, options.format, options.precision, report if options.progress else None
+            )
+        except InputError:
+            raise
+        except (ValueError, ImportError) as error:
+            raise SystemExit(str(error))
+        if options.progress:
+            print(file=sys.stderr)
+        if skipped:
+            if not stats.loans:
+                raise SystemExit(f"{options.input}: no loan could be amortized ({len(skipped):,} skipped)")
+            print(f"{len(skipped):,} loan(s) skipped", file=sys.stderr)
+        return stats.rows
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def _run_parallel(chunks, header, target, options):
+    """Process chunks on a pool, keeping at most two per worker in flight."""
+    import multiprocessing
+
+    rows = 0
+    line = 2
+    with multiprocessing.Pool(options.workers) as pool:
+        pending = deque()
+        for block in chunks:
+            pending.append(pool.apply_async(process_chunk, (options.calculator, header, block, options, line)))
+            line += block.count("\n")
+            if len(pending) >= 2 * options.workers:
+                count, text = pending.popleft().get()
+                target.write(text)
+                rows += count
+        while pending:
+            count, text = pending.popleft().get()
+            target.write(text)
+            rows += count
+    return rows
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m fincalc", description=__doc__.splitlines()[0])
+    parser.add_argument("calculator", choices=sorted([*CALCULATORS, SCHEDULE]), help="calculator to run")
+    parser.add_argument("input", help="input CSV with a header row ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-", help="output CSV (default: stdout)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=1, help="process-parallel chunk workers")
+    parser.add_argument("--timing", choices=(START, END), default=START,
+                        help="compound: contributions at the start or end of each month")
+    parser.add_argument("--precision", type=int, default=2, help="decimal places in result columns")
+    parser.add_argument("--start", default=None, help="schedule: date the loans are opened, YYYY-MM-DD (default: today)")
+    parser.add_argument("--format", choices=("csv", "parquet"), default=None,
+                        help="schedule: output format (default: from the output file extension)")
+    parser.add_argument("--progress", action="store_true", help="schedule: report progress on stderr")
+    parser.add_argument("--payments", action="store_true", help="biweekly: add all 26 payments of every row")
+    return parser
+
+
+def main(argv=None) -> int:
+    options = build_parser().parse_args(argv)
+    if options.chunk_size < 1:
+        raise SystemExit("--chunk-size must be positive")
+    if options.workers < 1:
+        raise SystemExit("--workers must be positive")
+
+    if options.calculator == SCHEDULE and options.output == "-":
+        raise SystemExit("schedule needs an output file (-o)")
+
+    start = time.perf_counter()
+    try:
+        rows = run_schedule(options) if options.calculator == SCHEDULE else run(options)
+    except InputError as error:
+        raise SystemExit(f"{options.input}: {error}")
+    elapsed = time.perf_counter() - start
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"{rows:,} rows in {elapsed:.2f} s ({rate:,.0f} rows/s)", file=sys.stderr)
+    return 0
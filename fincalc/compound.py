@@ -0,0 +1,171 @@
+"""Compound interest projection."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# Compounding periods per year
+DAILY = 365
+WEEKLY = 52
+MONTHLY = 12
+QUARTERLY = 4
+ANNUALLY = 1
+
+COMPOUNDING_FREQUENCIES = {
+    "Daily": DAILY,
+    "Weekly": WEEKLY,
+    "Monthly": MONTHLY,
+    "Quarterly": QUARTERLY,
+    "Annually": ANNUALLY,
+}
+
+# When in each month the contribution is made
+START = "start"
+END = "end"
+
+# Guards the month counts below against float noise in period / periods_per_year
+_TIME_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class CompoundInputs:
+    """Inputs of the compound interest calculator.
+
+    ``years`` may be fractional; it is rounded to whole months (a goal seek on
+    the horizon solves for months and stores them here as months / 12).
+    """
+
+    initial_amount: float
+    annual_rate: float
+    monthly_contribution: float
+    years: float
+    compounding: int = ANNUALLY
+    contribution_timing: str = START
+
+
+@dataclass(frozen=True)
+class CompoundResult:
+    """Projection sampled once per period; index 0 is the starting state.
+
+    Periods are compounding periods for daily, weekly and monthly compounding,
+    and months for the coarser frequencies.
+    """
+
+    inputs: CompoundInputs
+    periods_per_year: int
+    periods: np.ndarray
+    balance: np.ndarray
+    contributions: np.ndarray
+    interest: np.ndarray
+
+    @property
+    def months(self) -> np.ndarray:
+        """Elapsed time of each sample in (possibly fractional) months."""
+        return self.periods * 12 / self.periods_per_year
+
+    @property
+    def final_balance(self) -> float:
+        return float(self.balance[-1])
+
+    @property
+    def total_contributions(self) -> float:
+        return float(self.contributions[-1])
+
+    @property
+    def total_interest(self) -> float:
+        return self.final_balance - self.total_contributions
+
+    @property
+    def roi(self) -> float:
+        """Interest earned as a percentage of everything contributed."""
+        if self.total_contributions > 0:
+            return self.total_interest / self.total_contributions * 100
+        return 0.0
+
+
+def _check_timing(timing):
+    if timing not in (START, END):
+        raise ValueError(f"contribution timing must be {START!r} or {END!r}, got {timing!r}")
+
+
+def compound_balance(initial_amount, annual_rate, monthly_contribution, elapsed_years, contributions_made,
+                     compounding=ANNUALLY, timing=START):
+    """Balance after ``elapsed_years`` once ``contributions_made`` monthly deposits are in.
+
+    The rate compounds ``compounding`` times a year, and money deposited between
+    compounding dates grows by the matching fraction of a period, so a balance
+    grows by exp(L * t) over t years with L = m * log1p(r / m). The deposits form
+    a geometric series, summed in closed form with ``expm1`` of negative
+    exponents; nothing is raised to a large power, so long horizons and fine
+    frequencies neither overflow nor lose precision. Every argument except
+    ``timing`` may be an array, which makes this O(1) per evaluated point.
+    """
+    _check_timing(timing)
+    elapsed_years = np.asarray(elapsed_years, dtype=float)
+    contributions_made = np.asarray(contributions_made, dtype=float)
+    compounding = np.asarray(compounding, dtype=float)
+    log_growth = compounding * np.log1p(np.asarray(annual_rate, dtype=float) / 100 / compounding)
+
+    first_deposit = 0.0 if timing == START else 1 / 12
+    step = -log_growth / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        deposits = np.where(step != 0, np.expm1(step * contributions_made) / np.expm1(step), contributions_made)
+
+    return (
+        initial_amount * np.exp(log_growth * elapsed_years)
+        + monthly_contribution * np.exp(log_growth * (elapsed_years - first_deposit)) * deposits
+    )
+
+
+def compound_final_balance(initial_amount, annual_rate, monthly_contribution, months,
+                           compounding=ANNUALLY, timing=START):
+    """Closed-form balance after ``months`` months; every argument but ``timing`` may be an array."""
+    months = np.asarray(months, dtype=float)
+    return compound_balance(
+        initial_amount, annual_rate, monthly_contribution, months / 12, months, compounding, timing
+    )
+
+
+def contributions_made(elapsed_months, timing=START):
+    """Number of monthly deposits made after ``elapsed_months`` (array-friendly).
+
+    Start-of-month deposits count once their month has begun, end-of-month
+    deposits once it is over.
+    """
+    _check_timing(timing)
+    elapsed_months = np.asarray(elapsed_months, dtype=float)
+    if timing == START:
+        return np.ceil(elapsed_months - _TIME_EPSILON)
+    return np.floor(elapsed_months + _TIME_EPSILON)
+
+
+def project_compound(inputs: CompoundInputs) -> CompoundResult:
+    """Project balance, contributions and interest at every period of the horizon.
+
+    Each sample is evaluated independently with :func:`compound_balance`, so the
+    cost is linear in the number of periods (about 18k for 50 years of daily
+    compounding) instead of re-summing every earlier contribution per period.
+    """
+    periods_per_year = max(inputs.compounding, MONTHLY)
+    periods = np.arange(int(round(inputs.years * periods_per_year)) + 1)
+    elapsed_years = periods / periods_per_year
+    made = contributions_made(elapsed_years * 12, inputs.contribution_timing)
+
+    balance = compound_balance(
+        inputs.initial_amount,
+        inputs.annual_rate,
+        inputs.monthly_contribution,
+        elapsed_years,
+        made,
+        inputs.compounding,
+        inputs.contribution_timing,
+    )
+    contributions = inputs.initial_amount + inputs.monthly_contribution * made
+    return CompoundResult(
+        inputs=inputs,
+        periods_per_year=periods_per_year,
+        periods=periods,
+        balance=balance,
+        contributions=contributions,
+        interest=balance - contributions,
+    )
@@ -0,0 +1,284 @@
+"""Debt-free date calculation."""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+
+# Average month length used to turn a month count into a calendar date
+DAYS_PER_MONTH = 30.44
+
+# Payments a year the amortization formulas assume unless told otherwise
+MONTHS_PER_YEAR = 12
+
+
+@dataclass(frozen=True)
+class DebtInputs:
+    """Inputs of the debt-free date calculator."""
+
+    total_debt: float
+    annual_rate: float
+    monthly_payment: float
+    extra_payment: float = 0.0
+
+
+@dataclass(frozen=True)
+class DebtResult:
+    """Payoff summary plus the remaining-balance series of both scenarios."""
+
+    inputs: DebtInputs
+    months_standard: float
+    months_extra: float
+    total_interest_standard: float
+    total_interest_extra: float
+    month_numbers: np.ndarray
+    balance_standard: np.ndarray
+    balance_extra: np.ndarray
+    schedule: "AmortizationSchedule"
+
+    @property
+    def months_saved(self) -> float:
+        return self.months_standard - self.months_extra
+
+    @property
+    def interest_saved(self) -> float:
+        return self.total_interest_standard - self.total_interest_extra
+
+
+@dataclass(frozen=True)
+class ExtraPaymentSweep:
+    """Payoff time and interest for every extra payment in ``extra_payments``."""
+
+    inputs: DebtInputs
+    extra_payments: np.ndarray
+    months: np.ndarray
+    total_interest: np.ndarray
+
+    @property
+    def baseline_months(self) -> float:
+        """Payoff time with no extra payment at all."""
+        return float(payoff_months(self.inputs.total_debt, self.inputs.annual_rate, self.inputs.monthly_payment))
+
+    @property
+    def months_saved(self) -> np.ndarray:
+        return self.baseline_months - self.months
+
+    @property
+    def interest_saved(self) -> np.ndarray:
+        baseline = payoff_interest(self.inputs.total_debt, self.inputs.monthly_payment, self.baseline_months)
+        return baseline - self.total_interest
+
+    @property
+    def marginal_interest_saved(self) -> np.ndarray:
+        """Interest saved per additional dollar of extra payment, at each point of the sweep."""
+        if len(self.extra_payments) < 2:
+            return np.zeros_like(self.total_interest)
+        return -np.gradient(self.total_interest, self.extra_payments)
+
+
+def payoff_date(months: float, start: Optional[datetime] = None) -> datetime:
+    """Approximate calendar date ``months`` months after ``start`` (default: now)."""
+    start = datetime.now() if start is None else start
+    return start + timedelta(days=months * DAYS_PER_MONTH)
+
+
+def payoff_months(total_debt, annual_rate, monthly_payment, periods_per_year=MONTHS_PER_YEAR):
+    """Fractional months to repay ``total_debt``; vectorized, rate in percent.
+
+    Uses n = -log(1 - D * i / P) / log(1 + i) for a monthly rate i > 0 and D / P
+    without interest. Loans whose payment never covers the interest get ``inf``.
+    With ``periods_per_year`` the payment is made that often instead, i is
+    the rate per payment and the result counts payments rather than months.
+    """
+    total_debt = np.asarray(total_debt, dtype=float)
+    monthly_payment = np.asarray(monthly_payment, dtype=float)
+    monthly_rate = np.asarray(annual_rate, dtype=float) / 100 / periods_per_year
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        amortized = -np.log1p(-(total_debt * monthly_rate) / monthly_payment) / np.log1p(monthly_rate)
+        months = np.where(monthly_rate > 0, amortized, total_debt / monthly_payment)
+    return np.where(np.isnan(months) | (months < 0), np.inf, months)
+
+
+def payoff_interest(total_debt, monthly_payment, months):
+    """Total interest paid over a (fractional) payoff time; vectorized.
+
+    Debts that are never repaid (``months`` is ``inf``) accrue ``inf`` interest.
+    """
+    months = np.asarray(months, dtype=float)
+    with np.errstate(invalid="ignore"):
+        interest = np.asarray(monthly_payment, dtype=float) * months - total_debt
+    return np.where(np.isinf(months), np.inf, interest)
+
+
+@dataclass(frozen=True)
+class AmortizationSchedule:
+    """Month-by-month schedule of several payment scenarios on the same debt.
+
+    Every array is (scenarios × months); column ``k`` describes payment ``k + 1``.
+    Months after a scenario's payoff are masked out: ``active`` is False there
+    and payment, interest, principal and balance are all zero.
+    """
+
+    month_numbers: np.ndarray
+    payment: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+    active: np.ndarray
+    payoff_month: np.ndarray
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self.interest.sum(axis=1)
+
+    @property
+    def total_paid(self) -> np.ndarray:
+        return self.payment.sum(axis=1)
+
+
+def remaining_balance(total_debt, annual_rate, monthly_payment, payments_made, periods_per_year=MONTHS_PER_YEAR):
+    """Balance after ``payments_made`` payments, in closed form; vectorized.
+
+    B_k = D + (D * i - P) * ((1 + i)^k - 1) / i, evaluated with ``expm1`` and
+    ``log1p`` so small rates keep their precision and a zero rate reduces to
+    D - P * k. Not clamped at zero, so it turns negative once the debt is paid.
+    The rate per payment i is the annual rate over ``periods_per_year``.
+    """
+    total_debt = np.asarray(total_debt, dtype=float)
+    monthly_payment = np.asarray(monthly_payment, dtype=float)
+    monthly_rate = np.asarray(annual_rate, dtype=float) / 100 / periods_per_year
+    payments_made = np.asarray(payments_made, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = np.where(
+            monthly_rate > 0,
+            np.expm1(payments_made * np.log1p(monthly_rate)) / monthly_rate,
+            payments_made,
+        )
+    return total_debt + (total_debt * monthly_rate - monthly_payment) * growth
+
+
+def level_payment(total_debt, annual_rate, months, periods_per_year=MONTHS_PER_YEAR):
+    """Level monthly payment that repays ``total_debt`` in ``months`` payments; vectorized.
+
+    P = D * i / (1 - (1 + i)^-n), or D / n without interest. A debt with no
+    payments left is repaid in a single payment of the whole balance. The
+    rate per payment i is the annual rate over ``periods_per_year``.
+    """
+    total_debt = np.asarray(total_debt, dtype=float)
+    monthly_rate = np.asarray(annual_rate, dtype=float) / 100 / periods_per_year
+    months = np.asarray(months, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(
+            monthly_rate > 0,
+            -np.expm1(-months * np.log1p(monthly_rate)) / monthly_rate,
+            months,
+        )
+        return np.where(months > 0, total_debt / annuity, total_debt)
+
+
+def amortization_schedule(total_debt, annual_rate, monthly_payments, months: Optional[int] = None) -> AmortizationSchedule:
+    """Amortize one debt under every payment in ``monthly_payments`` at once.
+
+    Balances come from :func:`remaining_balance` for the whole (scenarios ×
+    months) grid with no month-by-month loop; interest and principal are the
+    differences between consecutive balances. The last payment of each
+    scenario is only what is left to pay. ``months`` defaults to the longest
+    payoff; debts whose payment never covers the interest raise ``ValueError``.
+    """
+    payments = np.atleast_1d(np.asarray(monthly_payments, dtype=float))
+    monthly_rate = annual_rate / 100 / 12
+    exact = payoff_months(total_debt, annual_rate, payments)
+    if not np.all(np.isfinite(exact)):
+        raise ValueError("the monthly payment does not cover the monthly interest")
+
+    # Guard whole-month payoffs (e.g. 10.0000000001) against float noise
+    payoff_month = np.ceil(exact - 1e-9).astype(int)
+    if months is None:
+        months = int(payoff_month.max()) if len(payoff_month) else 0
+
+    month_numbers = np.arange(1, months + 1)
+    made = np.arange(months + 1)
+    balances = remaining_balance(total_debt, annual_rate, payments[:, np.newaxis], made[np.newaxis, :])
+    active_through = made[np.newaxis, :] < payoff_month[:, np.newaxis]
+    balances = np.where(active_through, np.maximum(balances, 0.0), 0.0)
+    balances[:, 0] = total_debt
+
+    opening = balances[:, :-1]
+    closing = balances[:, 1:]
+    active = month_numbers[np.newaxis, :] <= payoff_month[:, np.newaxis]
+    interest = np.where(active, opening * monthly_rate, 0.0)
+    principal = opening - closing
+    return AmortizationSchedule(
+        month_numbers=month_numbers,
+        payment=interest + principal,
+        interest=interest,
+        principal=principal,
+        balance=closing,
+        active=active,
+        payoff_month=payoff_month,
+    )
+
+
+def project_debt(inputs: DebtInputs) -> DebtResult:
+    """Payoff time and interest with and without the extra monthly payment.
+
+    Raises ``ValueError`` when the minimum payment does not cover the interest,
+    since the debt would then never be repaid.
+    """
+    total_debt = inputs.total_debt
+    monthly_payment = inputs.monthly_payment
+    total_monthly_payment = monthly_payment + inputs.extra_payment
+
+    months_standard = float(payoff_months(total_debt, inputs.annual_rate, monthly_payment))
+    months_extra = float(payoff_months(total_debt, inputs.annual_rate, total_monthly_payment))
+    if not math.isfinite(months_standard):
+        raise ValueError("the monthly payment does not cover the monthly interest")
+
+    total_interest_standard = float(payoff_interest(total_debt, monthly_payment, months_standard))
+    total_interest_extra = float(payoff_interest(total_debt, total_monthly_payment, months_extra))
+
+    # Remaining balance of both scenarios from one closed-form schedule
+    schedule = amortization_schedule(total_debt, inputs.annual_rate, [monthly_payment, total_monthly_payment])
+
+    return DebtResult(
+        inputs=inputs,
+        months_standard=months_standard,
+        months_extra=months_extra,
+        total_interest_standard=total_interest_standard,
+        total_interest_extra=total_interest_extra,
+        month_numbers=schedule.month_numbers,
+        balance_standard=schedule.balance[0],
+        balance_extra=schedule.balance[1],
+        schedule=schedule,
+    )
+
+
+def extra_payment_sweep(inputs: DebtInputs, stop: float = 2000.0, step: float = 25.0, extra_payments=None) -> ExtraPaymentSweep:
+    """Payoff time and interest over a range of extra payments in one evaluation.
+
+    Defaults to $0 to ``stop`` in ``step`` increments; ``inputs.extra_payment``
+    is ignored in favour of the swept values. Every point comes from the same
+    vectorized closed form as ``project_debt``, so a sweep of a hundred
+    payments costs about as much as one.
+    """
+    if extra_payments is None:
+        if step <= 0:
+            raise ValueError(f"step must be positive, got {step}")
+        count = int(np.floor(stop / step + 1e-9)) + 1
+        extra_payments = np.round(step * np.arange(count), 10)
+    extra_payments = np.asarray(extra_payments, dtype=float)
+
+    payments = inputs.monthly_payment + extra_payments
+    months = payoff_months(inputs.total_debt, inputs.annual_rate, payments)
+    total_interest = payoff_interest(inputs.total_debt, payments, months)
+    return ExtraPaymentSweep(
+        inputs=inputs,
+        extra_payments=extra_payments,
+        months=months,
+        total_interest=total_interest,
+    )
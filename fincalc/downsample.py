@@ -0,0 +1,64 @@
+"""Chart series reduction with Largest-Triangle-Three-Buckets (LTTB)."""
+
+import os
+
+import numpy as np
+
+# Most points a single chart sends to the browser
+DEFAULT_MAX_POINTS = int(os.environ.get("FINCALC_CHART_POINTS", "500"))
+
+
+def lttb_indices(x, y, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """Indices of at most ``max_points`` samples that preserve the shape of ``y(x)``.
+
+    The first and last samples are always kept. The rest is split into equal
+    buckets and from each bucket LTTB keeps the sample forming the largest
+    triangle with the previously kept sample and the mean of the next bucket.
+    Only the loop over buckets is in Python, so the cost is O(len(x)).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if max_points >= n or max_points < 3:
+        return np.arange(n)
+
+    # Bucket b covers samples edges[b]:edges[b + 1], excluding both endpoints
+    edges = (np.arange(max_points - 1) * (n - 2) / (max_points - 2)).astype(int) + 1
+    edges[-1] = n - 1
+    counts = np.diff(edges)
+    mean_x = np.add.reduceat(x[:-1], edges[:-1]) / counts
+    mean_y = np.add.reduceat(y[:-1], edges[:-1]) / counts
+    # The bucket after the last one is the final sample itself
+    mean_x = np.append(mean_x, x[-1])
+    mean_y = np.append(mean_y, y[-1])
+
+    selected = np.empty(max_points, dtype=int)
+    selected[0] = 0
+    selected[-1] = n - 1
+    anchor = 0
+    for bucket in range(max_points - 2):
+        lo, hi = edges[bucket], edges[bucket + 1]
+        area = np.abs(
+            (x[anchor] - mean_x[bucket + 1]) * (y[lo:hi] - y[anchor])
+            - (x[anchor] - x[lo:hi]) * (mean_y[bucket + 1] - y[anchor])
+        )
+        anchor = lo + int(area.argmax())
+        selected[bucket + 1] = anchor
+    return selected
+
+
+def downsample(x, *ys, max_points: int = DEFAULT_MAX_POINTS):
+    """Reduce ``x`` and every series in ``ys`` to a shared set of at most ``max_points`` samples.
+
+    Each series gets an equal share of the budget and the kept indices are
+    merged, so traces that are drawn against each other (stacked areas,
+    comparisons) keep a common x axis. Returns ``(x, *ys)`` as arrays.
+    """
+    x = np.asarray(x)
+    ys = [np.asarray(y) for y in ys]
+    if len(x) <= max_points or not ys:
+        return (x, *ys)
+
+    share = max(3, max_points // len(ys))
+    keep = np.unique(np.concatenate([lttb_indices(x, y, share) for y in ys]))
+    return (x[keep], *(y[keep] for y in ys))
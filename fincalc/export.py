@@ -0,0 +1,179 @@
+"""Streaming export of month-by-month amortization schedules for loan books."""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, Optional
+
+import numpy as np
+
+from fincalc.debt import payoff_months, remaining_balance
+from fincalc.paydates import add_months
+
+CSV = "csv"
+PARQUET = "parquet"
+
+SCHEDULE_COLUMNS = ("loan_id", "month", "date", "payment", "interest", "principal", "balance")
+
+# Rows held in memory at once; a single loan is never split across chunks
+DEFAULT_CHUNK_ROWS = 250_000
+
+
+@dataclass(frozen=True)
+class ExportStats:
+    """Size and speed of a finished export."""
+
+    rows: int
+    loans: int
+    elapsed: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def iter_schedules(total_debt, annual_rate, monthly_payment, loan_ids=None, start=None,
+                   chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                   on_skip: Optional[Callable[[object, str], None]] = None) -> Iterator[dict]:
+    """Yield the schedules of many loans as column arrays of about ``chunk_rows`` rows.
+
+    Each chunk maps :data:`SCHEDULE_COLUMNS` to equal-length arrays, with the
+    loans' rows laid end to end. Balances come from the closed-form
+    :func:`remaining_balance` over the whole ragged chunk at once, so there is
+    no per-month loop, and only one chunk is ever in memory. ``start`` is the
+    date the loans are opened (default: today); payments fall due on its day
+    of the month. A loan that has a missing value or whose payment never
+    covers its interest is left out, and ``on_skip``, if given, is called with
+    its id and the reason, so one bad row does not stop a whole book.
+    """
+    total_debt = np.atleast_1d(np.asarray(total_debt, dtype=float))
+    loans = len(total_debt)
+    annual_rate = np.broadcast_to(np.asarray(annual_rate, dtype=float), (loans,))
+    monthly_payment = np.broadcast_to(np.asarray(monthly_payment, dtype=float), (loans,))
+    loan_ids = np.arange(1, loans + 1) if loan_ids is None else np.asarray(loan_ids)
+    start = np.datetime64("today", "D") if start is None else np.datetime64(start, "D")
+
+    with np.errstate(invalid="ignore"):
+        exact = payoff_months(total_debt, annual_rate, monthly_payment)
+    missing = np.isnan(total_debt) | np.isnan(annual_rate) | np.isnan(monthly_payment)
+    skipped = ~np.isfinite(exact) | missing
+    if skipped.any():
+        if on_skip is not None:
+            for index in np.flatnonzero(skipped):
+                reason = "missing value" if missing[index] else "the monthly payment does not cover the monthly interest"
+                on_skip(loan_ids[index], reason)
+        kept = ~skipped
+        total_debt, annual_rate, monthly_payment = total_debt[kept], annual_rate[kept], monthly_payment[kept]
+        loan_ids, exact = loan_ids[kept], exact[kept]
+        loans = len(total_debt)
+    # Guard whole-month payoffs (e.g. 10.0000000001) against float noise
+    counts = np.where(total_debt > 0, np.ceil(exact - 1e-9), 0).astype(np.int64)
+    ends = np.cumsum(counts)
+
+    first = 0
+    while first < loans:
+        done = ends[first - 1] if first else 0
+        last = max(int(np.searchsorted(ends, done + chunk_rows, side="right")), first + 1)
+        yield _schedule_chunk(
+            total_debt[first:last],
+            annual_rate[first:last],
+            monthly_payment[first:last],
+            loan_ids[first:last],
+            counts[first:last],
+            start,
+        )
+        first = last
+
+
+def _schedule_chunk(total_debt, annual_rate, monthly_payment, loan_ids, counts, start):
+    """Rows of a group of loans laid end to end."""
+    loan = np.repeat(np.arange(len(counts)), counts)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    month = np.arange(len(loan)) - offsets + 1
+
+    debt, rate, payment = total_debt[loan], annual_rate[loan], monthly_payment[loan]
+    opening = np.maximum(remaining_balance(debt, rate, payment, month - 1), 0.0)
+    closing = np.where(month == counts[loan], 0.0, np.maximum(remaining_balance(debt, rate, payment, month), 0.0))
+    interest = opening * rate / 100 / 12
+    principal = opening - closing
+    return {
+        "loan_id": loan_ids[loan],
+        "month": month,
+        "date": add_months(start, month),
+        "payment": interest + principal,
+        "interest": interest,
+        "principal": principal,
+        "balance": closing,
+    }
+
+
+class _CsvSink:
+    def __init__(self, path, precision):
+        self.file = open(path, "w", newline="")
+        self.file.write(",".join(SCHEDULE_COLUMNS) + "\r\n")
+        self.template = "%s,%d,%s" + f",%.{precision}f" * 4 + "\r\n"
+
+    def write(self, chunk):
+        columns = [chunk["loan_id"].astype(str).tolist(), chunk["month"].tolist(), chunk["date"].astype(str).tolist()]
+        columns += [chunk[name].tolist() for name in SCHEDULE_COLUMNS[3:]]
+        self.file.write("".join(self.template % row for row in zip(*columns)))
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetSink:
+    def __init__(self, path, precision):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow") from None
+        self.pa = pa
+        self.pq = pq
+        self.path = path
+        self.precision = precision
+        self.writer = None
+
+    def write(self, chunk):
+        table = self.pa.table({
+            name: np.round(values, self.precision) if values.dtype.kind == "f" else values
+            for name, values in chunk.items()
+        })
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+SINKS = {CSV: _CsvSink, PARQUET: _ParquetSink}
+
+
+def export_schedules(chunks: Iterable[dict], path: str, file_format: Optional[str] = None, precision: int = 2,
+                     progress: Optional[Callable[[int, int], None]] = None) -> ExportStats:
+    """Write schedule chunks to ``path`` as they arrive; returns rows, loans and timing.
+
+    ``file_format`` is ``"csv"`` or ``"parquet"`` and defaults to the file
+    extension. Parquet needs the optional ``pyarrow`` package. ``progress`` is
+    called with the running row and loan counts after every chunk.
+    """
+    if file_format is None:
+        file_format = PARQUET if str(path).endswith((".parquet", ".pq")) else CSV
+    if file_format not in SINKS:
+        raise ValueError(f"file_format must be {CSV!r} or {PARQUET!r}, got {file_format!r}")
+
+    started = time.perf_counter()
+    sink = SINKS[file_format](path, precision)
+    rows = loans = 0
+    try:
+        for chunk in chunks:
+            sink.write(chunk)
+            rows += len(chunk["month"])
+            loans += int((chunk["month"] == 1).sum())
+            if progress is not None:
+                progress(rows, loans)
+    finally:
+        sink.close()
+    return ExportStats(rows=rows, loans=loans, elapsed=time.perf_counter() - started)
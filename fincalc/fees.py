@@ -0,0 +1,329 @@
+"""Investment fee comparison."""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from fincalc.solve import find_root
+
+
+@dataclass(frozen=True)
+class FeeInputs:
+    """Inputs of the investment fee comparison."""
+
+    starting_amount: float
+    monthly_contribution: float
+    expected_return: float
+    self_managed_fee: float
+    advisor_fee: float
+    years: int
+
+
+@dataclass(frozen=True)
+class FeeResult:
+    """Year-by-year portfolio values; index ``y`` is the value after ``y`` years."""
+
+    inputs: FeeInputs
+    years: np.ndarray
+    self_values: np.ndarray
+    advisor_values: np.ndarray
+    no_fee_values: np.ndarray
+
+    @property
+    def total_self(self) -> float:
+        return float(self.self_values[-1])
+
+    @property
+    def total_advisor(self) -> float:
+        return float(self.advisor_values[-1])
+
+    @property
+    def total_no_fees(self) -> float:
+        return float(self.no_fee_values[-1])
+
+    @property
+    def total_invested(self) -> float:
+        return self.inputs.starting_amount + self.inputs.monthly_contribution * 12 * self.inputs.years
+
+    @property
+    def fee_difference(self) -> float:
+        return self.total_self - self.total_advisor
+
+    @property
+    def percentage_difference(self) -> float:
+        if self.total_self > 0:
+            return self.fee_difference / self.total_self * 100
+        return 0.0
+
+    @property
+    def fees_self_paid(self) -> float:
+        return self.total_no_fees - self.total_self
+
+    @property
+    def fees_advisor_paid(self) -> float:
+        return self.total_no_fees - self.total_advisor
+
+
+@dataclass(frozen=True)
+class FeeProduct:
+    """An investment product on the comparison menu.
+
+    ``expected_return`` overrides the comparison's common return when given.
+    """
+
+    name: str
+    fee: float
+    expected_return: Optional[float] = None
+
+
+DEFAULT_PRODUCT_MENU = (
+    FeeProduct("Index Fund", 0.05),
+    FeeProduct("Robo-Advisor", 0.25),
+    FeeProduct("Advisor (Tier 1)", 0.75),
+    FeeProduct("Advisor (Tier 2)", 1.0),
+    FeeProduct("Advisor (Tier 3)", 1.5),
+    FeeProduct("Advisor (Tier 4)", 2.0),
+)
+
+
+@dataclass(frozen=True)
+class ProductComparison:
+    """Trajectories of every product; rows follow ``products``, columns are years."""
+
+    products: tuple
+    years: np.ndarray
+    returns: np.ndarray
+    values: np.ndarray
+    no_fee_values: np.ndarray
+
+    @property
+    def final_values(self) -> np.ndarray:
+        return self.values[:, -1]
+
+    @property
+    def fees_paid(self) -> np.ndarray:
+        """Growth lost to fees: each product's own no-fee ending value minus its actual one."""
+        return self.no_fee_values[:, -1] - self.values[:, -1]
+
+    def ranking(self) -> np.ndarray:
+        """Product indices from highest to lowest ending value."""
+        return np.argsort(-self.final_values, kind="stable")
+
+    def ranked_table(self) -> list:
+        """One row per product, best first, ready for a table widget."""
+        best = self.final_values.max() if len(self.products) else 0.0
+        return [
+            {
+                "Rank": rank,
+                "Product": self.products[index].name,
+                "Fee (%)": self.products[index].fee,
+                "Return (%)": float(self.returns[index]),
+                "Ending Value": float(self.final_values[index]),
+                "Fees Paid": float(self.fees_paid[index]),
+                "Behind Best": float(best - self.final_values[index]),
+            }
+            for rank, index in enumerate(self.ranking(), start=1)
+        ]
+
+
+def calculate_balance(starting_amount, monthly_contribution, annual_return, annual_fee, years):
+    """Simulate the portfolio year by year; return and fee are decimals here."""
+    balance = starting_amount
+
+    for year in range(1, years + 1):
+        # Add monthly contributions for the year (all at once at start of year)
+        balance += monthly_contribution * 12
+
+        # Apply annual return
+        balance *= (1 + annual_return)
+
+        # Deduct annual fee (as % of assets under management)
+        balance *= (1 - annual_fee)
+
+    return balance
+
+
+def fee_final_balance(starting_amount, monthly_contribution, expected_return, annual_fee, years):
+    """Closed form of :func:`calculate_balance`, vectorized; rates in percent.
+
+    With k = (1 + return) * (1 - fee) the yearly recursion B -> (B + 12c) * k
+    sums to B0 * k^n + 12c * k * (k^n - 1) / (k - 1).
+    """
+    growth = (1 + np.asarray(expected_return, dtype=float) / 100) * (1 - np.asarray(annual_fee, dtype=float) / 100)
+    years = np.asarray(years, dtype=float)
+    total_growth = growth ** years
+    with np.errstate(divide="ignore", invalid="ignore"):
+        annuity = np.where(growth != 1, growth * (total_growth - 1) / (growth - 1), years)
+    return starting_amount * total_growth + 12 * np.asarray(monthly_contribution, dtype=float) * annuity
+
+
+def fee_trajectories(starting_amount, monthly_contribution, expected_return, fees, years: int) -> np.ndarray:
+    """Year-end portfolio values for every fee level; rates in percent.
+
+    ``expected_return`` is either common to all levels or one per fee level.
+
+    Returns a (fee levels × years + 1) array whose column ``y`` is the value
+    after ``y`` years, so column 0 is the starting amount. The closed form of
+    :func:`fee_final_balance` is broadcast over the whole grid at once, which
+    costs O(fee levels × years) rather than re-simulating every prefix.
+    """
+    fees = np.atleast_1d(np.asarray(fees, dtype=float))
+    expected_return = np.asarray(expected_return, dtype=float)
+    if expected_return.ndim:
+        expected_return = expected_return[:, np.newaxis]
+    elapsed = np.arange(int(years) + 1)
+    return fee_final_balance(
+        starting_amount,
+        monthly_contribution,
+        expected_return,
+        fees[:, np.newaxis],
+        elapsed[np.newaxis, :],
+    )
+
+
+def fee_paths(starting_amount, monthly_contribution, annual_returns, annual_fee) -> np.ndarray:
+    """Year-end values along paths of varying yearly returns (percent).
+
+    ``annual_returns`` is (paths × years). Each year follows
+    :func:`calculate_balance`: B -> (B + 12c) * (1 + r_y) * (1 - fee). Writing
+    K_n for the product of the first n growth factors, B_n = K_n * (B_0 + 12c *
+    sum of 1 / K_(j-1)), which ``cumprod`` and ``cumsum`` evaluate for every
+    path at once. Returns (paths × years + 1) with column 0 the starting amount.
+    """
+    annual_returns = np.atleast_2d(np.asarray(annual_returns, dtype=float))
+    growth = (1 + annual_returns / 100) * (1 - annual_fee / 100)
+    cumulative = np.cumprod(growth, axis=1)
+    previous = np.hstack([np.ones((len(growth), 1)), cumulative[:, :-1]])
+
+    values = np.empty((len(growth), growth.shape[1] + 1))
+    values[:, 0] = starting_amount
+    values[:, 1:] = cumulative * (starting_amount + 12 * monthly_contribution * np.cumsum(1 / previous, axis=1))
+    return values
+
+
+def compare_fees(inputs: FeeInputs) -> FeeResult:
+    """Compare self-managed and advisor-managed portfolios against a no-fee reference.
+
+    All three trajectories come from one :func:`fee_trajectories` evaluation;
+    the totals and fees paid are read off its last column.
+    """
+    values = fee_trajectories(
+        inputs.starting_amount,
+        inputs.monthly_contribution,
+        inputs.expected_return,
+        (inputs.self_managed_fee, inputs.advisor_fee, 0.0),
+        inputs.years,
+    )
+    return FeeResult(
+        inputs=inputs,
+        years=np.arange(int(inputs.years) + 1),
+        self_values=values[0],
+        advisor_values=values[1],
+        no_fee_values=values[2],
+    )
+
+
+def compare_products(
+    starting_amount: float,
+    monthly_contribution: float,
+    expected_return: float,
+    years: int,
+    products: Sequence[FeeProduct] = DEFAULT_PRODUCT_MENU,
+) -> ProductComparison:
+    """Trajectories of an arbitrary product menu, evaluated as one (products × years) array.
+
+    Each product's fees paid are measured against the same product with no
+    fee, so products with their own expected return are compared fairly.
+    """
+    products = tuple(products)
+    fees = np.array([product.fee for product in products], dtype=float)
+    returns = np.array(
+        [expected_return if product.expected_return is None else product.expected_return for product in products],
+        dtype=float,
+    )
+
+    # Stack the fee and no-fee cases so both come from a single broadcast
+    both = fee_trajectories(
+        starting_amount,
+        monthly_contribution,
+        np.concatenate([returns, returns]),
+        np.concatenate([fees, np.zeros_like(fees)]),
+        years,
+    )
+    return ProductComparison(
+        products=products,
+        years=np.arange(int(years) + 1),
+        returns=returns,
+        values=both[:len(products)],
+        no_fee_values=both[len(products):],
+    )
+
+
+@dataclass(frozen=True)
+class FeeBreakEven:
+    """What it would take for the advisor's fee to pay for itself.
+
+    ``extra_return`` is the additional annual return (percentage points) the
+    advisor must deliver to match the self-managed ending value.
+    ``gap_fee`` is the fee at which the ending value falls ``gap_threshold``
+    dollars behind self-managed; ``None`` when no fee below 100% opens a gap
+    that large.
+    """
+
+    inputs: FeeInputs
+    extra_return: float
+    gap_threshold: float
+    gap_fee: Optional[float]
+
+    @property
+    def required_return(self) -> float:
+        return self.inputs.expected_return + self.extra_return
+
+
+def breakeven_extra_return(expected_return: float, self_managed_fee: float, advisor_fee: float) -> float:
+    """Extra annual return (percentage points) that offsets the higher advisor fee.
+
+    The simulation only ever sees the net growth factor k = (1 + r) * (1 - fee),
+    so matching k makes the two portfolios identical at every horizon and the
+    answer is exact: (1 + r) * ((1 - fee_self) / (1 - fee_advisor) - 1).
+    """
+    if advisor_fee >= 100:
+        return float("inf")
+    gross = 1 + expected_return / 100
+    return gross * ((1 - self_managed_fee / 100) / (1 - advisor_fee / 100) - 1) * 100
+
+
+def fee_for_gap(inputs: FeeInputs, threshold: float) -> Optional[float]:
+    """Fee (%) at which the ending value trails self-managed by ``threshold`` dollars.
+
+    Solved with :func:`~fincalc.solve.find_root` on the closed-form balance,
+    which falls monotonically as the fee rises. Returns ``None`` if even a
+    fee just under 100% does not open a gap that large.
+    """
+    def ending_value(fee):
+        return float(fee_final_balance(
+            inputs.starting_amount, inputs.monthly_contribution, inputs.expected_return, fee, inputs.years
+        ))
+
+    baseline = ending_value(inputs.self_managed_fee)
+    if threshold <= 0:
+        return inputs.self_managed_fee
+
+    def excess_gap(fee):
+        return baseline - ending_value(fee) - threshold
+
+    highest = 100 - 1e-9
+    if excess_gap(highest) < 0:
+        return None
+    return find_root(excess_gap, inputs.self_managed_fee, highest, xtol=1e-10)
+
+
+def fee_breakeven(inputs: FeeInputs, gap_threshold: float = 10_000.0) -> FeeBreakEven:
+    """Break-even extra return for the advisor fee and the fee that opens ``gap_threshold``."""
+    return FeeBreakEven(
+        inputs=inputs,
+        extra_return=breakeven_extra_return(inputs.expected_return, inputs.self_managed_fee, inputs.advisor_fee),
+        gap_threshold=gap_threshold,
+        gap_fee=fee_for_gap(inputs, gap_threshold),
+    )
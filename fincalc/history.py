@@ -0,0 +1,223 @@
+"""Historical-return replay and block bootstrap from a bundled returns dataset.
+
+Return histories are stored as raw little-endian float64 files (``.f8``, one
+decimal return per period) next to a small JSON description, and opened with
+``np.memmap``: nothing is read until it is used, and every session and worker
+process maps the same read-only pages.
+"""
+
+import csv
+import functools
+import json
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from fincalc.compound import CompoundInputs
+from fincalc.fees import FeeInputs, fee_paths
+from fincalc.montecarlo import DEFAULT_CHUNK_SIZE, PERCENTILES, grow_paths
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+DEFAULT_DATASET = "sp500_annual"
+
+REPLAY = "replay"
+BOOTSTRAP = "bootstrap"
+
+
+@dataclass(frozen=True)
+class ReturnHistory:
+    """A memory-mapped series of returns (decimals) with its calendar."""
+
+    name: str
+    description: str
+    frequency: str
+    start: int
+    returns: np.ndarray
+
+    @property
+    def periods(self) -> np.ndarray:
+        """Calendar label (year for annual data) of every return."""
+        return self.start + np.arange(len(self.returns))
+
+    def annual_returns(self) -> np.ndarray:
+        """Yearly returns, compounding whole years of monthly data if needed."""
+        if self.frequency == "annual":
+            return self.returns
+        whole_years = len(self.returns) // 12
+        monthly = np.asarray(self.returns[:whole_years * 12]).reshape(whole_years, 12)
+        return np.expm1(np.log1p(monthly).sum(axis=1))
+
+
+def build_dataset(csv_path: str, name: str, description: str = "", frequency: str = "annual",
+                  data_dir: str = DATA_DIR) -> str:
+    """Convert a ``period,return`` CSV (percent; ``#`` comments allowed) into a dataset.
+
+    Writes ``<name>.f8`` and ``<name>.json`` into ``data_dir`` and returns the
+    path of the binary file.
+    """
+    periods, returns = [], []
+    with open(csv_path, newline="") as source:
+        rows = csv.reader(line for line in source if not line.startswith("#"))
+        next(rows)
+        for period, value in rows:
+            periods.append(int(period))
+            returns.append(float(value) / 100)
+    if np.any(np.diff(periods) != 1):
+        raise ValueError(f"{csv_path}: periods must be consecutive")
+
+    binary_path = os.path.join(data_dir, f"{name}.f8")
+    np.asarray(returns, dtype="<f8").tofile(binary_path)
+    with open(os.path.join(data_dir, f"{name}.json"), "w") as meta:
+        json.dump(
+            {"description": description, "frequency": frequency, "start": periods[0], "count": len(returns)},
+            meta,
+            indent=2,
+        )
+        meta.write("\n")
+    return binary_path
+
+
+@functools.lru_cache(maxsize=None)
+def load_history(name: str = DEFAULT_DATASET, data_dir: str = DATA_DIR) -> ReturnHistory:
+    """Memory-map a bundled dataset; mapped once per process and shared afterwards."""
+    with open(os.path.join(data_dir, f"{name}.json")) as meta:
+        info = json.load(meta)
+    returns = np.memmap(os.path.join(data_dir, f"{name}.f8"), dtype="<f8", mode="r", shape=(info["count"],))
+    return ReturnHistory(
+        name=name,
+        description=info.get("description", ""),
+        frequency=info["frequency"],
+        start=int(info["start"]),
+        returns=returns,
+    )
+
+
+def rolling_windows(returns: np.ndarray, years: int) -> np.ndarray:
+    """Every consecutive ``years``-long run of returns, as a read-only strided view (no copy)."""
+    if years > len(returns):
+        raise ValueError(f"the history only covers {len(returns)} years, not {years}")
+    return sliding_window_view(returns, years)
+
+
+def block_bootstrap(returns: np.ndarray, years: int, samples: int, block_length: int = 5,
+                    seed: Optional[int] = None) -> np.ndarray:
+    """Resample (samples × years) return paths from blocks of consecutive history.
+
+    Circular block bootstrap: each path strings together blocks of
+    ``block_length`` years starting at random points, wrapping around the end,
+    which keeps the short-run autocorrelation of the real series.
+    """
+    if block_length < 1:
+        raise ValueError(f"block_length must be positive, got {block_length}")
+    rng = np.random.default_rng(seed)
+    blocks = -(-years // block_length)
+    starts = rng.integers(0, len(returns), size=(samples, blocks, 1))
+    index = (starts + np.arange(block_length)) % len(returns)
+    return np.asarray(returns)[index.reshape(samples, -1)[:, :years]]
+
+
+@dataclass(frozen=True)
+class HistoricalResult:
+    """Percentile bands and final balances across historical scenarios.
+
+    ``bands`` has one row per entry of ``percentiles`` and one column per year
+    (column 0 is the starting balance); ``final_balances`` has one entry per
+    scenario. ``start_years`` labels each replayed scenario by its first
+    calendar year and is ``None`` for bootstrapped paths.
+    """
+
+    dataset: str
+    method: str
+    years: np.ndarray
+    bands: np.ndarray
+    final_balances: np.ndarray
+    start_years: Optional[np.ndarray] = None
+    percentiles: tuple = PERCENTILES
+
+    @property
+    def months(self) -> np.ndarray:
+        return self.years * 12
+
+    def band(self, percentile: int) -> np.ndarray:
+        return self.bands[self.percentiles.index(percentile)]
+
+    def worst_start(self) -> Optional[int]:
+        return None if self.start_years is None else int(self.start_years[self.final_balances.argmin()])
+
+    def best_start(self) -> Optional[int]:
+        return None if self.start_years is None else int(self.start_years[self.final_balances.argmax()])
+
+
+def _scenarios(history, years, method, samples, block_length, seed):
+    """(scenarios × years) annual returns as decimals, plus the start year of each.
+
+    Replayed windows are a strided view of the memory-mapped history; callers
+    scale them chunk by chunk, so the full set is never copied.
+    """
+    annual = history.annual_returns()
+    if method == REPLAY:
+        windows = rolling_windows(annual, years)
+        return windows, history.start + np.arange(len(windows))
+    if method == BOOTSTRAP:
+        return block_bootstrap(annual, years, samples, block_length, seed), None
+    raise ValueError(f"method must be {REPLAY!r} or {BOOTSTRAP!r}, got {method!r}")
+
+
+def _summarize(history, method, returns, start_years, grow, percentiles, chunk_size):
+    """Grow ``returns`` ``chunk_size`` scenarios at a time and keep bands and final balances.
+
+    Only the (scenarios × years + 1) year-end balances are held in full; the
+    monthly temporaries of ``grow`` are bounded by the chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    scenarios, years = returns.shape
+    yearly = np.empty((scenarios, years + 1))
+    for lo in range(0, scenarios, chunk_size):
+        yearly[lo:lo + chunk_size] = grow(returns[lo:lo + chunk_size])
+    return HistoricalResult(
+        dataset=history.name,
+        method=method,
+        years=np.arange(years + 1),
+        bands=np.percentile(yearly, percentiles, axis=0),
+        final_balances=yearly[:, -1].copy(),
+        start_years=start_years,
+        percentiles=tuple(percentiles),
+    )
+
+
+def historical_compound(inputs: CompoundInputs, method: str = REPLAY, dataset: str = DEFAULT_DATASET,
+                        samples: int = 10_000, block_length: int = 5, seed: Optional[int] = None,
+                        percentiles=PERCENTILES, chunk_size: int = DEFAULT_CHUNK_SIZE) -> HistoricalResult:
+    """Run the compound projection over every historical start year, or bootstrapped paths.
+
+    Replaces the constant rate of ``inputs`` with real yearly returns, applied
+    monthly as in :func:`~fincalc.montecarlo.simulate_compound`, and like it
+    grows ``chunk_size`` scenarios per pass.
+    """
+    history = load_history(dataset)
+    returns, start_years = _scenarios(history, int(inputs.years), method, samples, block_length, seed)
+    return _summarize(
+        history, method, returns, start_years,
+        lambda chunk: grow_paths(inputs, np.log1p(chunk)),
+        percentiles, chunk_size,
+    )
+
+
+def historical_fees(inputs: FeeInputs, method: str = REPLAY, dataset: str = DEFAULT_DATASET,
+                    samples: int = 10_000, block_length: int = 5, seed: Optional[int] = None,
+                    percentiles=PERCENTILES, chunk_size: int = DEFAULT_CHUNK_SIZE) -> tuple:
+    """Self-managed and advisor-managed :class:`HistoricalResult` on the same return paths."""
+    history = load_history(dataset)
+    returns, start_years = _scenarios(history, int(inputs.years), method, samples, block_length, seed)
+    return tuple(
+        _summarize(
+            history, method, returns, start_years,
+            lambda chunk, fee=fee: fee_paths(inputs.starting_amount, inputs.monthly_contribution, chunk * 100, fee),
+            percentiles, chunk_size,
+        )
+        for fee in (inputs.self_managed_fee, inputs.advisor_fee)
+    )
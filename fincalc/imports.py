@@ -0,0 +1,42 @@
+"""Deferred imports and their cost, for measuring the app's cold start.
+
+The Streamlit pages load pandas and Plotly through :func:`lazy_import` only
+when they render something that needs them, so the first request on a fresh
+process pays for what it shows and nothing else. Each first import is timed;
+set ``FINCALC_IMPORT_TIMES=1`` to have the costs printed to stderr as they
+happen and listed in the app's sidebar.
+"""
+
+import importlib
+import os
+import sys
+import time
+
+REPORT_IMPORT_TIMES = os.environ.get("FINCALC_IMPORT_TIMES", "") not in ("", "0")
+
+# Seconds each module took on its first import, in import order; lives as long as the process
+import_times = {}
+
+
+def record_import(name: str, seconds: float) -> None:
+    """Record the cost of importing ``name``; only the first import of a module counts."""
+    if name in import_times:
+        return
+    import_times[name] = seconds
+    if REPORT_IMPORT_TIMES:
+        print(f"import {name}: {seconds * 1000:.1f} ms", file=sys.stderr)
+
+
+def lazy_import(name: str):
+    """The module ``name``, imported and timed on first use.
+
+    Later calls cost a ``sys.modules`` lookup, so pages can call this on every
+    rerun. A module another import already pulled in is returned without a
+    record, its cost being part of that import's.
+    """
+    module = sys.modules.get(name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        record_import(name, time.perf_counter() - started)
+    return module
@@ -0,0 +1,323 @@
+"""Exact-money mode: balances carried as int64 cents with per-period rounding.
+
+The float calculators round only for display, so totals built from many
+periods can drift from what a ledger that posts whole cents would show. The
+engines here post interest every month, rounded to the cent with an explicit
+policy, and stay vectorized across loans or accounts: the only Python loop is
+over months.
+"""
+
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from fincalc.compound import MONTHLY, START, _check_timing, compound_final_balance
+from fincalc.debt import payoff_months, remaining_balance
+
+HALF_UP = "half_up"
+HALF_EVEN = "half_even"
+
+# Rates are taken to 1e-4 percent, so a monthly rate is an exact integer ratio
+RATE_SCALE = 10_000
+MONTHLY_RATE_DENOMINATOR = 100 * RATE_SCALE * 12
+
+MAX_MONTHS = 1200
+
+# Largest balance the engines carry; well inside int64, so a month's growth cannot wrap
+MAX_CENTS = 2 ** 62
+
+
+def _check_policy(policy):
+    if policy not in (HALF_UP, HALF_EVEN):
+        raise ValueError(f"rounding must be {HALF_UP!r} or {HALF_EVEN!r}, got {policy!r}")
+
+
+def _check_range(balance):
+    if (np.abs(balance) > MAX_CENTS).any():
+        raise ValueError(f"amount exceeds {MAX_CENTS / 100:.3g} dollars, beyond what int64 cents can carry")
+
+
+def to_cents(amounts) -> np.ndarray:
+    """Dollar amounts as int64 cents, rounding half a cent away from zero; vectorized.
+
+    Raises ``ValueError`` for amounts beyond :data:`MAX_CENTS`.
+    """
+    amounts = np.asarray(amounts, dtype=float)
+    # Snap float noise first so 1.005 (stored as 1.00499...) still rounds up
+    scaled = np.round(np.abs(amounts) * 100, 6)
+    _check_range(scaled)
+    return (np.sign(amounts) * np.floor(scaled + 0.5)).astype(np.int64)
+
+
+def divide_round(numerator, denominator, policy: str = HALF_EVEN) -> np.ndarray:
+    """Exact ``numerator / denominator`` rounded to an integer; int64 in and out.
+
+    ``half_up`` rounds ties away from zero and ``half_even`` (banker's
+    rounding) to the even neighbour. Integer arithmetic only, so ties are
+    detected exactly.
+    """
+    _check_policy(policy)
+    numerator = np.asarray(numerator, dtype=np.int64)
+    sign = np.where(numerator < 0, -1, 1)
+    quotient, remainder = np.divmod(np.abs(numerator), denominator)
+    twice = 2 * remainder
+    if policy == HALF_UP:
+        up = twice >= denominator
+    else:
+        up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    return sign * (quotient + up)
+
+
+def monthly_interest(balance, rate, policy: str = HALF_EVEN) -> np.ndarray:
+    """``balance * rate / MONTHLY_RATE_DENOMINATOR`` rounded to the cent; int64 in and out.
+
+    ``rate`` is in :func:`rate_units`. The balance is split into whole
+    multiples of the denominator and a remainder, so only ``remainder * rate``
+    is divided with rounding and the full product, which overflows int64 for
+    large balances, is never formed. Signs are handled on the magnitudes, so
+    ``half_up`` still rounds ties away from zero.
+    """
+    balance = np.asarray(balance, dtype=np.int64)
+    rate = np.asarray(rate, dtype=np.int64)
+    quotient, remainder = np.divmod(np.abs(balance), MONTHLY_RATE_DENOMINATOR)
+    magnitude = quotient * np.abs(rate) + divide_round(remainder * np.abs(rate), MONTHLY_RATE_DENOMINATOR, policy)
+    return np.sign(balance) * np.sign(rate) * magnitude
+
+
+def round_float(values, policy: str = HALF_EVEN) -> np.ndarray:
+    """Round float amounts of cents to int64 with ``policy``; for irrational rates."""
+    _check_policy(policy)
+    values = np.asarray(values, dtype=float)
+    if policy == HALF_UP:
+        return (np.sign(values) * np.floor(np.abs(values) + 0.5)).astype(np.int64)
+    return np.rint(values).astype(np.int64)
+
+
+def rate_units(annual_rate) -> np.ndarray:
+    """Annual rates in percent as integer multiples of 1e-4 percent."""
+    return np.round(np.asarray(annual_rate, dtype=float) * RATE_SCALE).astype(np.int64)
+
+
+@dataclass(frozen=True)
+class CentsDebtResult:
+    """Loans amortized in whole cents; every field has one entry per loan.
+
+    ``months`` is the number of payments, the last one only what was owed.
+    ``balances`` (loans × months), if kept, holds the balance after each
+    payment.
+    """
+
+    total_debt_cents: np.ndarray
+    months: np.ndarray
+    total_interest_cents: np.ndarray
+    total_paid_cents: np.ndarray
+    final_payment_cents: np.ndarray
+    balances: np.ndarray = None
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self.total_interest_cents / 100
+
+
+def amortize_cents(total_debt, annual_rate, monthly_payment, rounding: str = HALF_EVEN,
+                   keep_balances: bool = False) -> CentsDebtResult:
+    """Amortize every loan month by month in int64 cents, vectorized over loans.
+
+    Each month the interest B * i is posted rounded to the cent by
+    ``rounding``, then the payment (or what is left) is taken off. The monthly
+    rate is an exact integer ratio (rates to 1e-4 percent), so no float ever
+    touches a balance. Raises ``ValueError`` if a payment never covers the
+    interest.
+    """
+    _check_policy(rounding)
+    balance = np.atleast_1d(to_cents(total_debt))
+    loans = len(balance)
+    rate = np.broadcast_to(rate_units(annual_rate), (loans,))
+    payment = np.broadcast_to(to_cents(monthly_payment), (loans,))
+
+    never = ~np.isfinite(payoff_months(balance, rate / RATE_SCALE, payment))
+    if never.any():
+        raise ValueError(f"loan {int(never.argmax()) + 1}: the monthly payment does not cover the monthly interest")
+
+    months = np.zeros(loans, dtype=np.int64)
+    interest_total = np.zeros(loans, dtype=np.int64)
+    paid_total = np.zeros(loans, dtype=np.int64)
+    final_payment = np.zeros(loans, dtype=np.int64)
+    history = []
+    principal = balance.copy()
+
+    for month in range(1, MAX_MONTHS + 1):
+        active = balance > 0
+        if not active.any():
+            break
+        interest = monthly_interest(balance, rate, rounding)
+        owed = balance + interest
+        paid = np.minimum(payment, owed)
+        balance = owed - paid
+        interest_total += interest
+        paid_total += paid
+        cleared = active & (balance == 0)
+        months[cleared] = month
+        final_payment[cleared] = paid[cleared]
+        if keep_balances:
+            history.append(balance)
+    if (balance > 0).any():
+        raise ValueError(f"loan {int((balance > 0).argmax()) + 1}: not repaid within {MAX_MONTHS} months")
+
+    return CentsDebtResult(
+        total_debt_cents=principal,
+        months=months,
+        total_interest_cents=interest_total,
+        total_paid_cents=paid_total,
+        final_payment_cents=final_payment,
+        balances=np.stack(history, axis=1) if keep_balances else None,
+    )
+
+
+@dataclass(frozen=True)
+class CentsCompoundResult:
+    """Savings projected in whole cents; every field has one entry per account."""
+
+    final_balance_cents: np.ndarray
+    total_contributions_cents: np.ndarray
+    balances: np.ndarray = None
+
+    @property
+    def total_interest_cents(self) -> np.ndarray:
+        return self.final_balance_cents - self.total_contributions_cents
+
+    @property
+    def final_balance(self) -> np.ndarray:
+        return self.final_balance_cents / 100
+
+    @property
+    def total_interest(self) -> np.ndarray:
+        return self.total_interest_cents / 100
+
+
+def compound_cents(initial_amount, annual_rate, monthly_contribution, years, compounding=MONTHLY,
+                   timing=START, rounding: str = HALF_EVEN, keep_balances: bool = False) -> CentsCompoundResult:
+    """Project savings month by month in int64 cents, vectorized over accounts.
+
+    Interest is posted monthly at the effective monthly rate of the
+    compounding frequency, (1 + r / m)^(m / 12) - 1, the same growth the float
+    projection uses, and rounded to the cent by ``rounding``. With monthly
+    compounding the rate is an exact integer ratio; other frequencies have an
+    irrational monthly rate, so their interest is rounded from a float product.
+    ``years`` may differ per account; ``balances`` (accounts × months + 1), if
+    kept, starts with the initial amount. Raises ``ValueError`` if a balance
+    outgrows :data:`MAX_CENTS`.
+    """
+    _check_policy(rounding)
+    _check_timing(timing)
+    balance = np.atleast_1d(to_cents(initial_amount))
+    accounts = len(balance)
+    contribution = np.broadcast_to(to_cents(monthly_contribution), (accounts,))
+    horizon = np.broadcast_to(np.round(np.asarray(years, dtype=float) * 12).astype(np.int64), (accounts,))
+    annual_rate = np.broadcast_to(np.asarray(annual_rate, dtype=float), (accounts,))
+    exact = compounding == MONTHLY
+    if exact:
+        rate = rate_units(annual_rate)
+    else:
+        monthly_rate = np.expm1(compounding / 12 * np.log1p(annual_rate / 100 / compounding))
+
+    contributions = balance.copy()
+    history = [balance]
+    for month in range(1, int(horizon.max(initial=0)) + 1):
+        active = month <= horizon
+        deposit = np.where(active, contribution, 0)
+        if timing == START:
+            balance = balance + deposit
+        if exact:
+            interest = monthly_interest(balance, rate, rounding)
+        else:
+            interest = round_float(balance * monthly_rate, rounding)
+        balance = balance + np.where(active, interest, 0)
+        if timing != START:
+            balance = balance + deposit
+        _check_range(balance)
+        contributions = contributions + deposit
+        if keep_balances:
+            history.append(balance)
+
+    return CentsCompoundResult(
+        final_balance_cents=balance,
+        total_contributions_cents=contributions,
+        balances=np.stack(history, axis=1) if keep_balances else None,
+    )
+
+
+@dataclass(frozen=True)
+class MoneyBenchmark:
+    """Throughput of the float closed forms against the int64-cents engines."""
+
+    rows: int
+    months: int
+    float_seconds: float
+    cents_seconds: float
+    max_interest_drift: float
+
+    @property
+    def float_rows_per_second(self) -> float:
+        return self.rows / self.float_seconds if self.float_seconds > 0 else float("inf")
+
+    @property
+    def cents_rows_per_second(self) -> float:
+        return self.rows / self.cents_seconds if self.cents_seconds > 0 else float("inf")
+
+    @property
+    def slowdown(self) -> float:
+        return self.cents_seconds / self.float_seconds if self.float_seconds > 0 else float("inf")
+
+
+def benchmark(rows: int = 100_000, months: int = 360, calculator: str = "debt", rounding: str = HALF_EVEN,
+              seed: int = 0) -> MoneyBenchmark:
+    """Time the float and cents paths on ``rows`` random loans or accounts.
+
+    ``max_interest_drift`` is the largest difference in total interest, in
+    dollars, between the float result and the cent-exact one. For debt both
+    sides pay whole months with a smaller final payment: the float side is
+    the closed-form balance before the last month plus its interest, not the
+    fractional payoff time of :func:`~fincalc.debt.payoff_months`, which
+    would add up to a month of interest that has nothing to do with rounding.
+    """
+    rng = np.random.default_rng(seed)
+    if calculator == "debt":
+        debt = np.round(rng.uniform(5_000, 500_000, rows), 2)
+        rate = np.round(rng.uniform(2, 25, rows), 2)
+        monthly_rate = rate / 100 / 12
+        payment = np.ceil(debt * monthly_rate / -np.expm1(-months * np.log1p(monthly_rate)) * 100) / 100
+
+        started = time.perf_counter()
+        last_month = np.ceil(payoff_months(debt, rate, payment) - 1e-9)
+        before_last = remaining_balance(debt, rate, payment, last_month - 1)
+        float_interest = payment * (last_month - 1) + before_last * (1 + monthly_rate) - debt
+        float_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        cents_interest = amortize_cents(debt, rate, payment, rounding).total_interest
+        cents_seconds = time.perf_counter() - started
+    elif calculator == "compound":
+        initial = np.round(rng.uniform(0, 100_000, rows), 2)
+        rate = np.round(rng.uniform(0, 12, rows), 2)
+        contribution = np.round(rng.uniform(0, 2_000, rows), 2)
+
+        started = time.perf_counter()
+        final = compound_final_balance(initial, rate, contribution, months, MONTHLY)
+        float_interest = final - initial - contribution * months
+        float_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        cents_interest = compound_cents(initial, rate, contribution, months / 12, MONTHLY, rounding=rounding).total_interest
+        cents_seconds = time.perf_counter() - started
+    else:
+        raise ValueError(f"calculator must be 'debt' or 'compound', got {calculator!r}")
+
+    return MoneyBenchmark(
+        rows=rows,
+        months=months,
+        float_seconds=float_seconds,
+        cents_seconds=cents_seconds,
+        max_interest_drift=float(np.abs(float_interest - cents_interest).max()),
+    )
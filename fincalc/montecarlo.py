@@ -0,0 +1,135 @@
+"""Monte Carlo simulation of the compound interest projection."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from fincalc.compound import START, CompoundInputs
+
+NORMAL = "normal"
+LOGNORMAL = "lognormal"
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Paths simulated per NumPy pass; bounds the (paths × months) temporaries
+DEFAULT_CHUNK_SIZE = 5_000
+
+# Normal draws below -100% would wipe a portfolio out and break the log growth
+MIN_ANNUAL_RETURN = -0.99
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Percentile bands of the simulated balance, sampled at every year end.
+
+    ``bands`` has one row per entry of ``percentiles`` and one column per year
+    (column 0 is the starting balance).
+    """
+
+    inputs: CompoundInputs
+    volatility: float
+    distribution: str
+    paths: int
+    percentiles: tuple
+    years: np.ndarray
+    bands: np.ndarray
+    final_balances: np.ndarray
+
+    @property
+    def months(self) -> np.ndarray:
+        return self.years * 12
+
+    def band(self, percentile: int) -> np.ndarray:
+        """Balance path of one percentile, e.g. ``band(50)`` for the median."""
+        return self.bands[self.percentiles.index(percentile)]
+
+    @property
+    def probability_of_loss(self) -> float:
+        """Share of paths ending below the total amount contributed."""
+        contributed = self.inputs.initial_amount + self.inputs.monthly_contribution * 12 * self.inputs.years
+        return float(np.mean(self.final_balances < contributed))
+
+
+def _draw_log_returns(rng, size, annual_rate, volatility, distribution):
+    """Yearly log growth factors log(1 + R) with the requested mean and volatility."""
+    mean = annual_rate / 100
+    sd = volatility / 100
+    if distribution == NORMAL:
+        returns = rng.normal(mean, sd, size)
+        return np.log1p(np.maximum(returns, MIN_ANNUAL_RETURN))
+    if distribution == LOGNORMAL:
+        # Match the arithmetic mean and standard deviation of 1 + R
+        sigma_squared = np.log1p((sd / (1 + mean)) ** 2)
+        return rng.normal(np.log1p(mean) - sigma_squared / 2, np.sqrt(sigma_squared), size)
+    raise ValueError(f"distribution must be {NORMAL!r} or {LOGNORMAL!r}, got {distribution!r}")
+
+
+def grow_paths(inputs: CompoundInputs, log_returns: np.ndarray) -> np.ndarray:
+    """Year-end balances of paths given their yearly log growth log(1 + R).
+
+    ``log_returns`` is (paths × years). Each year's return is applied monthly
+    as (1 + R)^(1/12) with the contributions of ``inputs``; the result is
+    (paths × years + 1) with column 0 the initial amount. Growth is
+    accumulated with ``cumprod`` across the month axis, with no Python loop.
+    """
+    count, years = log_returns.shape
+    monthly_growth = np.repeat(np.exp(log_returns / 12), 12, axis=1)
+
+    # growth[:, k] is the growth from month 0 to month k + 1
+    growth = np.cumprod(monthly_growth, axis=1)
+    previous = np.hstack([np.ones((count, 1)), growth[:, :-1]])
+
+    # B_k = G_k * (B_0 + c * sum of 1 / G at each deposit date)
+    deposit_dates = previous if inputs.contribution_timing == START else growth
+    balances = growth * (inputs.initial_amount + inputs.monthly_contribution * np.cumsum(1 / deposit_dates, axis=1))
+
+    yearly = np.empty((count, years + 1))
+    yearly[:, 0] = inputs.initial_amount
+    yearly[:, 1:] = balances[:, 11::12]
+    return yearly
+
+
+def simulate_compound(
+    inputs: CompoundInputs,
+    volatility: float,
+    paths: int = 10_000,
+    distribution: str = NORMAL,
+    seed: Optional[int] = None,
+    percentiles=PERCENTILES,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> MonteCarloResult:
+    """Simulate ``paths`` balance paths with a random return drawn for every year.
+
+    ``inputs.annual_rate`` is the mean yearly return and ``volatility`` its
+    standard deviation, both in percent. Each year's return is applied monthly
+    as (1 + R)^(1/12), matching the deterministic projection with annual
+    compounding; ``inputs.compounding`` is therefore not used. The paths are
+    grown with ``cumprod`` over a (paths × months) array, ``chunk_size`` paths
+    at a time, keeping only the year-end balances.
+    """
+    if paths < 1:
+        raise ValueError(f"paths must be positive, got {paths}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    rng = np.random.default_rng(seed)
+    years = int(inputs.years)
+    yearly = np.empty((paths, years + 1))
+    for lo in range(0, paths, chunk_size):
+        count = min(chunk_size, paths - lo)
+        log_returns = _draw_log_returns(rng, (count, years), inputs.annual_rate, volatility, distribution)
+        yearly[lo:lo + count] = grow_paths(inputs, log_returns)
+
+    bands = np.percentile(yearly, percentiles, axis=0)
+    return MonteCarloResult(
+        inputs=inputs,
+        volatility=volatility,
+        distribution=distribution,
+        paths=paths,
+        percentiles=tuple(percentiles),
+        years=np.arange(years + 1),
+        bands=bands,
+        # A copy, so the result does not keep the whole (paths × years + 1) matrix alive
+        final_balances=yearly[:, -1].copy(),
+    )
@@ -0,0 +1,235 @@
+"""Multi-debt payoff planning: snowball, avalanche and custom orderings."""
+
+import heapq
+import math
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+from fincalc.debt import payoff_months, remaining_balance
+
+SNOWBALL = "snowball"
+AVALANCHE = "avalanche"
+CUSTOM = "custom"
+
+# Longest plan simulated before a budget is declared insufficient
+MAX_MONTHS = 1200
+
+
+@dataclass(frozen=True)
+class Debt:
+    """One balance in a multi-debt plan; ``annual_rate`` is in percent."""
+
+    name: str
+    balance: float
+    annual_rate: float
+    minimum_payment: float
+
+
+@dataclass(frozen=True)
+class MultiDebtPlan:
+    """Outcome of paying ``debts`` down with a fixed monthly budget.
+
+    ``balances`` is (debts × months) with column ``k`` the balance after
+    payment ``k + 1``; ``payoff_order`` lists debt indices as they are cleared,
+    starting with any entered at a zero balance, whose payoff month is 0.
+    """
+
+    strategy: str
+    debts: tuple
+    budget: float
+    payoff_month: np.ndarray
+    interest: np.ndarray
+    payoff_order: tuple
+    month_numbers: np.ndarray
+    balances: np.ndarray
+
+    @property
+    def debt_free_month(self) -> int:
+        return int(self.payoff_month.max()) if len(self.payoff_month) else 0
+
+    @property
+    def total_interest(self) -> float:
+        return float(self.interest.sum())
+
+    @property
+    def total_balance(self) -> np.ndarray:
+        """Combined balance after every month."""
+        return self.balances.sum(axis=0)
+
+    def payoff_table(self) -> list:
+        """One row per debt in the order it is cleared, ready for a table widget."""
+        return [
+            {
+                "Order": position,
+                "Debt": self.debts[index].name,
+                "Balance": self.debts[index].balance,
+                "Rate (%)": self.debts[index].annual_rate,
+                "Minimum": self.debts[index].minimum_payment,
+                "Paid Off (Month)": int(self.payoff_month[index]),
+                "Interest": float(self.interest[index]),
+            }
+            for position, index in enumerate(self.payoff_order, start=1)
+        ]
+
+
+def _priority(strategy, debts, order):
+    """Sort key per debt; the smallest key is paid down first."""
+    if strategy == SNOWBALL:
+        return [(debt.balance, -debt.annual_rate, index) for index, debt in enumerate(debts)]
+    if strategy == AVALANCHE:
+        return [(-debt.annual_rate, debt.balance, index) for index, debt in enumerate(debts)]
+    if strategy == CUSTOM:
+        if order is None or sorted(order) != list(range(len(debts))):
+            raise ValueError("custom ordering needs 'order', a permutation of the debt indices")
+        rank = {index: position for position, index in enumerate(order)}
+        return [(rank[index], index) for index in range(len(debts))]
+    raise ValueError(f"strategy must be {SNOWBALL!r}, {AVALANCHE!r} or {CUSTOM!r}, got {strategy!r}")
+
+
+def plan_payoff(debts: Sequence[Debt], budget: float, strategy: str = AVALANCHE,
+                order: Optional[Sequence[int]] = None) -> MultiDebtPlan:
+    """Simulate paying every debt's minimum plus the rest of ``budget`` to one target.
+
+    The target is the first unpaid debt by ``strategy``: smallest balance
+    (snowball), highest rate (avalanche) or the given ``order`` (custom). When a
+    debt is cleared its minimum rolls over to the target, and any unused part
+    of its last payment goes to the target in the same month.
+
+    Between payoffs every debt's balance follows the closed-form amortization
+    formula, so the simulation only stops at payoff events. The unpaid debts
+    sit in a priority queue ordered by strategy and their upcoming payoff
+    months in an event queue. Each event therefore costs O(log k) for k debts,
+    with no monthly rescan of all debts.
+    """
+    debts = tuple(debts)
+    count = len(debts)
+    if count == 0:
+        raise ValueError("a plan needs at least one debt")
+    minimums = np.array([debt.minimum_payment for debt in debts], dtype=float)
+    # Tolerate float noise from summing the same minimums in another order
+    if budget < minimums.sum() - 1e-9:
+        raise ValueError(f"budget {budget:,.2f} is below the total minimum payments {minimums.sum():,.2f}")
+
+    rates = [debt.annual_rate for debt in debts]
+    monthly_rates = [rate / 100 / 12 for rate in rates]
+
+    # Current segment of every debt: balance at anchor month, payment from then on
+    anchor = [0] * count
+    anchor_balance = [float(debt.balance) for debt in debts]
+    payment = list(minimums)
+    paid = [0.0] * count
+    version = [0] * count
+    segments = [[] for _ in range(count)]
+    rollovers = []
+    payoff = np.zeros(count, dtype=int)
+    done = [debt.balance <= 0 for debt in debts]
+
+    priority = _priority(strategy, debts, order)
+    targets = [priority[index] for index in range(count) if not done[index]]
+    heapq.heapify(targets)
+    events = []
+
+    def balance_at(index, month):
+        return float(remaining_balance(anchor_balance[index], rates[index], payment[index], month - anchor[index]))
+
+    def schedule(index):
+        months = float(payoff_months(anchor_balance[index], rates[index], payment[index]))
+        if math.isfinite(months):
+            month = anchor[index] + max(1, math.ceil(months - 1e-9))
+            heapq.heappush(events, (month, priority[index], index, version[index]))
+
+    def reanchor(index, month, new_payment, applied):
+        """Close the debt's current segment at ``month`` and start a new one."""
+        segments[index].append((anchor[index], anchor_balance[index], payment[index], month))
+        paid[index] += payment[index] * (month - anchor[index]) + applied
+        anchor_balance[index] = balance_at(index, month) - applied
+        rollovers.append((index, month, anchor_balance[index]))
+        anchor[index] = month
+        payment[index] = new_payment
+        version[index] += 1
+
+    def current_target():
+        while targets and done[targets[0][-1]]:
+            heapq.heappop(targets)
+        return targets[0][-1] if targets else None
+
+    extra = budget - minimums[[not flag for flag in done]].sum()
+    target = current_target()
+    if target is not None:
+        payment[target] += extra
+    for index in range(count):
+        if not done[index]:
+            schedule(index)
+
+    # Debts entered with nothing owed are cleared before the first payment
+    payoff_order = [index for index in range(count) if done[index]]
+    while events:
+        month, _, index, seen = heapq.heappop(events)
+        if done[index] or seen != version[index]:
+            continue
+        if month > MAX_MONTHS:
+            break
+
+        # Final, partial payment clears the debt; the remainder rolls over
+        owed = balance_at(index, month - 1) * (1 + monthly_rates[index])
+        leftover = max(0.0, payment[index] - owed)
+        segments[index].append((anchor[index], anchor_balance[index], payment[index], month - 1))
+        paid[index] += payment[index] * (month - 1 - anchor[index]) + owed
+        while True:
+            done[index] = True
+            payoff[index] = month
+            payoff_order.append(index)
+            extra += minimums[index]
+
+            target = current_target()
+            if target is None:
+                break
+            balance = balance_at(target, month)
+            if leftover < balance:
+                reanchor(target, month, minimums[target] + extra, leftover)
+                schedule(target)
+                break
+            # The leftover clears the new target too and keeps cascading
+            segments[target].append((anchor[target], anchor_balance[target], payment[target], month))
+            paid[target] += payment[target] * (month - anchor[target]) + balance
+            rollovers.append((target, month, 0.0))
+            leftover -= balance
+            index = target
+
+    if not all(done):
+        raise ValueError(f"this budget does not clear every debt within {MAX_MONTHS} months")
+
+    months = int(payoff.max())
+    month_numbers = np.arange(1, months + 1)
+    balances = np.zeros((count, months))
+    for index, parts in enumerate(segments):
+        for start, opening, amount, end in parts:
+            if end > start:
+                balances[index, start:end] = remaining_balance(
+                    opening, rates[index], amount, np.arange(1, end - start + 1)
+                )
+    for index, month, balance in rollovers:
+        balances[index, month - 1] = balance
+    balances = np.maximum(balances, 0.0)
+
+    interest = np.array(paid) - np.maximum([debt.balance for debt in debts], 0.0)
+    return MultiDebtPlan(
+        strategy=strategy,
+        debts=debts,
+        budget=budget,
+        payoff_month=payoff,
+        interest=interest,
+        payoff_order=tuple(payoff_order),
+        month_numbers=month_numbers,
+        balances=balances,
+    )
+
+
+def compare_strategies(debts: Sequence[Debt], budget: float, order: Optional[Sequence[int]] = None) -> dict:
+    """Plans for snowball and avalanche, plus the custom ``order`` when given."""
+    plans = {strategy: plan_payoff(debts, budget, strategy) for strategy in (SNOWBALL, AVALANCHE)}
+    if order is not None:
+        plans[CUSTOM] = plan_payoff(debts, budget, CUSTOM, order)
+    return plans
@@ -0,0 +1,200 @@
+"""Pay calendars: every payday between two dates, rolled off weekends and holidays.
+
+Named ``paydates`` rather than ``calendar`` so it never shadows the standard
+library module. Everything is ``numpy.datetime64`` arithmetic on whole arrays:
+a calendar for many employees is an (employees × paydays) array padded with
+``NaT`` past the end date.
+"""
+
+import csv
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+WEEKLY = "weekly"
+BIWEEKLY = "biweekly"
+SEMIMONTHLY = "semimonthly"
+MONTHLY = "monthly"
+
+# Nominal paydays per year; biweekly and weekly calendars sometimes have one more
+NOMINAL_PAYDAYS = {WEEKLY: 52, BIWEEKLY: 26, SEMIMONTHLY: 24, MONTHLY: 12}
+
+# Roll rules for a payday on a weekend or holiday, as named by np.busday_offset
+PRECEDING = "preceding"
+FOLLOWING = "following"
+MODIFIED_PRECEDING = "modifiedpreceding"
+MODIFIED_FOLLOWING = "modifiedfollowing"
+NO_ROLL = "none"
+
+DEFAULT_HOLIDAYS = os.environ.get(
+    "FINCALC_HOLIDAYS", os.path.join(os.path.dirname(__file__), "data", "holidays_us.csv")
+)
+SEMIMONTHLY_DAYS = (15, 31)
+
+# Furthest a roll can move a payday: a weekend plus a run of holidays
+MAX_ROLL_DAYS = np.timedelta64(7, "D")
+
+
+@functools.lru_cache(maxsize=None)
+def load_holidays(path: Optional[str] = DEFAULT_HOLIDAYS, weekmask: str = "1111100") -> np.busdaycalendar:
+    """Business-day calendar from a holiday file; built once per file and shared.
+
+    The file is a CSV whose first column is an ISO date (``#`` comments and a
+    header row allowed). ``None`` gives a calendar with weekends only.
+    """
+    holidays = []
+    if path is not None:
+        with open(path, newline="") as source:
+            for row in csv.reader(line for line in source if not line.startswith("#")):
+                if row and row[0][:1].isdigit():
+                    holidays.append(row[0].strip())
+    return np.busdaycalendar(weekmask=weekmask, holidays=np.array(holidays, dtype="datetime64[D]"))
+
+
+def add_months(dates, months) -> np.ndarray:
+    """``dates`` moved by whole ``months``, keeping the day of the month; vectorized.
+
+    Days past the end of a shorter month fall back to its last day, so Jan 31
+    plus one month is Feb 28 (or 29).
+    """
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    first_of_month = dates.astype("datetime64[M]")
+    day = dates - first_of_month.astype("datetime64[D]")
+    target = first_of_month + np.asarray(months)
+    month_end = (target + 1).astype("datetime64[D]") - np.timedelta64(1, "D")
+    return np.minimum(target.astype("datetime64[D]") + day, month_end)
+
+
+def _day_of_month(months, day):
+    """The ``day`` of each month in ``months`` (datetime64[M]), clamped to the month's end."""
+    month_end = (months + 1).astype("datetime64[D]") - np.timedelta64(1, "D")
+    return np.minimum(months.astype("datetime64[D]") + np.timedelta64(day - 1, "D"), month_end)
+
+
+def scheduled_paydays(first, end, frequency: str = BIWEEKLY, semimonthly_days=SEMIMONTHLY_DAYS) -> np.ndarray:
+    """Unrolled paydays from each ``first`` payday through ``end``: (employees × slots).
+
+    Weekly and biweekly paydays step by 7 or 14 days from ``first``; monthly
+    ones keep its day of the month; semimonthly ones fall on the two
+    ``semimonthly_days`` of every month (31 meaning the last day). Rows are
+    sorted and padded with ``NaT``.
+    """
+    first = np.atleast_1d(np.asarray(first, dtype="datetime64[D]"))
+    end = np.datetime64(end, "D")
+    span = max(int((end - first.min()).astype(int)), 0)
+
+    if frequency in (WEEKLY, BIWEEKLY):
+        step = 7 if frequency == WEEKLY else 14
+        dates = first[:, np.newaxis] + np.arange(span // step + 1) * np.timedelta64(step, "D")
+    elif frequency == MONTHLY:
+        months = int((end.astype("datetime64[M]") - first.min().astype("datetime64[M]")).astype(int))
+        dates = add_months(first[:, np.newaxis], np.arange(months + 1))
+    elif frequency == SEMIMONTHLY:
+        start_month = first.astype("datetime64[M]")[:, np.newaxis]
+        months = int((end.astype("datetime64[M]") - start_month.min()).astype(int))
+        month = start_month + np.arange(months + 1)
+        dates = np.stack([_day_of_month(month, day) for day in sorted(semimonthly_days)], axis=2)
+        dates = dates.reshape(len(first), -1)
+    else:
+        raise ValueError(f"frequency must be one of {', '.join(NOMINAL_PAYDAYS)}, got {frequency!r}")
+
+    dates = np.where((dates < first[:, np.newaxis]) | (dates > end), np.datetime64("NaT"), dates)
+    # NaT sorts last, so every row is left-aligned
+    dates = np.sort(dates, axis=1)
+    return dates[:, :int((~np.isnat(dates)).sum(axis=1).max())]
+
+
+@dataclass(frozen=True)
+class PayCalendar:
+    """Scheduled and actual paydays, (employees × slots) with ``NaT`` padding."""
+
+    frequency: str
+    roll: str
+    scheduled: np.ndarray
+    paydays: np.ndarray
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Number of paydays per employee."""
+        return (~np.isnat(self.paydays)).sum(axis=1)
+
+    @property
+    def moved(self) -> np.ndarray:
+        """Where a payday was rolled off a weekend or holiday; False on padding."""
+        return (self.paydays != self.scheduled) & ~np.isnat(self.scheduled)
+
+    def dates(self, employee: int = 0) -> np.ndarray:
+        """Paydays of one employee, without padding."""
+        row = self.paydays[employee]
+        return row[~np.isnat(row)]
+
+    def per_year(self):
+        """(years, counts): paydays in each calendar year, counts as (employees × years)."""
+        valid = ~np.isnat(self.paydays)
+        if not valid.any():
+            return np.array([], dtype=int), np.zeros((len(self.paydays), 0), dtype=int)
+        year = self.paydays.astype("datetime64[Y]").astype(np.int64) + 1970
+        first_year, last_year = int(year[valid].min()), int(year[valid].max())
+        width = last_year - first_year + 1
+        rows = np.broadcast_to(np.arange(len(self.paydays))[:, np.newaxis], year.shape)
+        flat = (rows * width + (year - first_year))[valid]
+        counts = np.bincount(flat, minlength=len(self.paydays) * width).reshape(len(self.paydays), width)
+        return np.arange(first_year, last_year + 1), counts
+
+
+def pay_calendar(first, end, frequency: str = BIWEEKLY, roll: str = PRECEDING,
+                 holidays: Optional[str] = DEFAULT_HOLIDAYS, semimonthly_days=SEMIMONTHLY_DAYS) -> PayCalendar:
+    """Every payday from ``first`` (one date or one per employee) through ``end``.
+
+    Paydays on a weekend or on a date in the ``holidays`` file are rolled
+    with ``roll``: to the previous business day (the payroll default), the
+    next one, their "modified" variants that stay within the month, or not
+    at all. ``holidays=None`` only skips weekends.
+    """
+    scheduled = scheduled_paydays(first, end, frequency, semimonthly_days)
+    if roll == NO_ROLL:
+        paydays = scheduled
+    else:
+        paydays = np.busday_offset(scheduled, 0, roll=roll, busdaycal=load_holidays(holidays))
+    return PayCalendar(frequency=frequency, roll=roll, scheduled=scheduled, paydays=paydays)
+
+
+def calendar_years(first, years: int, frequency: str = BIWEEKLY, roll: str = PRECEDING,
+                   holidays: Optional[str] = DEFAULT_HOLIDAYS, semimonthly_days=SEMIMONTHLY_DAYS) -> PayCalendar:
+    """Whole calendar years of paydays following the pattern of ``first``.
+
+    The pattern is carried back to ``first``'s year and runs through December
+    31 of the last of ``years`` years. Paydays are kept by the date they are
+    actually paid: a January 1 payday rolled back to December 31 belongs to
+    the year before and is left out, and one rolled in from outside the
+    range is kept, so :meth:`PayCalendar.per_year` counts complete years only.
+    """
+    first = np.atleast_1d(np.asarray(first, dtype="datetime64[D]"))
+    year = first.astype("datetime64[Y]")
+    days_into_year = (first - year.astype("datetime64[D]")).astype(int)
+    # Anchor one period before the year, so paydays rolled forward into it are scheduled
+    if frequency in (WEEKLY, BIWEEKLY):
+        step = 7 if frequency == WEEKLY else 14
+        anchor = first - (days_into_year // step + 1) * step
+    elif frequency == MONTHLY:
+        anchor = add_months(first, -(first.astype("datetime64[M]") - year.astype("datetime64[M]")).astype(int) - 1)
+    else:
+        anchor = (year.astype("datetime64[M]") - 1).astype("datetime64[D]")
+    start = year.astype("datetime64[D]")
+    end = (year.max() + years).astype("datetime64[D]") - 1
+    # Rolls move a payday by days, never by a whole pay period
+    calendar = pay_calendar(anchor, end + MAX_ROLL_DAYS, frequency, roll, holidays, semimonthly_days)
+
+    paydays = calendar.paydays
+    outside = (paydays < start[:, np.newaxis]) | (paydays > end)
+    paydays = np.where(outside, np.datetime64("NaT"), paydays)
+    scheduled = np.where(outside, np.datetime64("NaT"), calendar.scheduled)
+    # Left-align both arrays with the same permutation so they stay paired
+    order = np.argsort(np.isnat(paydays), axis=1, kind="stable")
+    paydays = np.take_along_axis(paydays, order, axis=1)
+    scheduled = np.take_along_axis(scheduled, order, axis=1)
+    width = int((~np.isnat(paydays)).sum(axis=1).max(initial=0))
+    return PayCalendar(frequency=frequency, roll=roll, scheduled=scheduled[:, :width], paydays=paydays[:, :width])
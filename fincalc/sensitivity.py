@@ -0,0 +1,52 @@
+"""Rate × horizon sensitivity of the compound interest projection."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from fincalc.compound import CompoundInputs, compound_final_balance
+
+
+@dataclass(frozen=True)
+class SensitivityGrid:
+    """Final balance for every (rate, horizon) pair; rows are rates, columns years."""
+
+    rates: np.ndarray
+    years: np.ndarray
+    final_balance: np.ndarray
+
+    def balance_at(self, rate: float, years: int) -> float:
+        """Final balance of the grid cell nearest to ``rate`` and ``years``."""
+        row = int(np.abs(self.rates - rate).argmin())
+        column = int(np.abs(self.years - years).argmin())
+        return float(self.final_balance[row, column])
+
+
+def rate_range(start: float = 0.0, stop: float = 15.0, step: float = 0.1) -> np.ndarray:
+    """Evenly spaced rates from ``start`` to ``stop`` inclusive, free of float drift."""
+    if step <= 0:
+        raise ValueError(f"step must be positive, got {step}")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return np.round(start + step * np.arange(count), 10)
+
+
+def sensitivity_grid(inputs: CompoundInputs, rates=None, years=None) -> SensitivityGrid:
+    """Evaluate the final balance over the outer product of ``rates`` × ``years``.
+
+    Amounts, compounding and contribution timing come from ``inputs``; its own
+    rate and horizon are replaced by the grid axes. Defaults to 0–15% in 0.1%
+    steps by 1–50 years. The whole grid is a single broadcast call of the
+    closed-form kernel, so it costs about as much as one projection.
+    """
+    rates = rate_range() if rates is None else np.asarray(rates, dtype=float)
+    years = np.arange(1, 51) if years is None else np.asarray(years)
+
+    final_balance = compound_final_balance(
+        inputs.initial_amount,
+        rates[:, np.newaxis],
+        inputs.monthly_contribution,
+        np.round(years * 12)[np.newaxis, :],
+        inputs.compounding,
+        inputs.contribution_timing,
+    )
+    return SensitivityGrid(rates=rates, years=years, final_balance=final_balance)
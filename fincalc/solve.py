@@ -0,0 +1,171 @@
+"""Root finding and goal seek for the compound interest projection."""
+
+import dataclasses
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from fincalc.compound import CompoundInputs, compound_final_balance
+
+CONTRIBUTION = "monthly_contribution"
+RATE = "annual_rate"
+YEARS = "years"
+
+# Highest annual rate (%) a rate search will consider before giving up
+MAX_RATE = 1000.0
+
+# Longest horizon (years) a horizon search will consider before giving up
+MAX_YEARS = 200
+
+
+def find_root(func, lo: float, hi: float, xtol: float = 1e-10, maxiter: int = 100) -> float:
+    """Brent's method: a root of ``func`` inside the sign-changing bracket [lo, hi].
+
+    Combines inverse quadratic interpolation and secant steps with bisection as
+    a fallback, so it converges superlinearly on smooth functions but never
+    leaves the bracket.
+    """
+    a, b = float(lo), float(hi)
+    fa, fb = func(a), func(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if np.sign(fa) == np.sign(fb):
+        raise ValueError(f"root is not bracketed: f({a}) = {fa}, f({b}) = {fb}")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if np.sign(fb) == np.sign(fc):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2 * np.finfo(float).eps * abs(b) + xtol / 2
+        midpoint = (c - b) / 2
+        if abs(midpoint) <= tol or fb == 0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            # Try interpolation
+            s = fb / fa
+            if a == c:
+                p = 2 * midpoint * s
+                q = 1 - s
+            else:
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * midpoint * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * midpoint * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = midpoint
+        else:
+            d = e = midpoint
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, midpoint)
+        fb = func(b)
+    return b
+
+
+@dataclass(frozen=True)
+class GoalSeekResult:
+    """Value of ``solved_for`` that makes the projection reach ``target``.
+
+    ``inputs`` is the original input set with the solved value filled in.
+    """
+
+    solved_for: str
+    value: float
+    target: float
+    inputs: CompoundInputs
+    final_balance: float
+
+
+def _final_balance(inputs: CompoundInputs) -> float:
+    return float(compound_final_balance(
+        inputs.initial_amount,
+        inputs.annual_rate,
+        inputs.monthly_contribution,
+        round(inputs.years * 12),
+        inputs.compounding,
+        inputs.contribution_timing,
+    ))
+
+
+def _result(solved_for, value, target, inputs):
+    solved = dataclasses.replace(inputs, **{solved_for: value})
+    return GoalSeekResult(solved_for, value, target, solved, _final_balance(solved))
+
+
+def required_contribution(inputs: CompoundInputs, target: float) -> GoalSeekResult:
+    """Monthly contribution that reaches ``target``, from the annuity closed form.
+
+    The final balance is linear in the contribution, so it is the shortfall of
+    the initial amount alone divided by the value of contributing $1 a month.
+    Returns 0 when the initial amount already gets there.
+    """
+    without = _final_balance(dataclasses.replace(inputs, monthly_contribution=0.0))
+    per_dollar = _final_balance(dataclasses.replace(inputs, initial_amount=0.0, monthly_contribution=1.0))
+    if per_dollar <= 0:
+        raise ValueError("the horizon is too short for monthly contributions to count")
+    return _result(CONTRIBUTION, max(0.0, (target - without) / per_dollar), target, inputs)
+
+
+def required_rate(inputs: CompoundInputs, target: float) -> GoalSeekResult:
+    """Annual rate (%) that reaches ``target``; 0 if contributions alone suffice."""
+    def shortfall(rate):
+        return _final_balance(dataclasses.replace(inputs, annual_rate=rate)) - target
+
+    if shortfall(0.0) >= 0:
+        return _result(RATE, 0.0, target, inputs)
+
+    hi = 10.0
+    while shortfall(hi) < 0:
+        if hi >= MAX_RATE:
+            raise ValueError(f"target {target:,.2f} needs an annual rate above {MAX_RATE:g}%")
+        hi = min(hi * 2, MAX_RATE)
+    return _result(RATE, find_root(shortfall, 0.0, hi, xtol=1e-9), target, inputs)
+
+
+def required_years(inputs: CompoundInputs, target: float) -> GoalSeekResult:
+    """Shortest horizon, in whole months expressed as years, that reaches ``target``."""
+    def shortfall(months):
+        return float(compound_final_balance(
+            inputs.initial_amount,
+            inputs.annual_rate,
+            inputs.monthly_contribution,
+            months,
+            inputs.compounding,
+            inputs.contribution_timing,
+        )) - target
+
+    if shortfall(0.0) >= 0:
+        return _result(YEARS, 0.0, target, inputs)
+
+    hi = 12.0
+    while shortfall(hi) < 0:
+        if hi >= MAX_YEARS * 12:
+            raise ValueError(f"target {target:,.2f} is not reached within {MAX_YEARS} years")
+        hi = min(hi * 2, MAX_YEARS * 12)
+
+    # Contributions arrive in whole months, so round the crossing up
+    months = math.ceil(find_root(shortfall, 0.0, hi, xtol=1e-6) - 1e-6)
+    return _result(YEARS, months / 12, target, inputs)
+
+
+def goal_seek(inputs: CompoundInputs, target: float, solve_for: str) -> GoalSeekResult:
+    """Solve ``inputs`` for ``solve_for`` (contribution, rate or years) to reach ``target``."""
+    solvers = {CONTRIBUTION: required_contribution, RATE: required_rate, YEARS: required_years}
+    if solve_for not in solvers:
+        raise ValueError(f"solve_for must be one of {sorted(solvers)}, got {solve_for!r}")
+    return solvers[solve_for](inputs, target)
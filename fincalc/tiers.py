@@ -0,0 +1,137 @@
+"""Tiered (assets-under-management) advisory fee schedules."""
+
+from dataclasses import dataclass
+from typing import Sequence, Tuple
+
+import numpy as np
+
+ANNUAL = "annual"
+MONTHLY = "monthly"
+
+DEFAULT_TIERS = (
+    (1_000_000, 1.0),
+    (5_000_000, 0.8),
+    (10_000_000, 0.6),
+    (float("inf"), 0.5),
+)
+
+
+@dataclass(frozen=True)
+class FeeSchedule:
+    """Marginal fee schedule with precomputed cumulative-breakpoint tables.
+
+    ``lower_bounds[i]`` is where tier ``i`` starts, ``rates[i]`` its annual rate
+    as a decimal, and ``cumulative[i]`` the annual fee owed on everything below
+    ``lower_bounds[i]``. A fee lookup is then a single ``np.searchsorted`` plus
+    one multiply-add, for any number of balances at once.
+    """
+
+    lower_bounds: np.ndarray
+    rates: np.ndarray
+    cumulative: np.ndarray
+
+    @classmethod
+    def from_tiers(cls, tiers: Sequence[Tuple[float, float]]) -> "FeeSchedule":
+        """Build from ``(up_to, rate_percent)`` pairs in increasing order of ``up_to``.
+
+        The last tier should be open-ended (``up_to = inf``); if it is not, its
+        rate also applies above its bound.
+        """
+        if not tiers:
+            raise ValueError("a fee schedule needs at least one tier")
+        upper = np.array([up_to for up_to, _ in tiers], dtype=float)
+        rates = np.array([rate for _, rate in tiers], dtype=float) / 100
+        if np.any(np.diff(upper) <= 0) or upper[0] <= 0:
+            raise ValueError("tier bounds must be positive and strictly increasing")
+        if np.any(rates < 0) or np.any(rates >= 1):
+            raise ValueError("tier rates must be between 0% and 100%")
+
+        lower = np.concatenate([[0.0], upper[:-1]])
+        widths = upper[:-1] - lower[:-1]
+        cumulative = np.concatenate([[0.0], np.cumsum(rates[:-1] * widths)])
+        return cls(lower_bounds=lower, rates=rates, cumulative=cumulative)
+
+    @classmethod
+    def flat(cls, rate: float) -> "FeeSchedule":
+        """A single rate (percent) on all assets."""
+        return cls.from_tiers([(float("inf"), rate)])
+
+    def annual_fee(self, balance):
+        """Annual fee in dollars on ``balance`` (scalar or array)."""
+        balance = np.maximum(np.asarray(balance, dtype=float), 0.0)
+        tier = np.searchsorted(self.lower_bounds, balance, side="right") - 1
+        return self.cumulative[tier] + self.rates[tier] * (balance - self.lower_bounds[tier])
+
+    def effective_rate(self, balance):
+        """Blended fee as a percentage of ``balance``."""
+        balance = np.asarray(balance, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(balance > 0, self.annual_fee(balance) / balance * 100, self.rates[0] * 100)
+
+
+@dataclass(frozen=True)
+class TieredFeeResult:
+    """Year-end values and cumulative dollars deducted as fees.
+
+    Rows are portfolios and columns years, with column 0 the starting point.
+    """
+
+    schedule: FeeSchedule
+    years: np.ndarray
+    values: np.ndarray
+    fees_paid: np.ndarray
+
+    @property
+    def final_values(self) -> np.ndarray:
+        return self.values[:, -1]
+
+    @property
+    def total_fees(self) -> np.ndarray:
+        return self.fees_paid[:, -1]
+
+
+def tiered_trajectories(
+    starting_amount,
+    monthly_contribution,
+    expected_return,
+    schedule: FeeSchedule,
+    years: int,
+    deduction: str = ANNUAL,
+) -> TieredFeeResult:
+    """Simulate portfolios under a tiered schedule; amounts may be arrays (one per portfolio).
+
+    With annual deduction each year mirrors :func:`~fincalc.fees.calculate_balance`:
+    a year's contributions go in at the start, the return is applied, then the
+    schedule's fee on the resulting balance is taken. With monthly deduction
+    each month adds one contribution, grows by (1 + r)^(1/12) and pays a
+    twelfth of the annual fee on the balance. The fee depends on the balance,
+    so periods are stepped in order, but each step is vectorized across all
+    portfolios.
+    """
+    if deduction not in (ANNUAL, MONTHLY):
+        raise ValueError(f"deduction must be {ANNUAL!r} or {MONTHLY!r}, got {deduction!r}")
+
+    starting_amount, monthly_contribution, expected_return = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(a, dtype=float)) for a in (starting_amount, monthly_contribution, expected_return))
+    )
+    years = int(years)
+    steps_per_year = 1 if deduction == ANNUAL else 12
+    deposit = monthly_contribution * 12 / steps_per_year
+    growth = (1 + expected_return / 100) ** (1 / steps_per_year)
+
+    values = np.empty((len(starting_amount), years + 1))
+    fees_paid = np.zeros_like(values)
+    values[:, 0] = starting_amount
+
+    balance = starting_amount.copy()
+    paid = np.zeros_like(balance)
+    for year in range(1, years + 1):
+        for _ in range(steps_per_year):
+            balance = (balance + deposit) * growth
+            fee = schedule.annual_fee(balance) / steps_per_year
+            balance = balance - fee
+            paid = paid + fee
+        values[:, year] = balance
+        fees_paid[:, year] = paid
+
+    return TieredFeeResult(schedule=schedule, years=np.arange(years + 1), values=values, fees_paid=fees_paid)
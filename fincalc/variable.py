@@ -0,0 +1,235 @@
+"""Variable-rate debt: promotional APRs, rate resets and adjustable-rate loans."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from fincalc.debt import level_payment, payoff_interest, payoff_months, remaining_balance
+
+
+@dataclass(frozen=True)
+class RateSchedule:
+    """Piecewise-constant annual rate in percent.
+
+    ``rates[j]`` applies from payment ``starts[j] + 1`` until the next start;
+    the first start is always 0 and the last rate holds forever.
+    """
+
+    starts: tuple
+    rates: tuple
+
+    def __post_init__(self):
+        if len(self.starts) != len(self.rates) or not self.starts:
+            raise ValueError("a rate schedule needs one start month per rate")
+        if self.starts[0] != 0 or any(b <= a for a, b in zip(self.starts, self.starts[1:])):
+            raise ValueError("start months must begin at 0 and increase strictly")
+
+    @classmethod
+    def constant(cls, annual_rate: float) -> "RateSchedule":
+        return cls(starts=(0,), rates=(annual_rate,))
+
+    @classmethod
+    def promotional(cls, promo_rate: float, promo_months: int, annual_rate: float) -> "RateSchedule":
+        """An introductory rate for ``promo_months`` payments, then ``annual_rate``."""
+        if promo_months <= 0:
+            return cls.constant(annual_rate)
+        return cls(starts=(0, promo_months), rates=(promo_rate, annual_rate))
+
+    def rate_at(self, month) -> np.ndarray:
+        """Rate charged on payment ``month`` (1-based); vectorized."""
+        index = np.searchsorted(self.starts, np.asarray(month) - 1, side="right") - 1
+        return np.asarray(self.rates, dtype=float)[index]
+
+
+@dataclass(frozen=True)
+class VariableRateResult:
+    """Payoff of a batch of loans under their rate schedules.
+
+    ``opening_balance`` and ``payment`` are (loans × segments): the balance at
+    the start of each rate segment and the monthly payment made during it.
+    Segments a loan never reaches have a zero opening balance, and padding
+    segments of shorter schedules start at ``inf``.
+    """
+
+    starts: np.ndarray
+    rates: np.ndarray
+    opening_balance: np.ndarray
+    payment: np.ndarray
+    payoff_months: np.ndarray
+    total_interest: np.ndarray
+
+    def balance_at(self, months) -> np.ndarray:
+        """Balance of every loan after each payment in ``months``: (loans × months)."""
+        months = np.asarray(months, dtype=float)
+        # Segment in force after each payment, per loan
+        segment = (self.starts[:, np.newaxis, :] < months[np.newaxis, :, np.newaxis]).sum(axis=2) - 1
+        segment = np.maximum(segment, 0)
+        pick = np.take_along_axis
+        balance = remaining_balance(
+            pick(self.opening_balance, segment, axis=1),
+            pick(self.rates, segment, axis=1),
+            pick(self.payment, segment, axis=1),
+            months[np.newaxis, :] - pick(self.starts, segment, axis=1),
+        )
+        paid_off = months[np.newaxis, :] >= self.payoff_months[:, np.newaxis]
+        return np.where(paid_off, 0.0, np.maximum(balance, 0.0))
+
+
+def _pad(schedules):
+    """Stack schedules of different lengths into (loans × segments) arrays.
+
+    Shorter schedules repeat their last rate at an unreachable start month, so
+    padded segments have zero length.
+    """
+    width = max(len(schedule.starts) for schedule in schedules)
+    starts = np.full((len(schedules), width), np.inf)
+    rates = np.zeros((len(schedules), width))
+    for row, schedule in enumerate(schedules):
+        count = len(schedule.starts)
+        starts[row, :count] = schedule.starts
+        rates[row, :count] = schedule.rates
+        rates[row, count:] = schedule.rates[-1]
+    return starts, rates
+
+
+def variable_rate_payoff(total_debt, schedules, monthly_payment=None, term_months=None) -> VariableRateResult:
+    """Pay off every loan in ``total_debt`` under its own rate schedule.
+
+    ``schedules`` is one :class:`RateSchedule` for all loans or a sequence with
+    one per loan. Each loan either pays a fixed ``monthly_payment`` (cards and
+    balance transfers) or, given ``term_months``, re-amortizes over the
+    remaining term at every rate change (adjustable-rate loans).
+
+    Within a segment the balance and payoff time follow the closed-form
+    amortization formulas, and the segments are chained, so the cost grows
+    with the number of rate changes and not the number of months. Loans whose
+    payment never covers the interest get ``inf`` payoff months and interest.
+    """
+    total_debt = np.atleast_1d(np.asarray(total_debt, dtype=float))
+    loans = len(total_debt)
+    if isinstance(schedules, RateSchedule):
+        schedules = [schedules] * loans
+    if len(schedules) != loans:
+        raise ValueError(f"got {len(schedules)} rate schedules for {loans} loans")
+    if (monthly_payment is None) == (term_months is None):
+        raise ValueError("pass exactly one of monthly_payment or term_months")
+
+    starts, rates = _pad(schedules)
+    segments = starts.shape[1]
+    ends = np.concatenate([starts[:, 1:], np.full((loans, 1), np.inf)], axis=1)
+    if term_months is not None:
+        term_months = np.broadcast_to(np.asarray(term_months, dtype=float), (loans,))
+    else:
+        fixed_payment = np.broadcast_to(np.asarray(monthly_payment, dtype=float), (loans,))
+
+    opening = np.zeros((loans, segments))
+    payment = np.zeros((loans, segments))
+    payoff = np.full(loans, np.inf)
+    interest = np.zeros(loans)
+    balance = total_debt.copy()
+    open_loans = balance > 0
+    payoff[~open_loans] = 0.0
+
+    with np.errstate(invalid="ignore"):
+        for j in range(segments):
+            reached = open_loans & np.isfinite(starts[:, j])
+            if not reached.any():
+                break
+            start = starts[:, j]
+            if term_months is None:
+                amount = fixed_payment
+            else:
+                amount = level_payment(balance, rates[:, j], term_months - start)
+            opening[:, j] = np.where(reached, balance, 0.0)
+            payment[:, j] = np.where(reached, amount, 0.0)
+
+            length = ends[:, j] - start
+            needed = payoff_months(balance, rates[:, j], amount)
+            # A term ending on a rate change leaves float noise (needed = length + 1e-12), not a balance
+            cleared = reached & (needed <= length + 1e-9)
+
+            payoff = np.where(cleared, start + np.minimum(needed, length), payoff)
+            interest += np.where(cleared, payoff_interest(balance, amount, needed), 0.0)
+
+            carried = reached & ~cleared & np.isfinite(length)
+            closing = remaining_balance(balance, rates[:, j], amount, np.where(carried, length, 0.0))
+            interest += np.where(carried, amount * length - (balance - closing), 0.0)
+            balance = np.where(carried, closing, balance)
+
+            # The last segment runs forever, so a loan still open there never pays off
+            open_loans = carried
+
+    interest = np.where(np.isfinite(payoff), interest, np.inf)
+    return VariableRateResult(
+        starts=starts,
+        rates=rates,
+        opening_balance=opening,
+        payment=payment,
+        payoff_months=payoff,
+        total_interest=interest,
+    )
+
+
+@dataclass(frozen=True)
+class VariableDebtInputs:
+    """Inputs of the debt-free date calculator with a changing rate."""
+
+    total_debt: float
+    schedule: RateSchedule
+    monthly_payment: float
+    extra_payment: float = 0.0
+    term_months: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class VariableDebtResult:
+    """Payoff of one variable-rate debt with and without the extra payment."""
+
+    inputs: VariableDebtInputs
+    months_standard: float
+    months_extra: float
+    total_interest_standard: float
+    total_interest_extra: float
+    month_numbers: np.ndarray
+    balance_standard: np.ndarray
+    balance_extra: np.ndarray
+
+    @property
+    def months_saved(self) -> float:
+        return self.months_standard - self.months_extra
+
+    @property
+    def interest_saved(self) -> float:
+        return self.total_interest_standard - self.total_interest_extra
+
+
+def project_variable_debt(inputs: VariableDebtInputs) -> VariableDebtResult:
+    """The variable-rate counterpart of ``project_debt``.
+
+    Both scenarios are one batch of two loans. With ``term_months`` the
+    payment is recast at each rate change and the extra payment is ignored,
+    since the term fixes the payoff date. Raises ``ValueError`` when the
+    payment stops covering the interest.
+    """
+    if inputs.term_months is None:
+        payments = [inputs.monthly_payment, inputs.monthly_payment + inputs.extra_payment]
+        result = variable_rate_payoff([inputs.total_debt] * 2, inputs.schedule, monthly_payment=payments)
+    else:
+        result = variable_rate_payoff([inputs.total_debt] * 2, inputs.schedule, term_months=inputs.term_months)
+    if not np.all(np.isfinite(result.payoff_months)):
+        raise ValueError("the monthly payment does not cover the monthly interest once the rate changes")
+
+    months = int(np.ceil(result.payoff_months.max() - 1e-9))
+    month_numbers = np.arange(1, months + 1)
+    balances = result.balance_at(month_numbers)
+    return VariableDebtResult(
+        inputs=inputs,
+        months_standard=float(result.payoff_months[0]),
+        months_extra=float(result.payoff_months[1]),
+        total_interest_standard=float(result.total_interest[0]),
+        total_interest_extra=float(result.total_interest[1]),
+        month_numbers=month_numbers,
+        balance_standard=balances[0],
+        balance_extra=balances[1],
+    )
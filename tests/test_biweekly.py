@@ -0,0 +1,133 @@
+import math
+
+import numpy as np
+import pytest
+
+from fincalc.biweekly import BiweeklyInputs, accelerated_biweekly, convert_bulk, convert_to_biweekly, split_cents
+
+
+def accrual_loop(balance, annual_rate, payment, days=14):
+    """Pay ``payment`` every ``days`` days, accruing simple daily interest in between."""
+    payments, interest = 0, 0.0
+    # Stop at half a cent so float residue does not add a payment
+    while balance > 0.005:
+        charge = balance * annual_rate / 100 / 365 * days
+        balance += charge
+        interest += charge
+        balance -= min(payment, balance)
+        payments += 1
+    return payments, interest
+
+
+def monthly_loop(balance, annual_rate, payment):
+    interest = 0.0
+    while balance > 0.005:
+        charge = balance * annual_rate / 1200
+        interest += charge
+        balance -= min(payment, balance + charge) - charge
+    return interest
+
+
+LOANS = [
+    (300_000, 6.5, 30),
+    (250_000, 3.0, 15),
+    (40_000, 9.9, 5),
+    (500_000, 0.0, 30),
+    (120_000, 18.0, 25),
+]
+
+
+@pytest.mark.parametrize("loan_balance, annual_rate, term_years", LOANS)
+def test_matches_fourteen_day_accrual_loop(loan_balance, annual_rate, term_years):
+    result = accelerated_biweekly(loan_balance, annual_rate, term_years)
+    payment = float(result.biweekly_payment[0])
+    payments, interest = accrual_loop(loan_balance, annual_rate, payment)
+    fractional = float(result.biweekly_payments[0])
+    assert math.ceil(fractional - 1e-9) == payments
+    assert float(result.biweekly_years[0]) == pytest.approx(fractional * 14 / 365)
+    # The closed form prices the last, partial payment pro rata instead of as a whole period
+    assert float(result.biweekly_interest[0]) == pytest.approx(interest, abs=payment * annual_rate / 100 * 14 / 365 + 1e-6)
+
+    monthly_interest = monthly_loop(loan_balance, annual_rate, float(result.monthly_payment[0]))
+    assert float(result.monthly_interest[0]) == pytest.approx(monthly_interest, rel=1e-9, abs=1e-6)
+    assert float(result.interest_saved[0]) == pytest.approx(
+        monthly_interest - interest, abs=payment * annual_rate / 100 * 14 / 365 + 1e-6
+    )
+    assert float(result.years_saved[0]) >= 0
+
+
+def test_vectorized_over_loans():
+    balances, rates, terms = (np.array(column, dtype=float) for column in zip(*LOANS))
+    result = accelerated_biweekly(balances, rates, terms)
+    for index, loan in enumerate(LOANS):
+        single = accelerated_biweekly(*loan)
+        assert result.biweekly_payments[index] == pytest.approx(single.biweekly_payments[0], rel=1e-12)
+        assert result.biweekly_interest[index] == pytest.approx(single.biweekly_interest[0], rel=1e-12, abs=1e-9)
+
+
+def test_balance_series_follow_the_loops():
+    result = accelerated_biweekly(200_000, 5.0, 30)
+    years = np.arange(0, 31)
+    biweekly = result.biweekly_balance(years)[0]
+    monthly = result.monthly_balance(years)[0]
+    assert biweekly[0] == monthly[0] == 200_000
+    assert monthly[-1] == pytest.approx(0.0, abs=1e-6)
+    assert biweekly[-1] == 0.0
+    assert np.all(biweekly <= monthly + 1e-9)
+
+    balance, payment = 200_000.0, float(result.biweekly_payment[0])
+    for made in range(1, 27 * 5):
+        balance = balance * (1 + 5.0 / 100 / 365 * 14) - payment
+        if made == int(5 * 365 / 14):
+            assert biweekly[5] == pytest.approx(balance, rel=1e-9)
+
+
+@pytest.mark.parametrize("parts", [1, 12, 26, 52])
+def test_split_cents_sums_exactly_and_spreads_remainders(parts):
+    totals = np.array([0, 1, 25, 26, 27, 99_999, 1_234_567, 10 ** 15 + 13])
+    split = split_cents(totals, parts)
+    assert split.shape == (len(totals), parts)
+    assert split.dtype == np.int64
+    np.testing.assert_array_equal(split.sum(axis=1), totals)
+    np.testing.assert_array_equal(split.max(axis=1) - split.min(axis=1), (totals % parts != 0).astype(int))
+    # Extra cents are spread: any run of k payments carries floor or ceil of k / parts of them
+    extras = split - totals[:, np.newaxis] // parts
+    for k in range(1, parts + 1):
+        window = np.lib.stride_tricks.sliding_window_view(extras, k, axis=1).sum(axis=-1)
+        share = (totals % parts)[:, np.newaxis] * k / parts
+        assert np.all(window >= np.floor(share)) and np.all(window <= np.ceil(share))
+
+
+def test_split_cents_of_a_scalar():
+    np.testing.assert_array_equal(split_cents(54, 26), [2] * 12 + [3] + [2] * 12 + [3])
+
+
+def test_convert_bulk_matches_single_conversion_in_cents():
+    amounts = np.array([1_000.0, 2_500.55, 0.01, 78_000.0, 1_234.565])
+    types = np.array(["Monthly", "Annual", "monthly", "ANNUAL", " m "])
+    bulk = convert_bulk(amounts, types)
+    np.testing.assert_array_equal(bulk.annual_cents, [1_200_000, 250_055, 12, 7_800_000, 1_481_484])
+    payments = bulk.payments()
+    np.testing.assert_array_equal(payments.sum(axis=1), bulk.annual_cents)
+    np.testing.assert_array_equal(payments.min(axis=1), bulk.regular_cents)
+    np.testing.assert_array_equal((payments > bulk.regular_cents[:, np.newaxis]).sum(axis=1), bulk.extra_cent_payments)
+    for amount, kind, biweekly in zip(amounts, ("Monthly", "Annual", "Monthly", "Annual"), bulk.biweekly_amount):
+        single = convert_to_biweekly(BiweeklyInputs(round(amount, 2), kind))
+        assert biweekly == pytest.approx(math.floor(single.biweekly_amount * 100 + 1e-6) / 100)
+
+
+@pytest.mark.parametrize("labels", ["A", "a", "Annual", "aNnUaL"])
+def test_convert_bulk_accepts_one_label_for_every_row(labels):
+    bulk = convert_bulk([2_600.0, 13.0], labels)
+    np.testing.assert_array_equal(bulk.regular_cents, [10_000, 50])
+
+
+@pytest.mark.parametrize("labels, bad", [(["Monthly", "Weekly"], "'Weekly'"), (["", "A"], "''"), ("Biweekly", "'Biweekly'")])
+def test_convert_bulk_rejects_unknown_labels(labels, bad):
+    with pytest.raises(ValueError, match=f"input type must be .* got {bad}"):
+        convert_bulk([100.0, 200.0], labels)
+
+
+def test_convert_bulk_rejects_missing_amounts():
+    with pytest.raises(ValueError, match="row 2: amount is missing"):
+        convert_bulk([100.0, float("nan")])
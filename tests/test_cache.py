@@ -0,0 +1,126 @@
+import dataclasses
+import datetime
+
+import numpy as np
+import pytest
+
+from fincalc.cache import ResultCache, cached, normalize
+from fincalc.debt import DebtInputs, project_debt
+from fincalc.multidebt import Debt, compare_strategies
+
+
+def test_repeat_calls_are_served_from_the_cache():
+    cache = ResultCache(maxsize=4, ttl=None)
+    calls = []
+    square = cached(lambda x: calls.append(x) or x * x, cache=cache)
+    assert square(3) == square(3.0) == 9
+    assert calls == [3]
+    assert cache.stats().hits == 1
+
+
+def test_nested_arrays_are_read_only():
+    cache = ResultCache(ttl=None)
+    result = cached(project_debt, cache=cache)(DebtInputs(10_000, 18, 300, 50))
+    with pytest.raises(ValueError):
+        result.schedule.balance[0] = 0
+    plans = cached(compare_strategies, cache=cache)([Debt("a", 1_000, 20, 50), Debt("b", 2_000, 10, 60)], 200)
+    for plan in plans.values():
+        with pytest.raises(ValueError):
+            plan.balances[0, 0] = 0
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = ResultCache(maxsize=100, ttl=None, maxbytes=3 * 8_000)
+    make = cached(lambda n, tag: np.zeros(n), cache=cache)
+    for tag in range(4):
+        make(1_000, tag)
+    stats = cache.stats()
+    assert stats.size == 3 and stats.evictions == 1 and stats.nbytes == 3 * 8_000
+
+
+def test_results_over_the_byte_budget_are_not_cached():
+    cache = ResultCache(ttl=None, maxbytes=1_000)
+    calls = []
+    make = cached(lambda n: calls.append(n) or np.zeros(n), cache=cache)
+    make(1_000)
+    make(1_000)
+    assert len(calls) == 2 and len(cache) == 0
+
+
+def test_views_count_their_buffer_once():
+    cache = ResultCache(ttl=None)
+    base = np.zeros(1_000)
+    cache.get_or_compute("key", lambda: (base[:10], base[10:]))
+    assert cache.stats().nbytes == base.nbytes
+
+
+def test_functions_sharing_a_qualified_name_do_not_share_entries():
+    cache = ResultCache(ttl=None)
+    double = cached(lambda x: x * 2, cache=cache)
+    triple = cached(lambda x: x * 3, cache=cache)
+    assert double.__qualname__ == triple.__qualname__
+    assert (double(5), triple(5)) == (10, 15)
+
+    def make(factor):
+        def scale(x):
+            return x * factor
+        return cached(scale, cache=cache)
+
+    assert [make(factor)(7) for factor in (1, 2, 3)] == [7, 14, 21]
+
+
+def test_rewrapping_the_same_function_shares_entries():
+    cache = ResultCache(ttl=None)
+    first = cached(project_debt, cache=cache)
+    second = cached(project_debt, cache=cache)
+    assert first(DebtInputs(10_000, 18, 300)) is second(DebtInputs(10_000, 18, 300))
+
+
+def test_returned_inputs_stay_writable():
+    cache = ResultCache(ttl=None)
+    identity = cached(lambda values, scale: (values, values[1:] * scale, {"same": values[:2]}), cache=cache)
+    values = np.arange(5.0)
+    same, scaled, nested = identity(values, 2)
+    assert values.flags.writeable
+    values[0] = 99.0
+    assert same[0] == 0.0 and nested["same"][0] == 0.0
+    for array in (same, scaled, nested["same"]):
+        assert not array.flags.writeable
+    # Equal inputs hit the entry, which the change to ``values`` did not reach
+    assert identity(np.arange(5.0), 2)[0] is same
+
+
+def test_returned_input_inside_a_frozen_dataclass_is_copied():
+    @dataclasses.dataclass(frozen=True)
+    class Wrapped:
+        values: np.ndarray
+        label: str
+
+    cache = ResultCache(ttl=None)
+    wrap = cached(lambda values: Wrapped(values, "x"), cache=cache)
+    values = np.ones(3)
+    result = wrap(values)
+    assert values.flags.writeable and not result.values.flags.writeable
+    assert result.label == "x" and not np.shares_memory(result.values, values)
+
+
+@pytest.mark.parametrize("value, same, different", [
+    (np.bool_(True), True, False),
+    (datetime.date(2026, 3, 1), datetime.date(2026, 3, 1), datetime.date(2026, 3, 2)),
+    (datetime.datetime(2026, 3, 1, 9, 30), datetime.datetime(2026, 3, 1, 9, 30), datetime.date(2026, 3, 1)),
+    (datetime.time(9, 30), datetime.time(9, 30), datetime.time(9, 31)),
+    (np.datetime64("2026-03-01"), np.datetime64("2026-03-01"), np.datetime64("2026-03-02")),
+])
+def test_widget_values_normalize(value, same, different):
+    assert normalize(value) == normalize(same)
+    assert normalize(value) != normalize(different)
+    hash(normalize(value))
+
+
+def test_cached_call_with_date_and_numpy_bool():
+    cache = ResultCache(ttl=None)
+    calls = []
+    describe = cached(lambda start, flag: calls.append(start) or f"{start:%Y} {flag}", cache=cache)
+    assert describe(datetime.date(2026, 1, 5), np.bool_(False)) == "2026 False"
+    assert describe(datetime.date(2026, 1, 5), False) == "2026 False"
+    assert len(calls) == 1
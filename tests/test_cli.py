@@ -0,0 +1,49 @@
+import csv
+
+import pytest
+
+from fincalc.cli import main
+
+
+def run_cli(tmp_path, calculator, text, *args):
+    source = tmp_path / "input.csv"
+    target = tmp_path / "output.csv"
+    source.write_text(text)
+    main([calculator, str(source), "-o", str(target), *args])
+    with open(target, newline="") as output:
+        return list(csv.DictReader(output))
+
+
+def test_biweekly_rows_sum_to_the_annual_amount(tmp_path):
+    rows = run_cli(tmp_path, "biweekly", "amount,input_type\n1000,Monthly\n26000.01,annual\nnan,M\n500,weekly\n",
+                   "--payments")
+    assert rows[0]["annual_equivalent"] == "12000.00"
+    assert rows[0]["biweekly_payment"] == "461.53"
+    for row in rows[:2]:
+        payments = [float(row[f"payment_{period}"]) for period in range(1, 27)]
+        assert round(sum(payments), 2) == float(row["annual_equivalent"])
+    # A missing amount or an unknown type gives nan rather than stopping the file
+    assert rows[2]["annual_equivalent"] == rows[3]["annual_equivalent"] == "nan"
+
+
+def test_debt_rows_that_never_pay_off_are_inf(tmp_path):
+    rows = run_cli(tmp_path, "debt", "total_debt,annual_rate,monthly_payment\n10000,12,500\n10000,12,50\n")
+    assert float(rows[0]["months_standard"]) == pytest.approx(22.43, abs=0.01)
+    assert rows[1]["months_standard"] == "inf"
+
+
+@pytest.mark.parametrize("workers", ["1", "2"])
+def test_blank_cell_names_the_line_and_column(tmp_path, workers):
+    text = "total_debt,annual_rate,monthly_payment\n1000,5,100\n\n2000,,100\n"
+    with pytest.raises(SystemExit, match=r"line 4, column 'annual_rate': '' is not a number"):
+        run_cli(tmp_path, "debt", text, "--workers", workers, "--chunk-size", "1")
+
+
+def test_short_row_is_reported(tmp_path):
+    with pytest.raises(SystemExit, match="line 3: expected 3 fields, got 2"):
+        run_cli(tmp_path, "debt", "total_debt,annual_rate,monthly_payment\n1000,5,100\n1000,5\n")
+
+
+def test_schedule_reports_bad_cells_too(tmp_path):
+    with pytest.raises(SystemExit, match=r"line 2, column 'total_debt'"):
+        run_cli(tmp_path, "schedule", "total_debt,annual_rate,monthly_payment\nabc,5,100\n")
@@ -0,0 +1,122 @@
+import random
+
+import numpy as np
+import pytest
+
+from fincalc.batch import project_compound_batch
+from fincalc.compound import (
+    COMPOUNDING_FREQUENCIES,
+    END,
+    START,
+    CompoundInputs,
+    compound_final_balance,
+    project_compound,
+)
+from fincalc.fees import FeeInputs, calculate_balance, compare_fees, fee_final_balance, fee_paths
+
+
+def baseline_balance(initial_amount, annual_rate, monthly_contribution, years):
+    """The original page's loop: annual compounding, each deposit grown for its remaining years."""
+    r = annual_rate / 100
+    balance = initial_amount * (1 + r) ** years
+    for month in range(1, int(12 * years) + 1):
+        balance += monthly_contribution * (1 + r) ** (years - (month - 1) / 12)
+    return balance
+
+
+def monthly_loop(initial_amount, annual_rate, monthly_contribution, months, compounding, timing):
+    """Month-by-month loop growing the balance by one month of ``compounding``-times-a-year interest."""
+    growth = (1 + annual_rate / 100 / compounding) ** (compounding / 12)
+    balance = initial_amount
+    for _ in range(months):
+        if timing == START:
+            balance = (balance + monthly_contribution) * growth
+        else:
+            balance = balance * growth + monthly_contribution
+    return balance
+
+
+@pytest.mark.parametrize("years", [1, 5, 30])
+@pytest.mark.parametrize("annual_rate", [0.0, 4.5, 12.0])
+def test_annual_start_matches_baseline(years, annual_rate):
+    result = project_compound(CompoundInputs(10_000, annual_rate, 250, years))
+    assert result.final_balance == pytest.approx(baseline_balance(10_000, annual_rate, 250, years), rel=1e-10)
+    assert result.total_contributions == pytest.approx(10_000 + 250 * 12 * years)
+
+
+@pytest.mark.parametrize("compounding", sorted(COMPOUNDING_FREQUENCIES.values()))
+@pytest.mark.parametrize("timing", [START, END])
+def test_final_balance_matches_monthly_loop(compounding, timing):
+    rng = random.Random(compounding)
+    for _ in range(20):
+        initial = rng.uniform(0, 100_000)
+        rate = rng.uniform(0, 20)
+        contribution = rng.uniform(0, 2_000)
+        months = rng.randint(0, 600)
+        expected = monthly_loop(initial, rate, contribution, months, compounding, timing)
+        got = float(compound_final_balance(initial, rate, contribution, months, compounding, timing))
+        assert got == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.parametrize("timing", [START, END])
+def test_projection_month_samples_match_monthly_loop(timing):
+    for compounding in COMPOUNDING_FREQUENCIES.values():
+        result = project_compound(CompoundInputs(5_000, 7.0, 300, 3, compounding, timing))
+        whole_months = np.isclose(result.months, np.round(result.months))
+        for month, balance in zip(result.months[whole_months], result.balance[whole_months]):
+            expected = monthly_loop(5_000, 7.0, 300, int(round(month)), compounding, timing)
+            assert balance == pytest.approx(expected, rel=1e-10)
+
+
+def test_batch_matches_single_projections():
+    rng = np.random.default_rng(3)
+    rows = 200
+    initial = rng.uniform(0, 50_000, rows)
+    rate = rng.uniform(0, 15, rows)
+    contribution = rng.uniform(0, 1_000, rows)
+    years = rng.integers(1, 40, rows)
+    compounding = rng.choice(list(COMPOUNDING_FREQUENCIES.values()), rows)
+
+    batch = project_compound_batch(initial, rate, contribution, years, compounding, END, chunk_size=17)
+    for row in range(rows):
+        single = project_compound(
+            CompoundInputs(initial[row], rate[row], contribution[row], int(years[row]), int(compounding[row]), END)
+        )
+        assert batch.final_balance[row] == pytest.approx(single.final_balance, rel=1e-12)
+        assert batch.total_contributions[row] == pytest.approx(single.total_contributions)
+
+
+def test_unknown_timing_is_rejected():
+    with pytest.raises(ValueError, match="contribution timing"):
+        compound_final_balance(1_000, 5, 100, 12, timing="middle")
+
+
+@pytest.mark.parametrize("fee", [0.0, 0.25, 1.5])
+@pytest.mark.parametrize("expected_return", [-3.0, 0.0, 7.0])
+def test_fee_closed_form_matches_yearly_loop(expected_return, fee):
+    for years in (0, 1, 10, 40):
+        expected = calculate_balance(25_000, 500, expected_return / 100, fee / 100, years)
+        got = float(fee_final_balance(25_000, 500, expected_return, fee, years))
+        assert got == pytest.approx(expected, rel=1e-10, abs=1e-6)
+
+
+def test_compare_fees_trajectories_match_yearly_loop():
+    inputs = FeeInputs(starting_amount=40_000, monthly_contribution=750, expected_return=6.5,
+                       self_managed_fee=0.2, advisor_fee=1.25, years=25)
+    result = compare_fees(inputs)
+    for values, fee in ((result.self_values, 0.2), (result.advisor_values, 1.25), (result.no_fee_values, 0.0)):
+        expected = [calculate_balance(40_000, 750, 0.065, fee / 100, year) for year in range(26)]
+        np.testing.assert_allclose(values, expected, rtol=1e-10)
+
+
+def test_fee_paths_match_yearly_loop():
+    rng = np.random.default_rng(11)
+    returns = rng.normal(7, 15, size=(5, 30))
+    paths = fee_paths(10_000, 400, returns, 0.8)
+    for path, values in zip(returns, paths):
+        balance = 10_000
+        expected = [balance]
+        for annual_return in path:
+            balance = (balance + 400 * 12) * (1 + annual_return / 100) * (1 - 0.008)
+            expected.append(balance)
+        np.testing.assert_allclose(values, expected, rtol=1e-9)
@@ -0,0 +1,119 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from fincalc.debt import (
+    DebtInputs,
+    amortization_schedule,
+    extra_payment_sweep,
+    level_payment,
+    payoff_interest,
+    payoff_months,
+    project_debt,
+    remaining_balance,
+)
+
+
+def baseline_payoff(total_debt, annual_rate, monthly_payment):
+    """The original page's closed form: fractional months and P * n - D of interest."""
+    monthly_rate = annual_rate / 100 / 12
+    if monthly_rate > 0:
+        months = -math.log(1 - (total_debt * monthly_rate) / monthly_payment) / math.log(1 + monthly_rate)
+    else:
+        months = total_debt / monthly_payment
+    return months, monthly_payment * months - total_debt
+
+
+def monthly_loop(total_debt, annual_rate, monthly_payment):
+    """Month-by-month amortization; the last payment is whatever is left."""
+    balance = total_debt
+    balances, interest = [], []
+    while balance > 1e-9:
+        charge = balance * annual_rate / 1200
+        balance = max(balance + charge - monthly_payment, 0.0)
+        interest.append(charge)
+        balances.append(balance)
+    return balances, interest
+
+
+def random_loans(seed, count=50):
+    rng = random.Random(seed)
+    for _ in range(count):
+        debt = rng.uniform(500, 80_000)
+        rate = rng.choice([0.0, rng.uniform(0.5, 29.99)])
+        payment = debt * rate / 1200 * rng.uniform(1.05, 4) if rate else debt / rng.randint(3, 120)
+        yield debt, rate, payment
+
+
+def test_payoff_matches_baseline_formula():
+    for debt, rate, payment in random_loans(1):
+        months, interest = baseline_payoff(debt, rate, payment)
+        assert float(payoff_months(debt, rate, payment)) == pytest.approx(months, rel=1e-10)
+        assert float(payoff_interest(debt, payment, months)) == pytest.approx(interest, rel=1e-9, abs=1e-6)
+
+
+def test_schedule_matches_monthly_loop():
+    for debt, rate, payment in random_loans(2):
+        balances, interest = monthly_loop(debt, rate, payment)
+        schedule = amortization_schedule(debt, rate, [payment])
+        assert int(schedule.payoff_month[0]) == len(balances)
+        np.testing.assert_allclose(schedule.balance[0], balances, rtol=1e-9, atol=1e-6)
+        np.testing.assert_allclose(schedule.interest[0], interest, rtol=1e-9, atol=1e-6)
+        assert float(schedule.total_paid[0]) == pytest.approx(debt + sum(interest), rel=1e-10)
+        assert math.ceil(float(payoff_months(debt, rate, payment)) - 1e-9) == len(balances)
+
+
+def test_remaining_balance_matches_monthly_loop():
+    for debt, rate, payment in random_loans(3):
+        balance = debt
+        for made in range(1, 25):
+            balance = balance * (1 + rate / 1200) - payment
+            assert float(remaining_balance(debt, rate, payment, made)) == pytest.approx(balance, rel=1e-9, abs=1e-6)
+
+
+@pytest.mark.parametrize("annual_rate", [0.0, 3.5, 24.0])
+@pytest.mark.parametrize("months", [1, 12, 360])
+def test_level_payment_clears_the_debt_on_time(annual_rate, months):
+    payment = float(level_payment(20_000, annual_rate, months))
+    balances, _ = monthly_loop(20_000, annual_rate, payment)
+    # The loop may carry a float residue of a fraction of a cent past the term
+    assert balances[months - 1] == pytest.approx(0.0, abs=0.005)
+    assert len(balances) <= months + 1
+    assert float(remaining_balance(20_000, annual_rate, payment, months)) == pytest.approx(0.0, abs=1e-6)
+
+
+def test_project_debt_matches_baseline_for_both_scenarios():
+    inputs = DebtInputs(total_debt=15_000, annual_rate=18.5, monthly_payment=350, extra_payment=150)
+    result = project_debt(inputs)
+    months, interest = baseline_payoff(15_000, 18.5, 350)
+    months_extra, interest_extra = baseline_payoff(15_000, 18.5, 500)
+    assert result.months_standard == pytest.approx(months)
+    assert result.total_interest_standard == pytest.approx(interest)
+    assert result.months_extra == pytest.approx(months_extra)
+    assert result.total_interest_extra == pytest.approx(interest_extra)
+
+    standard, _ = monthly_loop(15_000, 18.5, 350)
+    extra, _ = monthly_loop(15_000, 18.5, 500)
+    np.testing.assert_allclose(result.balance_standard, standard, rtol=1e-9, atol=1e-6)
+    np.testing.assert_allclose(result.balance_extra[:len(extra)], extra, rtol=1e-9, atol=1e-6)
+    assert not result.balance_extra[len(extra):].any()
+
+
+def test_payment_below_interest_is_rejected():
+    with pytest.raises(ValueError, match="does not cover"):
+        project_debt(DebtInputs(total_debt=10_000, annual_rate=24, monthly_payment=200))
+    assert np.isinf(payoff_months(10_000, 24, 200))
+    assert np.isinf(payoff_interest(10_000, 200, np.inf))
+
+
+def test_sweep_matches_project_debt_point_by_point():
+    inputs = DebtInputs(total_debt=30_000, annual_rate=9.0, monthly_payment=400)
+    sweep = extra_payment_sweep(inputs, stop=500, step=50)
+    np.testing.assert_allclose(sweep.extra_payments, np.arange(0, 501, 50))
+    for extra, months, interest in zip(sweep.extra_payments, sweep.months, sweep.total_interest):
+        single = project_debt(DebtInputs(30_000, 9.0, 400, float(extra)))
+        assert months == pytest.approx(single.months_extra, rel=1e-12)
+        assert interest == pytest.approx(single.total_interest_extra, rel=1e-12)
+    assert sweep.months_saved[0] == pytest.approx(0.0)
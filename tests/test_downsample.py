@@ -0,0 +1,80 @@
+import importlib
+
+import numpy as np
+import pytest
+
+from fincalc.downsample import downsample, lttb_indices
+
+
+def series(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=float)
+    return x, np.cumsum(rng.normal(size=n))
+
+
+@pytest.mark.parametrize("n, max_points", [(10, 3), (1_000, 50), (1_001, 500), (18_250, 500), (7, 6)])
+def test_indices_keep_endpoints_and_increase(n, max_points):
+    x, y = series(n)
+    indices = lttb_indices(x, y, max_points)
+    assert len(indices) == max_points
+    assert indices[0] == 0
+    assert indices[-1] == n - 1
+    assert np.all(np.diff(indices) > 0)
+
+
+@pytest.mark.parametrize("n, max_points", [(0, 10), (1, 10), (10, 10), (10, 500), (10, 2)])
+def test_short_series_pass_through(n, max_points):
+    x, y = series(n)
+    np.testing.assert_array_equal(lttb_indices(x, y, max_points), np.arange(n))
+    out_x, out_y = downsample(x, y, max_points=max(max_points, n))
+    assert out_x is x or np.array_equal(out_x, x)
+    np.testing.assert_array_equal(out_y, y)
+
+
+def test_keeps_a_spike():
+    x = np.arange(10_000, dtype=float)
+    y = np.zeros_like(x)
+    y[4_321] = 100.0
+    assert 4_321 in lttb_indices(x, y, 100)
+
+
+def test_several_series_share_one_axis():
+    x, first = series(5_000, 1)
+    _, second = series(5_000, 2)
+    third = first * 2 - second
+    out_x, *outs = downsample(x, first, second, third, max_points=300)
+    assert len(out_x) <= 300
+    assert all(len(out) == len(out_x) for out in outs)
+    assert np.all(np.diff(out_x) > 0)
+    assert out_x[0] == x[0] and out_x[-1] == x[-1]
+    # Every kept sample is the original point at that x
+    keep = out_x.astype(int)
+    for original, out in zip((first, second, third), outs):
+        np.testing.assert_array_equal(out, original[keep])
+
+
+def test_no_series_returns_x_unchanged():
+    x = np.arange(10_000)
+    (out_x,) = downsample(x, max_points=10)
+    assert len(out_x) == 10_000
+
+
+@pytest.fixture
+def module():
+    # The package re-exports the downsample function under the submodule's name
+    module = importlib.import_module("fincalc.downsample")
+    yield module
+    importlib.reload(module)
+
+
+def test_environment_overrides_the_budget(monkeypatch, module):
+    monkeypatch.setenv("FINCALC_CHART_POINTS", "40")
+    importlib.reload(module)
+    assert module.DEFAULT_MAX_POINTS == 40
+    x, y = series(1_000)
+    out_x, out_y = module.downsample(x, y)
+    assert len(out_x) == len(out_y) == 40
+    assert len(module.lttb_indices(x, y)) == 40
+
+    monkeypatch.delenv("FINCALC_CHART_POINTS")
+    assert importlib.reload(module).DEFAULT_MAX_POINTS == 500
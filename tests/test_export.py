@@ -0,0 +1,63 @@
+import csv
+
+import numpy as np
+import pytest
+
+from fincalc.export import SCHEDULE_COLUMNS, export_schedules, iter_schedules
+
+
+def reference_schedule(debt, rate, payment):
+    """The baseline month-by-month payoff loop."""
+    rows, balance, month = [], debt, 0
+    while balance > 1e-9:
+        month += 1
+        interest = balance * rate / 100 / 12
+        paid = min(payment, balance + interest)
+        balance = balance + interest - paid
+        rows.append((month, paid, interest, paid - interest, max(balance, 0.0)))
+    return rows
+
+
+def collect(chunks):
+    chunks = list(chunks)
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in SCHEDULE_COLUMNS}
+
+
+def test_schedules_match_the_monthly_loop():
+    loans = [(25_000, 18, 500), (250_000, 6.5, 1_580.17), (1_200, 0, 100), (5_000, 24.99, 5_000)]
+    debt, rate, payment = map(np.array, zip(*loans))
+    # A small chunk budget splits the book across several chunks
+    table = collect(iter_schedules(debt, rate, payment, start="2025-01-31", chunk_rows=100))
+    for loan_id, loan in enumerate(loans, start=1):
+        rows = np.array(reference_schedule(*loan))
+        mine = table["loan_id"] == loan_id
+        np.testing.assert_array_equal(table["month"][mine], rows[:, 0])
+        for column, name in enumerate(("payment", "interest", "principal", "balance"), start=1):
+            np.testing.assert_allclose(table[name][mine], rows[:, column], rtol=1e-9, atol=1e-6)
+    assert table["date"][0] == np.datetime64("2025-02-28")
+
+
+def test_loans_that_cannot_be_amortized_are_skipped():
+    skipped = []
+    table = collect(iter_schedules(
+        [10_000, 10_000, 10_000, 10_000], [12, 12, np.nan, 12], [500, 50, 500, 500],
+        loan_ids=np.array(["A", "B", "C", "D"]),
+        on_skip=lambda loan_id, reason: skipped.append((loan_id, reason)),
+    ))
+    assert [loan_id for loan_id, _ in skipped] == ["B", "C"]
+    assert set(table["loan_id"]) == {"A", "D"}
+
+
+def test_csv_export_round_trips(tmp_path):
+    path = tmp_path / "schedules.csv"
+    stats = export_schedules(iter_schedules([10_000, 3_000], [7, 0], [250, 300], chunk_rows=10), path)
+    with open(path, newline="") as source:
+        rows = list(csv.reader(source))
+    assert tuple(rows[0]) == SCHEDULE_COLUMNS
+    assert stats.rows == len(rows) - 1 and stats.loans == 2
+    assert float(rows[-1][-1]) == 0.0
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_schedules(iter_schedules([1_000], [5], [100]), tmp_path / "out.csv", file_format="xlsx")
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from fincalc.fees import (
+    DEFAULT_PRODUCT_MENU,
+    FeeInputs,
+    FeeProduct,
+    breakeven_extra_return,
+    calculate_balance,
+    compare_products,
+    fee_breakeven,
+    fee_final_balance,
+    fee_for_gap,
+)
+
+
+def test_products_match_yearly_loop():
+    comparison = compare_products(30_000, 600, 7.0, 25)
+    assert comparison.products == DEFAULT_PRODUCT_MENU
+    for product, values, no_fee in zip(comparison.products, comparison.values, comparison.no_fee_values):
+        expected = [calculate_balance(30_000, 600, 0.07, product.fee / 100, year) for year in range(26)]
+        np.testing.assert_allclose(values, expected, rtol=1e-10)
+        assert no_fee[-1] == pytest.approx(calculate_balance(30_000, 600, 0.07, 0.0, 25), rel=1e-10)
+
+
+def test_products_with_their_own_return_are_measured_against_themselves():
+    products = (FeeProduct("Cheap", 0.1), FeeProduct("Active", 1.0, expected_return=9.0))
+    comparison = compare_products(10_000, 200, 6.0, 20, products)
+    np.testing.assert_allclose(comparison.returns, [6.0, 9.0])
+    expected_fees = [
+        calculate_balance(10_000, 200, rate, 0.0, 20) - calculate_balance(10_000, 200, rate, fee, 20)
+        for rate, fee in ((0.06, 0.001), (0.09, 0.01))
+    ]
+    np.testing.assert_allclose(comparison.fees_paid, expected_fees, rtol=1e-9)
+
+
+def test_ranking_orders_by_ending_value():
+    comparison = compare_products(50_000, 0, 5.0, 10)
+    table = comparison.ranked_table()
+    assert [row["Rank"] for row in table] == list(range(1, len(DEFAULT_PRODUCT_MENU) + 1))
+    ending = [row["Ending Value"] for row in table]
+    assert ending == sorted(ending, reverse=True)
+    assert table[0]["Product"] == "Index Fund"
+    assert table[0]["Behind Best"] == 0.0
+
+
+def test_empty_menu():
+    comparison = compare_products(1_000, 10, 5.0, 3, ())
+    assert comparison.values.shape == (0, 4)
+    assert comparison.ranked_table() == []
+
+
+@pytest.mark.parametrize("self_fee, advisor_fee", [(0.0, 1.0), (0.2, 1.5), (0.05, 2.0), (1.0, 1.0)])
+@pytest.mark.parametrize("expected_return", [-2.0, 0.0, 6.5])
+def test_breakeven_return_matches_self_managed_balance(expected_return, self_fee, advisor_fee):
+    extra = breakeven_extra_return(expected_return, self_fee, advisor_fee)
+    for years in (1, 10, 40):
+        advisor = fee_final_balance(20_000, 400, expected_return + extra, advisor_fee, years)
+        self_managed = fee_final_balance(20_000, 400, expected_return, self_fee, years)
+        assert float(advisor) == pytest.approx(float(self_managed), rel=1e-10)
+        loop = calculate_balance(20_000, 400, (expected_return + extra) / 100, advisor_fee / 100, years)
+        assert loop == pytest.approx(float(self_managed), rel=1e-10)
+
+
+def test_breakeven_against_no_fee_balance():
+    extra = breakeven_extra_return(7.0, 0.0, 1.0)
+    assert float(fee_final_balance(10_000, 100, 7.0 + extra, 1.0, 30)) == pytest.approx(
+        calculate_balance(10_000, 100, 0.07, 0.0, 30), rel=1e-10
+    )
+    assert breakeven_extra_return(7.0, 0.5, 100.0) == float("inf")
+
+
+@pytest.mark.parametrize("threshold", [1.0, 2_500.0, 10_000.0, 100_000.0])
+def test_fee_for_gap_opens_the_requested_gap(threshold):
+    inputs = FeeInputs(starting_amount=50_000, monthly_contribution=800, expected_return=7.0,
+                       self_managed_fee=0.1, advisor_fee=1.0, years=25)
+    fee = fee_for_gap(inputs, threshold)
+    baseline = calculate_balance(50_000, 800, 0.07, 0.001, 25)
+    assert baseline - calculate_balance(50_000, 800, 0.07, fee / 100, 25) == pytest.approx(threshold, rel=1e-8)
+    assert fee > inputs.self_managed_fee
+
+
+def test_fee_for_gap_edge_cases():
+    inputs = FeeInputs(starting_amount=1_000, monthly_contribution=0, expected_return=5.0,
+                       self_managed_fee=0.3, advisor_fee=1.0, years=5)
+    assert fee_for_gap(inputs, 0) == 0.3
+    # The whole portfolio is only worth about $1,275, so a $5,000 gap is out of reach
+    assert fee_for_gap(inputs, 5_000) is None
+    breakeven = fee_breakeven(inputs, gap_threshold=100)
+    assert breakeven.gap_fee == pytest.approx(fee_for_gap(inputs, 100))
+    assert breakeven.required_return == pytest.approx(5.0 + breakeven_extra_return(5.0, 0.3, 1.0))
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from fincalc.compound import END, START, CompoundInputs
+from fincalc.fees import FeeInputs
+from fincalc.history import BOOTSTRAP, REPLAY, _scenarios, historical_compound, historical_fees, load_history
+
+
+def test_replay_windows_are_not_copied():
+    history = load_history()
+    returns, start_years = _scenarios(history, 30, REPLAY, None, 5, None)
+    assert np.shares_memory(returns, history.returns)
+    assert len(returns) == len(start_years) == len(history.returns) - 29
+
+
+@pytest.mark.parametrize("timing", [START, END])
+def test_replay_matches_a_monthly_loop(timing):
+    inputs = CompoundInputs(10_000, 0, 250, 20, contribution_timing=timing)
+    result = historical_compound(inputs, REPLAY)
+    annual = np.asarray(load_history().returns)
+    for row in (0, len(result.final_balances) // 2, len(result.final_balances) - 1):
+        balance = inputs.initial_amount
+        for year_return in annual[row:row + 20]:
+            monthly = (1 + year_return) ** (1 / 12)
+            for _ in range(12):
+                if timing == START:
+                    balance += inputs.monthly_contribution
+                balance *= monthly
+                if timing == END:
+                    balance += inputs.monthly_contribution
+        assert result.final_balances[row] == pytest.approx(balance, rel=1e-9)
+
+
+def test_bands_are_ordered_and_start_at_the_initial_amount():
+    result = historical_compound(CompoundInputs(5_000, 0, 100, 10), BOOTSTRAP, samples=1_000, seed=1)
+    assert np.all(np.diff(result.bands, axis=0) >= 0)
+    assert np.all(result.bands[:, 0] == 5_000)
+
+
+@pytest.mark.parametrize("method", [REPLAY, BOOTSTRAP])
+def test_chunking_does_not_change_the_result(method):
+    inputs = CompoundInputs(10_000, 0, 500, 30)
+    whole = historical_compound(inputs, method, samples=2_000, seed=7, chunk_size=10_000)
+    chunked = historical_compound(inputs, method, samples=2_000, seed=7, chunk_size=37)
+    np.testing.assert_allclose(chunked.bands, whole.bands)
+    np.testing.assert_allclose(chunked.final_balances, whole.final_balances)
+    assert chunked.final_balances.base is None
+
+
+def test_fee_histories_share_their_paths():
+    inputs = FeeInputs(100_000, 500, 7, 0.1, 1.0, 25)
+    self_managed, advisor = historical_fees(inputs, BOOTSTRAP, samples=500, seed=3, chunk_size=64)
+    assert len(self_managed.final_balances) == 500
+    assert np.all(self_managed.final_balances > advisor.final_balances)
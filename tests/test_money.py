@@ -0,0 +1,124 @@
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+
+from fincalc.compound import END, MONTHLY, START, compound_final_balance
+from fincalc.money import (
+    HALF_EVEN,
+    HALF_UP,
+    MAX_CENTS,
+    amortize_cents,
+    benchmark,
+    compound_cents,
+    divide_round,
+    monthly_interest,
+    to_cents,
+)
+
+DECIMAL_ROUNDING = {HALF_EVEN: ROUND_HALF_EVEN, HALF_UP: ROUND_HALF_UP}
+
+
+def reference_amortization(debt, rate, payment, rounding):
+    """Month-by-month ledger in Decimal cents."""
+    balance, payment = Decimal(str(debt)) * 100, Decimal(str(payment)) * 100
+    monthly_rate = Decimal(str(rate)) / 1200
+    months = interest_total = 0
+    while balance > 0:
+        interest = (balance * monthly_rate).quantize(Decimal(1), DECIMAL_ROUNDING[rounding])
+        paid = min(payment, balance + interest)
+        balance += interest - paid
+        interest_total += interest
+        months += 1
+    return months, int(interest_total), int(paid)
+
+
+def reference_compound(initial, rate, contribution, months, timing, rounding):
+    balance, contribution = Decimal(str(initial)) * 100, Decimal(str(contribution)) * 100
+    monthly_rate = Decimal(str(rate)) / 1200
+    for _ in range(months):
+        if timing == START:
+            balance += contribution
+        balance += (balance * monthly_rate).quantize(Decimal(1), DECIMAL_ROUNDING[rounding])
+        if timing == END:
+            balance += contribution
+    return int(balance)
+
+
+def test_to_cents_rounds_half_away_from_zero():
+    np.testing.assert_array_equal(to_cents([1.005, -1.005, 2.675, 0.125]), [101, -101, 268, 13])
+
+
+@pytest.mark.parametrize("rounding, expected", [(HALF_EVEN, [0, 2, -0, 2, 3]), (HALF_UP, [1, 2, -1, 3, 3])])
+def test_divide_round_ties(rounding, expected):
+    np.testing.assert_array_equal(divide_round([5, 15, -5, 25, 26], 10, rounding), expected)
+
+
+@pytest.mark.parametrize("rounding", [HALF_EVEN, HALF_UP])
+def test_monthly_interest_matches_the_full_product(rounding):
+    rng = np.random.default_rng(3)
+    balance = rng.integers(-10**9, 10**9, 5_000)
+    rate = rng.integers(0, 300_000, 5_000)
+    np.testing.assert_array_equal(
+        monthly_interest(balance, rate, rounding),
+        divide_round(balance * rate, 12_000_000, rounding),
+    )
+
+
+@pytest.mark.parametrize("rounding", [HALF_EVEN, HALF_UP])
+def test_amortize_cents_matches_decimal_ledger(rounding):
+    loans = [(25_000, 18, 500), (250_000, 6.5, 1_580.17), (1_234.56, 24.99, 35), (10_000, 0, 300)]
+    result = amortize_cents(*map(list, zip(*loans)), rounding=rounding)
+    for row, loan in enumerate(loans):
+        months, interest, final_payment = reference_amortization(*loan, rounding)
+        assert result.months[row] == months
+        assert result.total_interest_cents[row] == interest
+        assert result.final_payment_cents[row] == final_payment
+        assert result.total_paid_cents[row] == to_cents(loan[0]) + interest
+
+
+@pytest.mark.parametrize("timing", [START, END])
+@pytest.mark.parametrize("rounding", [HALF_EVEN, HALF_UP])
+def test_compound_cents_matches_decimal_ledger(timing, rounding):
+    accounts = [(10_000, 7, 500), (0, 4.25, 125.5), (99_999.99, 12, 0)]
+    result = compound_cents(*map(list, zip(*accounts)), 20, MONTHLY, timing, rounding)
+    expected = [reference_compound(*account, 240, timing, rounding) for account in accounts]
+    np.testing.assert_array_equal(result.final_balance_cents, expected)
+
+
+def test_compound_cents_large_balance_does_not_overflow():
+    # balance * rate exceeded int64 here before the interest was split
+    for initial, contribution in [(1_000_000, 0), (100_000, 500)]:
+        result = compound_cents(initial, 30, contribution, 50)
+        assert result.final_balance_cents[0] == reference_compound(initial, 30, contribution, 600, START, HALF_EVEN)
+        # Cent rounding compounds over 600 months, so only close to the float projection
+        exact = compound_final_balance(initial, 30, contribution, 600, MONTHLY)
+        assert result.final_balance[0] == pytest.approx(exact, rel=1e-7)
+
+
+def test_amortize_cents_large_balance_does_not_overflow():
+    result = amortize_cents(5e13, 24, 1.01e12)
+    assert result.months[0] > 0
+    assert result.total_paid_cents[0] == to_cents(5e13) + result.total_interest_cents[0]
+
+
+def test_balances_beyond_int64_cents_are_rejected():
+    with pytest.raises(ValueError):
+        compound_cents(MAX_CENTS / 100 * 0.9, 30, 0, 50)
+    with pytest.raises(ValueError):
+        amortize_cents(MAX_CENTS / 10, 5, 1e18)
+
+
+def test_benchmark_debt_drift_is_like_for_like():
+    result = benchmark(rows=200, months=360, calculator="debt")
+    assert result.rows == 200 and result.months == 360
+    assert result.cents_seconds > 0 and result.float_seconds >= 0
+    assert 0 <= result.max_interest_drift < 100
+    # A short term keeps compounding of the rounding error small
+    assert benchmark(rows=200, months=12, calculator="debt").max_interest_drift < 0.1
+
+
+def test_benchmark_compound_and_unknown_calculator():
+    assert benchmark(rows=10, months=12, calculator="compound").max_interest_drift < 0.1
+    with pytest.raises(ValueError, match="calculator"):
+        benchmark(rows=10, calculator="fees")
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from fincalc.compound import CompoundInputs, compound_final_balance
+from fincalc.montecarlo import LOGNORMAL, NORMAL, simulate_compound
+
+
+def test_zero_volatility_matches_annual_compounding():
+    inputs = CompoundInputs(10_000, 6, 300, 25, compounding=1)
+    result = simulate_compound(inputs, 0, paths=50, seed=0)
+    expected = compound_final_balance(10_000, 6, 300, 300, 1)
+    np.testing.assert_allclose(result.final_balances, expected, rtol=1e-12)
+    np.testing.assert_allclose(result.band(50)[-1], expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("distribution", [NORMAL, LOGNORMAL])
+def test_chunking_does_not_change_the_result(distribution):
+    inputs = CompoundInputs(10_000, 7, 500, 20)
+    whole = simulate_compound(inputs, 15, paths=3_000, distribution=distribution, seed=4, chunk_size=3_000)
+    chunked = simulate_compound(inputs, 15, paths=3_000, distribution=distribution, seed=4, chunk_size=37)
+    np.testing.assert_allclose(chunked.bands, whole.bands)
+    np.testing.assert_allclose(chunked.final_balances, whole.final_balances)
+
+
+def test_final_balances_do_not_hold_the_path_matrix():
+    result = simulate_compound(CompoundInputs(1_000, 5, 100, 30), 12, paths=1_000, seed=2)
+    assert result.final_balances.base is None
+    assert result.final_balances.nbytes == 1_000 * 8
@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+import pytest
+
+from fincalc.multidebt import AVALANCHE, CUSTOM, SNOWBALL, Debt, compare_strategies, plan_payoff
+
+
+def reference_plan(debts, budget, order):
+    """Month-by-month loop: interest, minimums, then the leftover budget in ``order``."""
+    balance = [debt.balance for debt in debts]
+    paid = [0.0] * len(debts)
+    payoff = [0] * len(debts)
+    month = 0
+    while any(value > 1e-9 for value in balance) and month < 1200:
+        month += 1
+        available = budget
+        for index, debt in enumerate(debts):
+            if balance[index] > 1e-9:
+                balance[index] *= 1 + debt.annual_rate / 1200
+                payment = min(debt.minimum_payment, balance[index])
+                balance[index] -= payment
+                paid[index] += payment
+                available -= payment
+        for index in order:
+            if balance[index] > 1e-9 and available > 0:
+                payment = min(available, balance[index])
+                balance[index] -= payment
+                paid[index] += payment
+                available -= payment
+        for index in range(len(debts)):
+            if balance[index] <= 1e-9 and not payoff[index]:
+                payoff[index], balance[index] = month, 0.0
+    interest = np.array(paid) - [debt.balance for debt in debts]
+    return np.array(payoff), interest
+
+
+def random_debts(rng):
+    debts = []
+    for index in range(rng.randint(1, 8)):
+        balance = round(rng.uniform(100, 20_000), 2)
+        rate = round(rng.choice([0, rng.uniform(0, 30)]), 2)
+        minimum = round(max(25, balance * rate / 1200 * 1.2 + rng.uniform(0, 100)), 2)
+        debts.append(Debt(f"Debt {index + 1}", balance, rate, minimum))
+    return debts
+
+
+ORDERS = {
+    SNOWBALL: lambda debts: sorted(range(len(debts)), key=lambda k: (debts[k].balance, -debts[k].annual_rate, k)),
+    AVALANCHE: lambda debts: sorted(range(len(debts)), key=lambda k: (-debts[k].annual_rate, debts[k].balance, k)),
+}
+
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("strategy", [SNOWBALL, AVALANCHE])
+def test_matches_the_monthly_loop(seed, strategy):
+    rng = random.Random(seed)
+    debts = random_debts(rng)
+    budget = sum(debt.minimum_payment for debt in debts) + rng.choice([0, 50, 500, 3_000])
+    plan = plan_payoff(debts, budget, strategy)
+    payoff, interest = reference_plan(debts, budget, ORDERS[strategy](debts))
+    np.testing.assert_array_equal(plan.payoff_month, payoff)
+    np.testing.assert_allclose(plan.interest, interest, atol=1e-4)
+
+
+def test_custom_order_follows_the_table():
+    debts = random_debts(random.Random(5))
+    budget = sum(debt.minimum_payment for debt in debts) + 400
+    order = tuple(reversed(range(len(debts))))
+    plans = compare_strategies(debts, budget, order=order)
+    payoff, _ = reference_plan(debts, budget, order)
+    np.testing.assert_array_equal(plans[CUSTOM].payoff_month, payoff)
+
+
+def test_budget_equal_to_the_minimums_in_another_order_is_accepted():
+    minimums = [161.97, 367.62, 450.43, 345.15]
+    debts = [Debt(f"Debt {index}", 5_000, 10, minimum) for index, minimum in enumerate(minimums)]
+    budget = sum(reversed(minimums))
+    assert budget < np.sum(minimums)
+    assert plan_payoff(debts, budget).debt_free_month > 0
+
+
+def test_budget_below_the_minimums_is_rejected():
+    with pytest.raises(ValueError):
+        plan_payoff([Debt("a", 1_000, 10, 50), Debt("b", 1_000, 10, 50)], 99.99)
+
+
+@pytest.mark.parametrize("strategy", [SNOWBALL, AVALANCHE])
+def test_zero_balance_debts_stay_in_the_table(strategy):
+    debts = [Debt("card", 3_000, 22, 90), Debt("closed", 0, 15, 40), Debt("loan", 8_000, 7, 160)]
+    plan = plan_payoff(debts, 400, strategy)
+    assert sorted(plan.payoff_order) == [0, 1, 2]
+    assert plan.payoff_order[0] == 1
+    assert plan.payoff_month[1] == 0
+    assert plan.interest[1] == 0.0
+    table = plan.payoff_table()
+    assert [row["Debt"] for row in table][0] == "closed"
+    assert table[0]["Paid Off (Month)"] == 0 and table[0]["Order"] == 1
+    assert not plan.balances[1].any()
+
+    # The closed debt's minimum goes to the others from the first month
+    without = plan_payoff([debts[0], debts[2]], 400, strategy)
+    np.testing.assert_array_equal(plan.payoff_month[[0, 2]], without.payoff_month)
+    np.testing.assert_allclose(plan.interest[[0, 2]], without.interest)
+
+
+def test_all_debts_already_paid():
+    plan = plan_payoff([Debt("a", 0, 10, 25), Debt("b", 0, 5, 25)], 50)
+    assert plan.payoff_order == (0, 1)
+    assert plan.debt_free_month == 0 and plan.total_interest == 0.0
+    assert [row["Paid Off (Month)"] for row in plan.payoff_table()] == [0, 0]
@@ -0,0 +1,74 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from fincalc.paydates import (
+    BIWEEKLY,
+    FOLLOWING,
+    MONTHLY,
+    NO_ROLL,
+    PRECEDING,
+    SEMIMONTHLY,
+    WEEKLY,
+    add_months,
+    calendar_years,
+    load_holidays,
+    pay_calendar,
+)
+
+
+def test_add_months_clamps_to_the_month_end():
+    dates = add_months(np.array(["2024-01-31", "2023-01-31", "2024-03-15"], dtype="datetime64[D]"), [1, 1, -3])
+    np.testing.assert_array_equal(dates, np.array(["2024-02-29", "2023-02-28", "2023-12-15"], dtype="datetime64[D]"))
+
+
+def reference_paydays(first, end, step_days, roll):
+    """Day-by-day loop over the standard library's calendar."""
+    holidays = set(load_holidays().holidays.astype(datetime.date))
+    business = lambda day: day.weekday() < 5 and day not in holidays
+    paydays, day = [], first
+    while day <= end:
+        paid = day
+        while roll != NO_ROLL and not business(paid):
+            paid += datetime.timedelta(days=-1 if roll == PRECEDING else 1)
+        paydays.append(paid)
+        day += datetime.timedelta(days=step_days)
+    return paydays
+
+
+@pytest.mark.parametrize("frequency, step", [(WEEKLY, 7), (BIWEEKLY, 14)])
+@pytest.mark.parametrize("roll", [PRECEDING, FOLLOWING, NO_ROLL])
+def test_weekly_calendars_match_a_day_loop(frequency, step, roll):
+    first, end = datetime.date(2025, 1, 3), datetime.date(2030, 12, 31)
+    calendar = pay_calendar(first, end, frequency, roll)
+    expected = np.array(reference_paydays(first, end, step, roll), dtype="datetime64[D]")
+    np.testing.assert_array_equal(calendar.dates(), expected)
+
+
+def test_moved_is_false_on_padding():
+    calendar = pay_calendar(["2025-01-03", "2025-06-06"], "2025-12-31", BIWEEKLY)
+    assert np.isnat(calendar.paydays[1, -1])
+    assert not calendar.moved[1, -1]
+    assert calendar.moved.sum() == (calendar.paydays != calendar.scheduled)[~np.isnat(calendar.scheduled)].sum()
+
+
+def test_january_first_rolled_back_stays_out_of_the_prior_year():
+    calendar = calendar_years("2027-01-01", 2, BIWEEKLY, PRECEDING)
+    years, counts = calendar.per_year()
+    np.testing.assert_array_equal(years, [2027, 2028])
+    assert np.all(calendar.dates() >= np.datetime64("2027-01-01"))
+    np.testing.assert_array_equal(counts[0], [26, 26])
+
+
+@pytest.mark.parametrize("frequency, nominal", [(WEEKLY, 52), (BIWEEKLY, 26), (SEMIMONTHLY, 24), (MONTHLY, 12)])
+@pytest.mark.parametrize("roll", [PRECEDING, FOLLOWING, NO_ROLL])
+def test_calendar_years_cover_exactly_the_requested_years(frequency, nominal, roll):
+    calendar = calendar_years(["2025-01-03", "2025-01-31", "2025-12-31"], 10, frequency, roll)
+    years, counts = calendar.per_year()
+    np.testing.assert_array_equal(years, np.arange(2025, 2035))
+    # A roll can move one payday across New Year, and weekly patterns gain a 53rd/27th day
+    assert np.all(np.abs(counts - nominal) <= 1)
+    # Scheduled and paid dates stay paired after trimming
+    paired = ~np.isnat(calendar.paydays)
+    assert np.all(np.abs(calendar.paydays[paired] - calendar.scheduled[paired]) <= np.timedelta64(7, "D"))
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from fincalc.compound import END, MONTHLY, QUARTERLY, CompoundInputs, compound_balance
+from fincalc.sensitivity import rate_range, sensitivity_grid
+
+
+@pytest.mark.parametrize("inputs", [
+    CompoundInputs(10_000, 5.0, 250, 10),
+    CompoundInputs(0, 0.0, 500, 1, MONTHLY, END),
+    CompoundInputs(75_000, 3.0, 0, 5, QUARTERLY),
+])
+def test_cells_match_scalar_compound_balance(inputs):
+    grid = sensitivity_grid(inputs, rates=rate_range(0, 12, 0.5), years=[1, 2.5, 10, 30])
+    assert grid.final_balance.shape == (25, 4)
+    for row, rate in enumerate(grid.rates):
+        for column, years in enumerate(grid.years):
+            months = round(years * 12)
+            expected = float(compound_balance(
+                inputs.initial_amount, rate, inputs.monthly_contribution, months / 12, months,
+                inputs.compounding, inputs.contribution_timing,
+            ))
+            assert grid.final_balance[row, column] == pytest.approx(expected, rel=1e-12)
+            assert grid.balance_at(rate, years) == grid.final_balance[row, column]
+
+
+def test_default_axes():
+    grid = sensitivity_grid(CompoundInputs(1_000, 7.0, 100, 20))
+    assert grid.final_balance.shape == (151, 50)
+    assert grid.rates[0] == 0.0 and grid.rates[-1] == 15.0
+    np.testing.assert_array_equal(grid.years, np.arange(1, 51))
+    assert grid.balance_at(7.04, 20) == grid.final_balance[70, 19]
+
+
+@pytest.mark.parametrize("start, stop, step, count", [
+    (0.0, 15.0, 0.1, 151),
+    (0.0, 1.0, 0.3, 4),
+    (0.5, 0.7, 0.1, 3),
+    (1.0, 1.0, 0.25, 1),
+    (0.0, 0.3, 0.1, 4),
+    (2.0, 9.9, 0.05, 159),
+])
+def test_rate_range_includes_stop_without_drift(start, stop, step, count):
+    rates = rate_range(start, stop, step)
+    assert len(rates) == count
+    assert rates[0] == start
+    assert rates[-1] <= stop
+    if round((stop - start) / step, 9).is_integer():
+        assert rates[-1] == stop
+    np.testing.assert_array_equal(rates, np.round(rates, 10))
+    assert 0.3 in rate_range(0, 1, 0.1)
+
+
+@pytest.mark.parametrize("step", [0.0, -0.1])
+def test_rate_range_rejects_nonpositive_steps(step):
+    with pytest.raises(ValueError, match="step must be positive"):
+        rate_range(0, 1, step)
@@ -0,0 +1,120 @@
+import math
+
+import pytest
+
+from fincalc.compound import END, MONTHLY, START, CompoundInputs, compound_balance
+from fincalc.solve import (
+    CONTRIBUTION,
+    MAX_RATE,
+    MAX_YEARS,
+    RATE,
+    YEARS,
+    find_root,
+    goal_seek,
+    required_contribution,
+    required_rate,
+    required_years,
+)
+
+
+def balance(inputs, months=None):
+    """Final balance of ``inputs`` (or after ``months``) through the scalar closed form."""
+    months = round(inputs.years * 12) if months is None else months
+    return float(compound_balance(
+        inputs.initial_amount,
+        inputs.annual_rate,
+        inputs.monthly_contribution,
+        months / 12,
+        months,
+        inputs.compounding,
+        inputs.contribution_timing,
+    ))
+
+
+INPUTS = [
+    CompoundInputs(10_000, 6.0, 500, 20),
+    CompoundInputs(0, 4.25, 250, 35, MONTHLY, END),
+    CompoundInputs(50_000, 0.0, 1_000, 10),
+    CompoundInputs(1_000, 9.5, 0, 15, MONTHLY, START),
+]
+
+
+def test_find_root_brackets_and_converges():
+    assert find_root(lambda x: x * x - 2, 0, 2) == pytest.approx(math.sqrt(2), abs=1e-10)
+    assert find_root(lambda x: math.cos(x) - x, 0, 1) == pytest.approx(0.7390851332151607, abs=1e-10)
+    assert find_root(lambda x: x - 3, 3, 5) == 3
+    with pytest.raises(ValueError, match="not bracketed"):
+        find_root(lambda x: x * x + 1, -1, 1)
+
+
+@pytest.mark.parametrize("inputs", INPUTS[:3])
+def test_contribution_reaches_target(inputs):
+    target = balance(inputs) * 1.5
+    goal = required_contribution(inputs, target)
+    assert goal.solved_for == CONTRIBUTION
+    assert goal.inputs.monthly_contribution == goal.value
+    assert balance(goal.inputs) == pytest.approx(target, rel=1e-10)
+    assert goal.final_balance == pytest.approx(target, rel=1e-10)
+
+
+def test_contribution_is_zero_when_the_initial_amount_suffices():
+    inputs = CompoundInputs(100_000, 5.0, 300, 10)
+    assert required_contribution(inputs, 1_000).value == 0.0
+
+
+@pytest.mark.parametrize("inputs", [INPUTS[0], INPUTS[1], INPUTS[3]])
+def test_rate_reaches_target(inputs):
+    target = balance(inputs) * 1.3
+    goal = required_rate(inputs, target)
+    assert goal.solved_for == RATE
+    assert goal.value > inputs.annual_rate
+    assert balance(goal.inputs) == pytest.approx(target, rel=1e-8)
+
+
+def test_rate_is_zero_when_contributions_alone_suffice():
+    inputs = CompoundInputs(10_000, 7.0, 500, 10)
+    assert required_rate(inputs, 10_000 + 500 * 120).value == 0.0
+
+
+@pytest.mark.parametrize("inputs", INPUTS)
+def test_years_is_the_first_month_that_reaches_target(inputs):
+    target = balance(inputs) * 0.8 + 1.23
+    goal = required_years(inputs, target)
+    months = round(goal.value * 12)
+    assert goal.solved_for == YEARS
+    assert goal.value == months / 12
+    assert goal.inputs.years == goal.value
+    assert balance(inputs, months) >= target
+    assert balance(inputs, months - 1) < target
+
+
+def test_years_boundary_is_exact_when_target_is_hit_on_a_month():
+    inputs = CompoundInputs(0, 0.0, 100, 1)
+    goal = required_years(inputs, 1_200)
+    assert round(goal.value * 12) == 12
+    assert required_years(inputs, 1_200.01).value * 12 == pytest.approx(13)
+
+
+def test_zero_rate_solutions():
+    inputs = CompoundInputs(2_000, 0.0, 100, 5)
+    assert required_contribution(inputs, 8_000).value == pytest.approx(100)
+    assert round(required_years(inputs, 8_000).value * 12) == 60
+    assert required_rate(inputs, 8_000).value == 0.0
+
+
+def test_unreachable_targets_raise():
+    with pytest.raises(ValueError, match=f"above {MAX_RATE:g}%"):
+        required_rate(CompoundInputs(1, 0.0, 0, 1), 1e12)
+    with pytest.raises(ValueError, match=f"within {MAX_YEARS} years"):
+        required_years(CompoundInputs(100, 0.0, 0, 1), 200)
+    with pytest.raises(ValueError, match="too short"):
+        required_contribution(CompoundInputs(100, 5.0, 0, 0, contribution_timing=END), 200)
+
+
+def test_goal_seek_dispatches_and_rejects_unknown_targets():
+    inputs = INPUTS[0]
+    target = balance(inputs) * 2
+    for solve_for in (CONTRIBUTION, RATE, YEARS):
+        assert goal_seek(inputs, target, solve_for).solved_for == solve_for
+    with pytest.raises(ValueError, match="solve_for"):
+        goal_seek(inputs, target, "initial_amount")
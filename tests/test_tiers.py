@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from fincalc.fees import fee_trajectories
+from fincalc.tiers import ANNUAL, DEFAULT_TIERS, MONTHLY, FeeSchedule, tiered_trajectories
+
+
+def marginal_fee(tiers, balance):
+    """Annual fee summed tier by tier: each rate applies to the slice of the balance inside its tier."""
+    fee, lower = 0.0, 0.0
+    for up_to, rate in tiers:
+        fee += max(min(balance, up_to) - lower, 0.0) * rate / 100
+        lower = up_to
+    return fee
+
+
+def per_dollar_fee(tiers, balance):
+    """Annual fee of a whole-dollar balance, charging every dollar the rate of the tier it falls in."""
+    fee = 0.0
+    for dollar in range(int(balance)):
+        rate = next(rate for up_to, rate in tiers if dollar < up_to)
+        fee += rate / 100
+    return fee
+
+
+SMALL_TIERS = ((100, 2.0), (250, 1.5), (600, 1.0), (float("inf"), 0.25))
+
+
+def test_fee_matches_per_dollar_loop():
+    schedule = FeeSchedule.from_tiers(SMALL_TIERS)
+    balances = np.arange(0, 1_001)
+    expected = [per_dollar_fee(SMALL_TIERS, balance) for balance in balances]
+    np.testing.assert_allclose(schedule.annual_fee(balances), expected, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("offset", [0.0, 0.01, -0.01])
+def test_fee_at_and_around_every_breakpoint(offset):
+    schedule = FeeSchedule.from_tiers(DEFAULT_TIERS)
+    for up_to, _ in DEFAULT_TIERS[:-1]:
+        balance = up_to + offset
+        assert float(schedule.annual_fee(balance)) == pytest.approx(marginal_fee(DEFAULT_TIERS, balance), rel=1e-12)
+
+
+def test_fee_on_a_breakpoint_and_just_above_it():
+    schedule = FeeSchedule.from_tiers(DEFAULT_TIERS)
+    # Exactly $1M is all charged at the first tier's 1%
+    assert float(schedule.annual_fee(1_000_000)) == pytest.approx(10_000)
+    # The next dollar is the first one at 0.8%
+    assert float(schedule.annual_fee(1_000_001)) == pytest.approx(10_000.008)
+    assert float(schedule.effective_rate(1_000_000)) == pytest.approx(1.0)
+
+
+def test_fee_above_the_top_tier():
+    schedule = FeeSchedule.from_tiers(DEFAULT_TIERS)
+    # 10k + 32k + 30k for the first $10M, then 0.5% on the remaining $15M
+    assert float(schedule.annual_fee(25_000_000)) == pytest.approx(72_000 + 75_000)
+    bounded = FeeSchedule.from_tiers(((1_000, 1.0), (2_000, 0.5)))
+    assert float(bounded.annual_fee(5_000)) == pytest.approx(10 + 0.5 / 100 * 4_000)
+
+
+def test_fee_matches_marginal_loop_on_random_balances():
+    schedule = FeeSchedule.from_tiers(DEFAULT_TIERS)
+    balances = np.random.default_rng(5).uniform(0, 30_000_000, 500)
+    expected = [marginal_fee(DEFAULT_TIERS, balance) for balance in balances]
+    np.testing.assert_allclose(schedule.annual_fee(balances), expected, rtol=1e-12)
+    assert float(schedule.annual_fee(-50)) == 0.0
+
+
+@pytest.mark.parametrize("tiers", [(), ((100, 1.0), (100, 0.5)), ((0, 1.0),), ((100, 100.0),), ((100, -1.0),)])
+def test_invalid_tiers_are_rejected(tiers):
+    with pytest.raises(ValueError):
+        FeeSchedule.from_tiers(tiers)
+
+
+@pytest.mark.parametrize("rate", [0.0, 0.35, 1.5])
+def test_single_tier_matches_fee_trajectories(rate):
+    result = tiered_trajectories([25_000, 400_000], [500, 2_000], 7.0, FeeSchedule.flat(rate), 30)
+    for row, (starting, contribution) in enumerate(((25_000, 500), (400_000, 2_000))):
+        expected = fee_trajectories(starting, contribution, 7.0, [rate], 30)[0]
+        np.testing.assert_allclose(result.values[row], expected, rtol=1e-12)
+
+
+def test_annual_deduction_matches_yearly_loop():
+    result = tiered_trajectories(2_000_000, 5_000, 6.0, FeeSchedule.from_tiers(DEFAULT_TIERS), 20, ANNUAL)
+    balance, paid = 2_000_000.0, 0.0
+    for year in range(1, 21):
+        balance = (balance + 5_000 * 12) * 1.06
+        fee = marginal_fee(DEFAULT_TIERS, balance)
+        balance -= fee
+        paid += fee
+        assert result.values[0, year] == pytest.approx(balance, rel=1e-12)
+        assert result.fees_paid[0, year] == pytest.approx(paid, rel=1e-12)
+
+
+def test_monthly_deduction_matches_monthly_loop():
+    result = tiered_trajectories(900_000, 3_000, 8.0, FeeSchedule.from_tiers(DEFAULT_TIERS), 10, MONTHLY)
+    balance = 900_000.0
+    for _ in range(120):
+        balance = (balance + 3_000) * 1.08 ** (1 / 12)
+        balance -= marginal_fee(DEFAULT_TIERS, balance) / 12
+    assert result.final_values[0] == pytest.approx(balance, rel=1e-12)
+
+
+def test_unknown_deduction_is_rejected():
+    with pytest.raises(ValueError, match="deduction"):
+        tiered_trajectories(1_000, 0, 5, FeeSchedule.flat(1), 1, "weekly")
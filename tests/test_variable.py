@@ -0,0 +1,66 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from fincalc.variable import RateSchedule, VariableDebtInputs, project_variable_debt, variable_rate_payoff
+
+
+def reference_payoff(debt, schedule, payment=None, term=None, max_months=2_000):
+    """Month-by-month loop; with ``term`` the payment is recast at every rate change."""
+    balance, month, interest_total = debt, 0, 0.0
+    # Stop at half a cent, so float residue after the last payment is not another month
+    while balance > 0.005 and month < max_months:
+        month += 1
+        rate = float(schedule.rate_at(month)) / 1200
+        if term is not None and (month - 1) in schedule.starts:
+            remaining = term - (month - 1)
+            payment = balance if remaining <= 0 else (balance * rate / (1 - (1 + rate) ** -remaining) if rate else balance / remaining)
+        interest = balance * rate
+        interest_total += interest
+        balance += interest - min(payment, balance + interest)
+    return (month if month < max_months else math.inf), interest_total
+
+
+def random_cases(count, seed):
+    rng = random.Random(seed)
+    for _ in range(count):
+        changes = rng.randint(0, 3)
+        starts = (0,) + tuple(sorted(rng.sample(range(1, 120), changes)))
+        schedule = RateSchedule(starts, tuple(round(rng.uniform(0, 25), 2) for _ in starts))
+        debt = rng.uniform(1_000, 50_000)
+        if rng.random() < 0.5:
+            yield debt, schedule, debt * rng.uniform(0.02, 0.1), None
+        else:
+            yield debt, schedule, None, rng.randint(12, 360)
+
+
+@pytest.mark.parametrize("debt, schedule, payment, term", list(random_cases(200, seed=0)))
+def test_matches_the_monthly_loop(debt, schedule, payment, term):
+    result = variable_rate_payoff(debt, schedule, monthly_payment=payment, term_months=term)
+    months, interest = reference_payoff(debt, schedule, payment, term)
+    if math.isinf(months):
+        assert math.isinf(result.payoff_months[0])
+        return
+    assert math.ceil(result.payoff_months[0] - 1e-9) == months
+    # The closed form charges a fractional last month, the loop a whole one
+    assert result.total_interest[0] == pytest.approx(interest, rel=2e-3, abs=1)
+
+
+def test_term_ending_on_a_rate_change_pays_off_on_time():
+    # Float noise at the boundary used to carry a ~5e-12 balance into the next segment
+    rng = np.random.default_rng(0)
+    for _ in range(500):
+        schedule = RateSchedule((0, 11, 61, 110), tuple(np.round(rng.uniform(0, 12, 4), 3)))
+        debt = float(np.round(rng.uniform(100, 5e6), 2))
+        result = variable_rate_payoff(debt, schedule, term_months=61)
+        assert result.payoff_months[0] == pytest.approx(61)
+
+
+def test_balance_at_agrees_with_payoff():
+    schedule = RateSchedule.promotional(0, 12, 22.99)
+    result = project_variable_debt(VariableDebtInputs(8_000, schedule, 300, extra_payment=100))
+    assert result.months_extra < result.months_standard
+    assert result.balance_standard[-1] == 0 and result.balance_extra[-1] == 0
+    assert np.all(np.diff(result.balance_standard) <= 1e-9)